@@ -1,10 +1,9 @@
+from collections import Counter
 from typing import List
 
 def extract_automatic_tags(text: str) -> List[str]:
     # Implémentation simple d'extraction de tags
     common_words = ['le', 'la', 'les', 'un', 'une', 'des', 'et', 'ou', 'à', 'de', 'en']
-    words = [w.lower() for w in text.split() if len(w) > 3 and w.lower() not in common_words]
-    word_counts = {}
-    for word in words:
-        word_counts[word] = word_counts.get(word, 0) + 1
-    return [word for word, count in sorted(word_counts.items(), key=lambda x: x[1], reverse=True)[:5]]
\ No newline at end of file
+    # Comptage en C par Counter (une seule mise en minuscules par mot)
+    word_counts = Counter(word for word in map(str.lower, text.split()) if len(word) > 3 and word not in common_words)
+    return [word for word, count in word_counts.most_common(5)]
\ No newline at end of file
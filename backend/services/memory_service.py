@@ -3,39 +3,865 @@ Service pour la gestion centralisée de la mémoire et des données du mémoire.
 """
 
 import os
+import hashlib
+import json
+import queue
 import sqlite3
 import asyncio
 import logging
 import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
 from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType
 from typing import List, Dict, Any, Optional, Tuple
 
 from pydantic import BaseModel, validator
-from db.initializer import get_db_connection, journal_collection, sections_collection
+from db.database import get_journal_collection, get_sections_collection
 from utils.text_processing import AdaptiveTextSplitter
 from services.llm_service import get_llm_orchestrator
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# PRAGMAs appliqués à chaque connexion (ils ne sont pas persistés dans le fichier)
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA foreign_keys=ON",
+)
+
+# Index des recherches répétées par ce module. tags.nom (UNIQUE) et les clés
+# primaires de entry_tags et section_entries sont déjà indexés par SQLite.
+_SUPPORTING_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_entry_tags_tag ON entry_tags(tag_id)",
+    "CREATE INDEX IF NOT EXISTS idx_section_entries_entry ON section_entries(entry_id)",
+    "CREATE INDEX IF NOT EXISTS idx_sections_parent ON memoire_sections(parent_id, ordre)",
+    "CREATE INDEX IF NOT EXISTS idx_entreprises_dates ON entreprises(date_debut, date_fin)",
+)
+
+# Nombre maximal d'embeddings de requêtes conservés en mémoire
+EMBEDDING_CACHE_SIZE = 512
+
+# Dernier horodatage formaté (seconde Unix, texte), partagé par les écritures
+_timestamp_cache = (0, "")
+
+
+def _now_str() -> str:
+    """
+    Renvoie l'horodatage courant au format "AAAA-MM-JJ HH:MM:SS".
+    
+    Le texte n'est reformaté qu'une fois par seconde.
+    
+    Returns:
+        Horodatage formaté
+    """
+    global _timestamp_cache
+    second = int(time.time())
+    cached_second, formatted = _timestamp_cache
+    if second != cached_second:
+        formatted = datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+        _timestamp_cache = (second, formatted)
+    return formatted
+
+
+# Taille du cache de requêtes préparées de chaque connexion. Les requêtes IN (...)
+# produisent un texte différent par nombre de paramètres, d'où une marge au-delà
+# des 128 entrées par défaut.
+_STATEMENT_CACHE_SIZE = 512
+
+# Colonnes renvoyées par les lectures d'entrées et de sections. Les connexions en
+# lecture seule renvoient des tuples, convertis directement avec ces noms.
+_ENTRY_COLUMNS = ("id", "date", "content", "type_entree", "source_document", "entreprise_id", "entreprise_nom")
+_SECTION_COLUMNS = ("id", "titre", "content", "ordre", "parent_id", "derniere_modification")
+
+# Index plein texte des entrées du journal (FTS5, contenu externe) et déclencheurs
+# qui le maintiennent à jour quel que soit le code qui écrit dans journal_entries
+_JOURNAL_FTS_SCHEMA = (
+    "CREATE VIRTUAL TABLE journal_fts USING fts5(texte, content='journal_entries', content_rowid='id')",
+    """CREATE TRIGGER IF NOT EXISTS journal_fts_ai AFTER INSERT ON journal_entries BEGIN
+        INSERT INTO journal_fts(rowid, texte) VALUES (new.id, new.texte);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS journal_fts_ad AFTER DELETE ON journal_entries BEGIN
+        INSERT INTO journal_fts(journal_fts, rowid, texte) VALUES ('delete', old.id, old.texte);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS journal_fts_au AFTER UPDATE OF texte ON journal_entries BEGIN
+        INSERT INTO journal_fts(journal_fts, rowid, texte) VALUES ('delete', old.id, old.texte);
+        INSERT INTO journal_fts(rowid, texte) VALUES (new.id, new.texte);
+    END""",
+    "INSERT INTO journal_fts(journal_fts) VALUES ('rebuild')",
+)
+
+# Stockage des embeddings dans SQLite (mode inline_embeddings) : colonne sur les
+# entrées du journal et table des chunks de sections
+_SECTION_CHUNKS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS section_chunks (
+    section_id INTEGER NOT NULL,
+    chunk_index INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    embedding BLOB,
+    embedding_scale REAL,
+    PRIMARY KEY (section_id, chunk_index),
+    FOREIGN KEY (section_id) REFERENCES memoire_sections (id) ON DELETE CASCADE
+)
+"""
+_INLINE_VECTOR_QUERIES = {
+    "journal": "SELECT id, embedding, embedding_scale FROM journal_entries WHERE embedding IS NOT NULL",
+    "sections": "SELECT section_id, embedding, embedding_scale FROM section_chunks WHERE embedding IS NOT NULL",
+}
+
+
+def _quantize_embedding(embedding) -> Tuple[bytes, float]:
+    """
+    Quantifie un embedding en int8 avec un facteur d'échelle par vecteur.
+    
+    Le stockage est quatre fois plus petit qu'en float32 ; la similarité cosinus
+    n'est pas affectée par le facteur d'échelle, seulement par l'arrondi.
+    
+    Args:
+        embedding: Vecteur d'embedding
+        
+    Returns:
+        Tuple (octets int8, facteur d'échelle)
+    """
+    vector = np.asarray(embedding, dtype=np.float32)
+    peak = float(np.abs(vector).max()) if vector.size else 0.0
+    scale = peak / 127 if peak else 1.0
+    return np.round(vector / scale).astype(np.int8).tobytes(), scale
+
+
+def _dequantize_embedding(blob: bytes, scale: Optional[float]):
+    """
+    Reconstruit un embedding float32 stocké par _quantize_embedding.
+    
+    Args:
+        blob: Octets stockés
+        scale: Facteur d'échelle, ou None pour un vecteur float32 non quantifié
+        
+    Returns:
+        Vecteur NumPy float32
+    """
+    if scale is None:
+        return np.frombuffer(blob, dtype=np.float32)
+    return np.frombuffer(blob, dtype=np.int8).astype(np.float32) * scale
+
+# Mots d'un texte : termes d'une requête plein texte et extraction de mots-clés
+_WORD_RE = re.compile(r"\w+")
+
+# Mots vides ignorés par l'extraction de mots-clés
+STOPWORDS_FR = frozenset({
+    "le", "la", "les", "un", "une", "des", "et", "ou", "a", "à", "de", "du", "en",
+    "est", "ce", "que", "qui", "dans", "par", "pour", "sur", "avec", "sans",
+    "il", "elle", "ils", "elles", "nous", "vous", "je", "tu"
+})
+
+# Constante de la fusion par rang réciproque (valeur usuelle de la littérature)
+RRF_K = 60
+
+# Nombre maximal de chunks dont le type et les mots-clés sont conservés en mémoire
+CHUNK_METADATA_CACHE_SIZE = 2048
+
+# Taille de texte (caractères) en dessous de laquelle le découpage et l'analyse restent
+# dans le processus courant : l'envoi au pool coûterait plus que le calcul
+CPU_POOL_MIN_CHARS = 20000
+
+# Écritures vectorielles différées : taille maximale d'un lot, délai d'attente pour
+# compléter un lot (secondes) et nombre de tentatives avant abandon
+VECTOR_BATCH_SIZE = 64
+VECTOR_BATCH_DELAY = 0.05
+VECTOR_WRITE_RETRIES = 3
+
+# Le mode WAL est persistant : il suffit de l'activer une fois par fichier
+_wal_enabled_paths = set()
+_wal_lock = threading.Lock()
+
+# Découpeur utilisé par les fonctions exécutées dans le pool de processus
+_chunk_splitter = None
+
+
+def _get_chunk_splitter() -> AdaptiveTextSplitter:
+    """Renvoie le découpeur de texte du processus courant, créé au premier appel."""
+    global _chunk_splitter
+    if _chunk_splitter is None:
+        _chunk_splitter = AdaptiveTextSplitter()
+    return _chunk_splitter
+
+
+def _split_content(content: str) -> List[str]:
+    """
+    Découpe le contenu d'une section en chunks (exécuté dans le pool de processus).
+    
+    Args:
+        content: Contenu de la section
+        
+    Returns:
+        Liste des chunks
+    """
+    return _get_chunk_splitter().split_text(content)
+
+
+def _analyze_chunks(chunks: List[str]) -> List[Tuple[str, str]]:
+    """
+    Détermine le type de contenu et les mots-clés de chunks (exécuté dans le pool
+    de processus).
+    
+    Args:
+        chunks: Textes des chunks
+        
+    Returns:
+        Tuples (type de contenu, 10 premiers mots-clés séparés par des virgules)
+    """
+    splitter = _get_chunk_splitter()
+    return [
+        (splitter._determine_content_type(chunk), ",".join(MemoryManager._extract_keywords(chunk)[:10]))
+        for chunk in chunks
+    ]
+
+
+def _merge_vector_writes(batch: List[Tuple[Any, str, Dict[str, List[Any]]]]) -> List[Tuple[Any, str, Dict[str, List[Any]]]]:
+    """
+    Regroupe les écritures ChromaDB consécutives de même nature sur la même collection.
+    
+    ChromaDB refuse les identifiants répétés dans un même appel : au sein d'un
+    groupe, seule la dernière écriture de chaque identifiant est conservée.
+    L'ordre des groupes est celui de la file.
+    
+    Args:
+        batch: Tuples (collection, opération, arguments) dans l'ordre de la file
+        
+    Returns:
+        Tuples (collection, opération, arguments fusionnés)
+    """
+    groups = []
+    positions = {}
+    for collection, operation, payload in batch:
+        if not groups or groups[-1][0] is not collection or groups[-1][1] != operation:
+            groups.append((collection, operation, {key: [] for key in payload}))
+            positions = {}
+        merged = groups[-1][2]
+        for index, item_id in enumerate(payload["ids"]):
+            position = positions.get(item_id)
+            if position is None:
+                positions[item_id] = len(merged["ids"])
+                for key, values in payload.items():
+                    merged.setdefault(key, []).append(values[index])
+            else:
+                for key, values in payload.items():
+                    merged[key][position] = values[index]
+    return groups
+
+
+# Mots-clés associés à chaque compétence RNCP
+COMPETENCE_KEYWORDS = MappingProxyType({
+    "analyse_besoins": (
+        "analyse", "besoin", "exigence", "requirement", "interview", "utilisateur",
+        "client", "stakeholder", "partie prenante", "évaluation", "diagnostic"
+    ),
+    "conception_systemes": (
+        "conception", "architecture", "design", "modélisation", "UML", "diagramme",
+        "système", "database", "base de données", "API", "microservice", "solution"
+    ),
+    "gestion_projets": (
+        "projet", "planning", "délai", "deadline", "budget", "ressource", "équipe",
+        "coordination", "gestion", "management", "agile", "scrum", "sprint", "kanban"
+    ),
+    "maintenance_evolution": (
+        "maintenance", "évolution", "mise à jour", "update", "correction", "bug",
+        "optimisation", "performance", "refactoring", "legacy", "dette technique"
+    ),
+    "assistance_formation": (
+        "formation", "assistance", "support", "aide", "utilisateur", "documentation",
+        "tutoriel", "guide", "présentation", "démonstration", "atelier", "workshop"
+    )
+})
+COMPETENCE_KEYS = tuple(COMPETENCE_KEYWORDS)
+
+# Le contenu analysé est en minuscules : les mots-clés écrits avec des majuscules
+# (sigles "UML", "API") n'y sont jamais trouvés. Les chercher en minuscules, par
+# sous-chaîne, compterait "api" dans "rapide" ou "uml" dans "cumul".
+
+# Automate Aho-Corasick des mots-clés en minuscules : chaque mot est associé à
+# ses (compétence, rang dans la liste)
+_COMPETENCE_AUTOMATON = None
+if AHOCORASICK_AVAILABLE:
+    _keyword_ranks = {}
+    for _competence, _keywords in COMPETENCE_KEYWORDS.items():
+        for _rank, _keyword in enumerate(_keywords):
+            if _keyword == _keyword.lower():
+                _keyword_ranks.setdefault(_keyword, []).append((_competence, _rank))
+    _COMPETENCE_AUTOMATON = ahocorasick.Automaton()
+    for _keyword, _ranks in _keyword_ranks.items():
+        _COMPETENCE_AUTOMATON.add_word(_keyword, tuple(_ranks))
+    _COMPETENCE_AUTOMATON.make_automaton()
+
+# Sans pyahocorasick : une alternative regex par compétence, essayée à chaque
+# position (lookahead) du mot-clé le plus long au plus court. Un mot-clé trouvé
+# implique la présence des mots-clés qui en sont des préfixes.
+_COMPETENCE_PATTERNS = {}
+if not AHOCORASICK_AVAILABLE:
+    for _competence, _keywords in COMPETENCE_KEYWORDS.items():
+        _alternatives = sorted(
+            {_keyword for _keyword in _keywords if _keyword == _keyword.lower()},
+            key=len, reverse=True
+        )
+        if not _alternatives:
+            continue
+        _prefixes = {
+            _keyword: [_other for _other in _alternatives
+                       if _other != _keyword and _keyword.startswith(_other)]
+            for _keyword in _alternatives
+        }
+        _pattern = re.compile("(?=(" + "|".join(map(re.escape, _alternatives)) + "))")
+        _COMPETENCE_PATTERNS[_competence] = (_pattern, _prefixes)
+
+
+def _match_competences(content: str) -> Dict[str, List[str]]:
+    """
+    Recherche les mots-clés de compétences présents dans un texte.
+
+    Args:
+        content: Texte en minuscules
+
+    Returns:
+        Mots-clés trouvés par compétence, dans l'ordre de COMPETENCE_KEYWORDS
+    """
+    if _COMPETENCE_AUTOMATON is None:
+        matches = {}
+        for competence, (pattern, prefixes) in _COMPETENCE_PATTERNS.items():
+            found = set(pattern.findall(content))
+            if not found:
+                continue
+            for keyword in list(found):
+                found.update(prefixes[keyword])
+            matches[competence] = [
+                keyword for keyword in COMPETENCE_KEYWORDS[competence] if keyword in found
+            ]
+        return matches
+
+    # Un seul parcours du texte pour tous les mots-clés
+    ranks_by_competence = {}
+    for _, ranks in _COMPETENCE_AUTOMATON.iter(content):
+        for competence, rank in ranks:
+            ranks_by_competence.setdefault(competence, set()).add(rank)
+
+    return {
+        competence: [keywords[rank] for rank in sorted(ranks_by_competence[competence])]
+        for competence, keywords in COMPETENCE_KEYWORDS.items()
+        if competence in ranks_by_competence
+    }
+
+
 class MemoryManager:
     """
     Gestionnaire centralisé pour toutes les opérations liées au mémoire
     et aux entrées de journal.
     """
-    def __init__(self, db_path: str = "data/memoire.db"):
+    def __init__(self, db_path: str = "data/memoire.db", read_pool_size: int = 4,
+                 inline_embeddings: bool = False):
         self.db_path = db_path
+        # Embeddings stockés dans SQLite et recherche NumPy à la place de ChromaDB,
+        # adapté aux petits volumes d'un mémoire personnel
+        if inline_embeddings and not NUMPY_AVAILABLE:
+            logger.warning("NumPy non installé : les embeddings restent dans ChromaDB")
+        self.inline_embeddings = inline_embeddings and NUMPY_AVAILABLE
+        # Matrices d'embeddings normalisés chargées depuis SQLite, par type, et
+        # compteur d'écritures qui empêche de mettre en cache une matrice périmée
+        self._vector_matrices = {}
+        self._vector_generations = {}
+        # Connexions réutilisées entre les appels : une seule en écriture (SQLite
+        # n'accepte qu'un écrivain à la fois) et plusieurs en lecture seule
+        self._write_pool = queue.Queue(maxsize=1)
+        self._read_pool = queue.Queue(maxsize=read_pool_size)
+        # Exécuteur dédié dimensionné sur le pool : les appels restent sur des
+        # threads déjà chauds et trouvent toujours une connexion libre
+        self._executor = ThreadPoolExecutor(
+            max_workers=read_pool_size + 1, thread_name_prefix="memoire-db"
+        )
         self.text_splitter = AdaptiveTextSplitter()
-        self.journal_collection = journal_collection
-        self.sections_collection = sections_collection
+        self.journal_collection = get_journal_collection()
+        self.sections_collection = get_sections_collection()
         self.llm_orchestrator = get_llm_orchestrator()
+        # Embeddings des requêtes de recherche récentes (LRU) et calculs en cours
+        self._embedding_cache = OrderedDict()
+        self._pending_embeddings = {}
+        self._journal_fts_available = False
+        # Pool de processus pour le découpage et l'analyse des longues sections
+        # (hors GIL), créé à la première indexation qui en a besoin
+        self._cpu_pool = None
+        # Type et mots-clés des chunks déjà analysés (LRU), clé = empreinte du texte
+        self._chunk_metadata_cache = OrderedDict()
+        # File des écritures ChromaDB, consommée par une tâche unique
+        self._vector_queue = None
+        self._vector_task = None
+        self._ensure_schema()
         logger.info("MemoryManager initialisé")
 
-    def get_connection(self):
-        """Obtient une connexion à la base de données SQLite."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+    def _ensure_schema(self):
+        """
+        Ajoute les éléments de schéma propres à ce module s'ils n'existent pas :
+        la colonne memoire_sections.chunk_count, les index des recherches et
+        l'index plein texte du journal.
+        """
+        try:
+            conn = self._acquire()
+        except sqlite3.Error as e:
+            logger.warning("Impossible d'ouvrir la base pour créer les index: %s", e)
+            return
+
+        try:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(memoire_sections)")}
+            if columns and "chunk_count" not in columns:
+                conn.execute("ALTER TABLE memoire_sections ADD COLUMN chunk_count INTEGER")
+            for statement in _SUPPORTING_INDEXES:
+                conn.execute(statement)
+            if self.inline_embeddings:
+                entry_columns = {row[1] for row in conn.execute("PRAGMA table_info(journal_entries)")}
+                if "embedding" not in entry_columns:
+                    conn.execute("ALTER TABLE journal_entries ADD COLUMN embedding BLOB")
+                if "embedding_scale" not in entry_columns:
+                    conn.execute("ALTER TABLE journal_entries ADD COLUMN embedding_scale REAL")
+                conn.execute(_SECTION_CHUNKS_SCHEMA)
+                chunk_columns = {row[1] for row in conn.execute("PRAGMA table_info(section_chunks)")}
+                if "embedding_scale" not in chunk_columns:
+                    conn.execute("ALTER TABLE section_chunks ADD COLUMN embedding_scale REAL")
+        except sqlite3.Error as e:
+            # Schéma pas encore créé : les requêtes restent correctes, seulement plus lentes
+            logger.warning("Impossible de créer les index de la base: %s", e)
+            self._release(conn)
+            return
+
+        try:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'journal_fts'"
+            ).fetchone()
+            if not exists:
+                conn.execute("BEGIN IMMEDIATE")
+                for statement in _JOURNAL_FTS_SCHEMA:
+                    conn.execute(statement)
+                conn.commit()
+            self._journal_fts_available = True
+        except sqlite3.Error as e:
+            # FTS5 absent de cette version de SQLite : la recherche reste vectorielle
+            logger.warning("Index plein texte du journal indisponible: %s", e)
+        finally:
+            self._release(conn)
+
+    def get_connection(self, readonly: bool = False):
+        """
+        Obtient une nouvelle connexion à la base de données SQLite.
+
+        Le mode WAL supprime la synchronisation disque complète à chaque commit
+        et permet aux lectures de se poursuivre pendant les écritures.
+
+        Args:
+            readonly: Ouvre la base en lecture seule
+
+        Returns:
+            Connexion SQLite configurée
+        """
+        # Les transactions sont ouvertes explicitement (BEGIN IMMEDIATE) par les
+        # méthodes qui écrivent, pour que chaque opération ne fasse qu'un commit
+        if readonly:
+            uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+            conn = sqlite3.connect(
+                uri, uri=True, check_same_thread=False, isolation_level=None,
+                cached_statements=_STATEMENT_CACHE_SIZE
+            )
+        else:
+            conn = sqlite3.connect(
+                self.db_path, check_same_thread=False, isolation_level=None,
+                cached_statements=_STATEMENT_CACHE_SIZE
+            )
+            # Les lectures en lecture seule utilisent les tuples, plus rapides que sqlite3.Row
+            conn.row_factory = sqlite3.Row
+
+        if not readonly and self.db_path not in _wal_enabled_paths:
+            with _wal_lock:
+                if self.db_path not in _wal_enabled_paths:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    _wal_enabled_paths.add(self.db_path)
+
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
         return conn
 
+    async def _get_query_embedding(self, query: str):
+        """
+        Calcule l'embedding d'une requête de recherche, avec un cache LRU.
+        
+        Les requêtes identiques lancées en parallèle partagent le même calcul.
+        
+        Args:
+            query: Texte de recherche
+            
+        Returns:
+            Embedding de la requête
+        """
+        key = hashlib.sha1(query.encode("utf-8")).digest()
+        
+        if key in self._embedding_cache:
+            self._embedding_cache.move_to_end(key)
+            return self._embedding_cache[key]
+        
+        pending = self._pending_embeddings.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self.llm_orchestrator.get_embeddings(query))
+            self._pending_embeddings[key] = pending
+            try:
+                embedding = await asyncio.shield(pending)
+            finally:
+                del self._pending_embeddings[key]
+            
+            self._embedding_cache[key] = embedding
+            if len(self._embedding_cache) > EMBEDDING_CACHE_SIZE:
+                self._embedding_cache.popitem(last=False)
+            return embedding
+        
+        return await asyncio.shield(pending)
+
+    def _enqueue_vector_write(self, collection, operation: str, **payload):
+        """
+        Place une écriture ChromaDB dans la file traitée en arrière-plan.
+        
+        Args:
+            collection: Collection ChromaDB visée
+            operation: "add", "update" ou "delete"
+            **payload: Arguments de l'opération (ids, documents, metadatas)
+        """
+        if self._vector_task is None or self._vector_task.done():
+            self._vector_queue = asyncio.Queue()
+            self._vector_task = asyncio.ensure_future(self._vector_worker(self._vector_queue))
+        self._vector_queue.put_nowait((collection, operation, payload))
+
+    async def flush_vector_writes(self):
+        """Attend que toutes les écritures ChromaDB en file soient traitées."""
+        if self._vector_task is not None and not self._vector_task.done():
+            await self._vector_queue.join()
+
+    async def close(self):
+        """
+        Termine les écritures ChromaDB en file puis arrête la tâche qui les traite,
+        le pool de processus de calcul et l'exécuteur de la base, et ferme les
+        connexions SQLite conservées.
+        
+        À appeler à l'arrêt de l'application pour ne perdre aucune écriture.
+        Le gestionnaire n'est plus utilisable ensuite.
+        """
+        await self.flush_vector_writes()
+        if self._vector_task is not None:
+            self._vector_task.cancel()
+            try:
+                await self._vector_task
+            except asyncio.CancelledError:
+                pass
+            self._vector_task = None
+            self._vector_queue = None
+        self._shutdown_cpu_pool()
+        
+        # Attendre les accès à la base en cours : ils rendent leur connexion au pool
+        await asyncio.to_thread(self._executor.shutdown, wait=True)
+        for pool in (self._write_pool, self._read_pool):
+            while True:
+                try:
+                    conn = pool.get_nowait()
+                except queue.Empty:
+                    break
+                conn.close()
+
+    async def _vector_worker(self, vector_queue: asyncio.Queue):
+        """
+        Consomme la file des écritures ChromaDB par lots.
+        
+        Les opérations consécutives de même nature sur la même collection sont
+        regroupées en un seul appel ; l'ordre des opérations est conservé.
+        
+        Args:
+            vector_queue: File à consommer
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await vector_queue.get()]
+            deadline = loop.time() + VECTOR_BATCH_DELAY
+            while len(batch) < VECTOR_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(vector_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            for collection, operation, payload in _merge_vector_writes(batch):
+                await self._apply_vector_write(collection, operation, payload)
+            
+            for _ in batch:
+                vector_queue.task_done()
+
+    async def _apply_vector_write(self, collection, operation: str, payload: Dict[str, Any]):
+        """
+        Exécute une écriture ChromaDB groupée, avec quelques nouvelles tentatives.
+        
+        Args:
+            collection: Collection ChromaDB visée
+            operation: "add", "update" ou "delete"
+            payload: Arguments de l'opération
+        """
+        for attempt in range(1, VECTOR_WRITE_RETRIES + 1):
+            try:
+                await asyncio.to_thread(getattr(collection, operation), **payload)
+                return
+            except Exception as e:
+                if attempt == VECTOR_WRITE_RETRIES:
+                    logger.error(
+                        "Échec de l'opération ChromaDB '%s' sur %s: %s",
+                        operation, payload.get("ids"), e
+                    )
+                else:
+                    await asyncio.sleep(0.1 * attempt)
+
+    def _execute_write(self, sql: str, params=()):
+        """
+        Exécute une requête d'écriture isolée sur la connexion en écriture.
+        
+        Args:
+            sql: Requête SQL
+            params: Paramètres de la requête
+        """
+        conn = self._acquire()
+        try:
+            conn.execute(sql, params)
+        finally:
+            self._release(conn)
+
+    def _invalidate_vectors(self, kind: str):
+        """
+        Invalide la matrice d'embeddings en cache après une écriture.
+        
+        Args:
+            kind: "journal" ou "sections"
+        """
+        self._vector_generations[kind] = self._vector_generations.get(kind, 0) + 1
+        self._vector_matrices.pop(kind, None)
+
+    def _load_vector_matrix(self, kind: str):
+        """
+        Charge depuis SQLite les embeddings d'un type, normalisés, avec mise en cache.
+        
+        Les vecteurs int8 sont reconvertis en float32 au chargement : NumPy
+        n'accélère par BLAS que les produits matriciels flottants.
+        
+        Args:
+            kind: "journal" ou "sections"
+            
+        Returns:
+            Tuple (clés de chaque ligne, matrice NumPy des embeddings normalisés)
+        """
+        cached = self._vector_matrices.get(kind)
+        if cached is not None:
+            return cached
+        
+        generation = self._vector_generations.get(kind, 0)
+        conn = self._acquire(readonly=True)
+        try:
+            rows = conn.execute(_INLINE_VECTOR_QUERIES[kind]).fetchall()
+        finally:
+            self._release(conn, readonly=True)
+        
+        keys = []
+        vectors = []
+        for key, blob, scale in rows:
+            vector = _dequantize_embedding(blob, scale)
+            # Ignorer les vecteurs d'un autre modèle (dimension différente)
+            if vectors and vector.shape != vectors[0].shape:
+                continue
+            keys.append(key)
+            vectors.append(vector)
+        
+        matrix = np.vstack(vectors) if vectors else np.empty((0, 0), dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        
+        cached = (keys, matrix / norms)
+        if self._vector_generations.get(kind, 0) == generation:
+            self._vector_matrices[kind] = cached
+        return cached
+
+    async def _search_inline_vectors(self, kind: str, query: str, limit: int) -> List[Tuple[int, float]]:
+        """
+        Recherche par similarité cosinus dans les embeddings stockés dans SQLite.
+        
+        Args:
+            kind: "journal" ou "sections"
+            query: Texte de recherche
+            limit: Nombre maximum de résultats
+            
+        Returns:
+            Liste de tuples (clé, distance cosinus), du plus au moins proche
+        """
+        embedding = await self._get_query_embedding(query)
+        keys, matrix = await self._run(lambda: self._load_vector_matrix(kind))
+        
+        query_vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(query_vector)
+        if not keys or matrix.shape[1] != query_vector.shape[0] or norm == 0:
+            return []
+        
+        similarities = matrix @ (query_vector / norm)
+        k = min(limit, len(keys))
+        top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.argsort(-similarities[top])]
+        return [(keys[i], 1.0 - float(similarities[i])) for i in top]
+
+    async def _store_entry_embedding(self, entry_id: int, text: str):
+        """
+        Calcule et enregistre dans SQLite l'embedding d'une entrée du journal.
+        
+        Args:
+            entry_id: ID de l'entrée
+            text: Texte de l'entrée
+        """
+        try:
+            embedding = await self.llm_orchestrator.get_embeddings(text)
+            blob, scale = _quantize_embedding(embedding)
+            await self._run(lambda: self._execute_write(
+                "UPDATE journal_entries SET embedding = ?, embedding_scale = ? WHERE id = ?",
+                (blob, scale, entry_id)
+            ))
+        except Exception as e:
+            logger.error("Impossible d'enregistrer l'embedding de l'entrée %s: %s", entry_id, e)
+        finally:
+            self._invalidate_vectors("journal")
+
+    async def _run_cpu(self, func, *args, size: int = 0):
+        """
+        Exécute une fonction coûteuse en calcul dans le pool de processus.
+        
+        Les petits textes sont traités dans un thread du processus courant. Si le
+        pool ne peut pas être utilisé, il est arrêté et la fonction est exécutée
+        dans un thread.
+        
+        Args:
+            func: Fonction de niveau module (sérialisable)
+            *args: Arguments de la fonction
+            size: Taille du texte à traiter, en caractères
+            
+        Returns:
+            Résultat de la fonction
+        """
+        if size < CPU_POOL_MIN_CHARS:
+            return await asyncio.to_thread(func, *args)
+        
+        loop = asyncio.get_running_loop()
+        try:
+            if self._cpu_pool is None:
+                # "spawn" : un fork hériterait des verrous des threads déjà lancés
+                # (exécuteur de la base, boucle d'événements)
+                self._cpu_pool = ProcessPoolExecutor(
+                    max_workers=max(1, (os.cpu_count() or 2) // 2),
+                    mp_context=get_context("spawn")
+                )
+            return await loop.run_in_executor(self._cpu_pool, func, *args)
+        except (BrokenProcessPool, OSError) as e:
+            logger.warning("Pool de processus indisponible, exécution dans un thread: %s", e)
+            self._shutdown_cpu_pool()
+            return await asyncio.to_thread(func, *args)
+
+    def _shutdown_cpu_pool(self):
+        """Arrête le pool de processus de calcul s'il a été créé."""
+        if self._cpu_pool is not None:
+            self._cpu_pool.shutdown(wait=False)
+            self._cpu_pool = None
+
+    async def _run(self, func):
+        """
+        Exécute une fonction d'accès à la base sur l'exécuteur dédié.
+
+        Args:
+            func: Fonction synchrone sans argument
+
+        Returns:
+            Résultat de la fonction
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func)
+
+    def _acquire(self, readonly: bool = False):
+        """
+        Emprunte une connexion au pool, ou en ouvre une si le pool est vide.
+
+        Réutiliser les connexions évite de rouvrir le fichier et de rejouer les
+        PRAGMAs à chaque appel, et conserve le cache de pages SQLite.
+
+        Args:
+            readonly: Emprunte une connexion en lecture seule
+
+        Returns:
+            Connexion SQLite à rendre avec _release
+        """
+        pool = self._read_pool if readonly else self._write_pool
+        try:
+            return pool.get_nowait()
+        except queue.Empty:
+            return self.get_connection(readonly=readonly)
+
+    def _release(self, conn, readonly: bool = False):
+        """
+        Rend une connexion au pool, ou la ferme si le pool est déjà plein.
+
+        Args:
+            conn: Connexion obtenue avec _acquire
+            readonly: Doit correspondre à la valeur passée à _acquire
+        """
+        if conn.in_transaction:
+            conn.rollback()
+        pool = self._read_pool if readonly else self._write_pool
+        try:
+            pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    @staticmethod
+    def _link_tags(cursor, entry_id: int, tags: List[str]):
+        """
+        Associe des tags à une entrée en créant ceux qui n'existent pas encore.
+
+        Un nombre fixe de requêtes est exécuté quel que soit le nombre de tags
+        (la contrainte UNIQUE sur tags.nom permet l'INSERT OR IGNORE). Les
+        associations déjà présentes sont ignorées.
+
+        Args:
+            cursor: Curseur de la transaction en cours
+            entry_id: ID de l'entrée
+            tags: Noms des tags à associer
+        """
+        unique_tags = list(dict.fromkeys(tags))
+        cursor.executemany("INSERT OR IGNORE INTO tags (nom) VALUES (?)", [(tag,) for tag in unique_tags])
+
+        placeholders = ",".join("?" * len(unique_tags))
+        cursor.execute(f"SELECT id FROM tags WHERE nom IN ({placeholders})", unique_tags)
+        cursor.executemany(
+            "INSERT OR IGNORE INTO entry_tags (entry_id, tag_id) VALUES (?, ?)",
+            [(entry_id, row[0]) for row in cursor.fetchall()]
+        )
+
     # --- MÉTHODES POUR LES ENTRÉES DU JOURNAL ---
 
     async def add_journal_entry(self, entry) -> dict:
@@ -49,9 +875,10 @@ class MemoryManager:
             Dict contenant l'entrée ajoutée
         """
         def _add_entry():
-            conn = self.get_connection()
+            conn = self._acquire()
             try:
                 cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
                 
                 # Déterminer l'entreprise si non spécifiée
                 entreprise_id = entry.entreprise_id
@@ -71,7 +898,7 @@ class MemoryManager:
                     tags = extract_automatic_tags(entry.texte)
                 
                 # Insérer l'entrée
-                now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                now = _now_str()
                 cursor.execute('''
                 INSERT INTO journal_entries (date, texte, entreprise_id, type_entree, source_document, created_at)
                 VALUES (?, ?, ?, ?, ?, ?)
@@ -81,57 +908,42 @@ class MemoryManager:
                 
                 # Ajouter les tags
                 if tags:
-                    for tag in tags:
-                        cursor.execute("SELECT id FROM tags WHERE nom = ?", (tag,))
-                        result = cursor.fetchone()
-                        if result:
-                            tag_id = result[0]
-                        else:
-                            cursor.execute("INSERT INTO tags (nom) VALUES (?)", (tag,))
-                            tag_id = cursor.lastrowid
-                        cursor.execute("INSERT INTO entry_tags (entry_id, tag_id) VALUES (?, ?)", (entry_id, tag_id))
-                
-                # Ajouter à la collection vectorielle pour la recherche
-                try:
-                    self.journal_collection.add(
-                        documents=[entry.texte],
-                        metadatas=[{"date": entry.date, "entry_id": entry_id}],
-                        ids=[f"entry_{entry_id}"]
-                    )
-                except Exception as e:
-                    logger.error(f"Erreur lors de l'ajout à ChromaDB: {str(e)}")
-                    raise
+                    self._link_tags(cursor, entry_id, tags)
                 
                 conn.commit()
                 
-                # Récupérer l'entrée complète
-                cursor.execute('''
-                SELECT j.id, j.date, j.texte as content, j.type_entree, j.source_document, j.entreprise_id
-                FROM journal_entries j
-                WHERE j.id = ?
-                ''', (entry_id,))
-                
-                inserted_entry = dict(cursor.fetchone())
-                
-                # Récupérer les tags
-                cursor.execute('''
-                SELECT t.nom FROM tags t
-                JOIN entry_tags et ON t.id = et.tag_id
-                WHERE et.entry_id = ?
-                ''', (entry_id,))
-                
-                inserted_entry['tags'] = [row[0] for row in cursor.fetchall()]
-                
-                return inserted_entry
+                # Construire l'entrée à partir des valeurs insérées, sans relire la base
+                return {
+                    "id": entry_id,
+                    "date": entry.date,
+                    "content": entry.texte,
+                    "type_entree": entry.type_entree,
+                    "source_document": entry.source_document,
+                    "entreprise_id": entreprise_id,
+                    "tags": list(dict.fromkeys(tags or []))
+                }
                 
             except Exception as e:
                 conn.rollback()
                 logger.error(f"Erreur lors de l'ajout d'une entrée de journal: {str(e)}")
                 raise
             finally:
-                conn.close()
+                self._release(conn)
                 
-        return await asyncio.to_thread(_add_entry)
+        inserted_entry = await self._run(_add_entry)
+        
+        entry_id = inserted_entry["id"]
+        if self.inline_embeddings:
+            await self._store_entry_embedding(entry_id, entry.texte)
+        else:
+            # Ajouter à la collection vectorielle pour la recherche, hors du chemin de la requête
+            self._enqueue_vector_write(
+                self.journal_collection, "add",
+                ids=[f"entry_{entry_id}"],
+                documents=[entry.texte],
+                metadatas=[{"date": entry.date, "entry_id": entry_id}]
+            )
+        return inserted_entry
 
     async def update_journal_entry(self, entry_id: int, entry) -> dict:
         """
@@ -145,9 +957,10 @@ class MemoryManager:
             Dict contenant l'entrée mise à jour
         """
         def _update_entry():
-            conn = self.get_connection()
+            conn = self._acquire()
             try:
                 cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
                 
                 # Vérifier que l'entrée existe
                 cursor.execute("SELECT id FROM journal_entries WHERE id = ?", (entry_id,))
@@ -161,60 +974,51 @@ class MemoryManager:
                 WHERE id = ?
                 ''', (entry.date, entry.texte, entry.entreprise_id, entry.type_entree, entry.source_document, entry_id))
                 
-                # Mettre à jour les tags
-                cursor.execute("DELETE FROM entry_tags WHERE entry_id = ?", (entry_id,))
+                # Mettre à jour les tags : seules les associations retirées sont
+                # supprimées, celles qui existent déjà sont conservées
                 if entry.tags:
-                    for tag in entry.tags:
-                        cursor.execute("SELECT id FROM tags WHERE nom = ?", (tag,))
-                        result = cursor.fetchone()
-                        if result:
-                            tag_id = result[0]
-                        else:
-                            cursor.execute("INSERT INTO tags (nom) VALUES (?)", (tag,))
-                            tag_id = cursor.lastrowid
-                        cursor.execute("INSERT INTO entry_tags (entry_id, tag_id) VALUES (?, ?)", (entry_id, tag_id))
-                
-                # Mettre à jour dans la collection vectorielle
-                try:
-                    self.journal_collection.update(
-                        documents=[entry.texte],
-                        metadatas=[{"date": entry.date, "entry_id": entry_id}],
-                        ids=[f"entry_{entry_id}"]
-                    )
-                except Exception as e:
-                    logger.error(f"Erreur lors de la mise à jour dans ChromaDB: {str(e)}")
-                    raise
+                    placeholders = ",".join("?" * len(entry.tags))
+                    cursor.execute(f'''
+                    DELETE FROM entry_tags
+                    WHERE entry_id = ? AND tag_id NOT IN (SELECT id FROM tags WHERE nom IN ({placeholders}))
+                    ''', (entry_id, *entry.tags))
+                    self._link_tags(cursor, entry_id, entry.tags)
+                else:
+                    cursor.execute("DELETE FROM entry_tags WHERE entry_id = ?", (entry_id,))
                 
                 conn.commit()
                 
-                # Récupérer l'entrée mise à jour
-                cursor.execute('''
-                SELECT j.id, j.date, j.texte as content, j.type_entree, j.source_document, j.entreprise_id
-                FROM journal_entries j
-                WHERE j.id = ?
-                ''', (entry_id,))
-                
-                updated_entry = dict(cursor.fetchone())
-                
-                # Récupérer les tags
-                cursor.execute('''
-                SELECT t.nom FROM tags t
-                JOIN entry_tags et ON t.id = et.tag_id
-                WHERE et.entry_id = ?
-                ''', (entry_id,))
-                
-                updated_entry['tags'] = [row[0] for row in cursor.fetchall()]
-                
-                return updated_entry
+                # Construire l'entrée à partir des valeurs écrites, sans relire la base
+                return {
+                    "id": entry_id,
+                    "date": entry.date,
+                    "content": entry.texte,
+                    "type_entree": entry.type_entree,
+                    "source_document": entry.source_document,
+                    "entreprise_id": entry.entreprise_id,
+                    "tags": list(dict.fromkeys(entry.tags or []))
+                }
                 
             except Exception as e:
                 conn.rollback()
                 logger.error(f"Erreur lors de la mise à jour d'une entrée de journal: {str(e)}")
                 raise
             finally:
-                conn.close()
+                self._release(conn)
                 
-        return await asyncio.to_thread(_update_entry)
+        updated_entry = await self._run(_update_entry)
+        
+        if self.inline_embeddings:
+            await self._store_entry_embedding(entry_id, entry.texte)
+        else:
+            # Mettre à jour dans la collection vectorielle, hors du chemin de la requête
+            self._enqueue_vector_write(
+                self.journal_collection, "update",
+                ids=[f"entry_{entry_id}"],
+                documents=[entry.texte],
+                metadatas=[{"date": entry.date, "entry_id": entry_id}]
+            )
+        return updated_entry
 
     async def delete_journal_entry(self, entry_id: int) -> bool:
         """
@@ -227,9 +1031,10 @@ class MemoryManager:
             True si l'opération a réussi
         """
         def _delete_entry():
-            conn = self.get_connection()
+            conn = self._acquire()
             try:
                 cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
                 
                 # Vérifier que l'entrée existe
                 cursor.execute("SELECT id FROM journal_entries WHERE id = ?", (entry_id,))
@@ -239,13 +1044,6 @@ class MemoryManager:
                 # Supprimer l'entrée
                 cursor.execute("DELETE FROM journal_entries WHERE id = ?", (entry_id,))
                 
-                # Supprimer de la collection vectorielle
-                try:
-                    self.journal_collection.delete(ids=[f"entry_{entry_id}"])
-                except Exception as e:
-                    logger.error(f"Erreur lors de la suppression dans ChromaDB: {str(e)}")
-                    raise
-                
                 conn.commit()
                 return True
                 
@@ -254,9 +1052,16 @@ class MemoryManager:
                 logger.error(f"Erreur lors de la suppression d'une entrée de journal: {str(e)}")
                 raise
             finally:
-                conn.close()
+                self._release(conn)
                 
-        return await asyncio.to_thread(_delete_entry)
+        result = await self._run(_delete_entry)
+        
+        if self.inline_embeddings:
+            self._invalidate_vectors("journal")
+        else:
+            # Supprimer de la collection vectorielle, hors du chemin de la requête
+            self._enqueue_vector_write(self.journal_collection, "delete", ids=[f"entry_{entry_id}"])
+        return result
 
     async def get_journal_entry(self, entry_id: int) -> Dict[str, Any]:
         """
@@ -269,7 +1074,7 @@ class MemoryManager:
             Dict contenant l'entrée
         """
         def _get_entry():
-            conn = self.get_connection()
+            conn = self._acquire(readonly=True)
             try:
                 cursor = conn.cursor()
                 
@@ -285,7 +1090,7 @@ class MemoryManager:
                 if not entry:
                     raise ValueError(f"Entrée journal non trouvée: ID {entry_id}")
                 
-                result = dict(entry)
+                result = dict(zip(_ENTRY_COLUMNS, entry))
                 
                 # Récupérer les tags
                 cursor.execute('''
@@ -302,51 +1107,171 @@ class MemoryManager:
                 logger.error(f"Erreur lors de la récupération d'une entrée de journal: {str(e)}")
                 raise
             finally:
-                conn.close()
+                self._release(conn, readonly=True)
                 
-        return await asyncio.to_thread(_get_entry)
+        return await self._run(_get_entry)
 
-    async def search_relevant_journal(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+    async def get_journal_entries_bulk(self, entry_ids: List[int]) -> List[Dict[str, Any]]:
+        """
+        Récupère plusieurs entrées du journal avec deux requêtes au total.
+        
+        Args:
+            entry_ids: IDs des entrées
+            
+        Returns:
+            Liste des entrées trouvées, dans l'ordre des IDs demandés
+        """
+        if not entry_ids:
+            return []
+        
+        def _get_entries():
+            conn = self._acquire(readonly=True)
+            try:
+                cursor = conn.cursor()
+                placeholders = ",".join("?" * len(entry_ids))
+                
+                cursor.execute(f'''
+                SELECT j.id, j.date, j.texte as content, j.type_entree, j.source_document, 
+                       j.entreprise_id, e.nom as entreprise_nom
+                FROM journal_entries j
+                LEFT JOIN entreprises e ON j.entreprise_id = e.id
+                WHERE j.id IN ({placeholders})
+                ''', entry_ids)
+                
+                entries_by_id = {}
+                for row in cursor.fetchall():
+                    entry = dict(zip(_ENTRY_COLUMNS, row))
+                    entry['tags'] = []
+                    entries_by_id[entry['id']] = entry
+                
+                # Récupérer les tags de toutes les entrées
+                cursor.execute(f'''
+                SELECT et.entry_id, t.nom FROM tags t
+                JOIN entry_tags et ON t.id = et.tag_id
+                WHERE et.entry_id IN ({placeholders})
+                ''', entry_ids)
+                
+                for entry_id, tag in cursor.fetchall():
+                    entries_by_id[entry_id]['tags'].append(tag)
+                
+                return [entries_by_id[entry_id] for entry_id in dict.fromkeys(entry_ids) if entry_id in entries_by_id]
+                
+            except Exception as e:
+                logger.error(f"Erreur lors de la récupération des entrées de journal: {str(e)}")
+                raise
+            finally:
+                self._release(conn, readonly=True)
+                
+        return await self._run(_get_entries)
+
+    def _search_journal_fts(self, query: str, limit: int) -> List[int]:
+        """
+        Recherche des entrées du journal par mots-clés dans l'index plein texte.
+        
+        Args:
+            query: Texte de recherche
+            limit: Nombre maximum de résultats
+            
+        Returns:
+            IDs des entrées, de la plus à la moins pertinente
+        """
+        tokens = dict.fromkeys(_WORD_RE.findall(query.lower()))
+        if not tokens:
+            return []
+        
+        # Chaque mot est cité pour ne pas être interprété comme un opérateur FTS5
+        match = " OR ".join(f'"{token}"' for token in tokens)
+        
+        conn = self._acquire(readonly=True)
+        try:
+            cursor = conn.execute(
+                "SELECT rowid FROM journal_fts WHERE journal_fts MATCH ? ORDER BY rank LIMIT ?",
+                (match, limit)
+            )
+            return [row[0] for row in cursor.fetchall()]
+        finally:
+            self._release(conn, readonly=True)
+
+    async def _search_journal_vectors(self, query: str, limit: int) -> Tuple[List[int], Optional[Dict[int, float]]]:
+        """
+        Recherche des entrées du journal par similarité d'embeddings.
+        
+        Args:
+            query: Texte de recherche
+            limit: Nombre maximum de résultats
+            
+        Returns:
+            Tuple (IDs des entrées par pertinence, distances par ID ou None)
+        """
+        if self.inline_embeddings:
+            matches = await self._search_inline_vectors("journal", query, limit)
+            return [entry_id for entry_id, _ in matches], dict(matches)
+        
+        # Générer l'embedding pour la requête
+        embedding = await self._get_query_embedding(query)
+        
+        # Rechercher dans la collection
+        results = self.journal_collection.query(
+            query_embeddings=[embedding],
+            n_results=limit
+        )
+        
+        if not results or not results['ids'][0]:
+            return [], None
+        
+        # Extraire les IDs des entrées trouvées
+        entry_ids = [int(id.replace("entry_", "")) for id in results['ids'][0]]
+        distances = dict(zip(entry_ids, results['distances'][0])) if 'distances' in results else None
+        return entry_ids, distances
+
+    async def search_relevant_journal(self, query: str, limit: int = 5, mode: str = "hybrid") -> List[Dict[str, Any]]:
         """
         Recherche des entrées de journal pertinentes pour une requête.
         
+        En mode hybride, la recherche plein texte (FTS5) et la recherche
+        vectorielle sont lancées en parallèle puis fusionnées par rang réciproque.
+        
         Args:
             query: Texte de recherche
             limit: Nombre maximum de résultats
+            mode: "hybrid", "vector" ou "keyword"
             
         Returns:
             Liste des entrées pertinentes
         """
         try:
-            # Générer l'embedding pour la requête
-            embedding = await self.llm_orchestrator.get_embeddings(query)
+            use_keywords = mode in ("hybrid", "keyword") and self._journal_fts_available
+            use_vectors = mode != "keyword" or not use_keywords
             
-            # Rechercher dans la collection
-            results = self.journal_collection.query(
-                query_embeddings=[embedding],
-                n_results=limit
-            )
+            if use_keywords and use_vectors:
+                # Plus de candidats de chaque côté pour que la fusion ait du choix
+                keyword_ids, (vector_ids, distances) = await asyncio.gather(
+                    self._run(lambda: self._search_journal_fts(query, limit * 2)),
+                    self._search_journal_vectors(query, limit * 2)
+                )
+                scores = {}
+                for ranking in (vector_ids, keyword_ids):
+                    for rank, entry_id in enumerate(ranking):
+                        scores[entry_id] = scores.get(entry_id, 0.0) + 1.0 / (RRF_K + rank + 1)
+                entry_ids = sorted(scores, key=scores.get, reverse=True)[:limit]
+            elif use_keywords:
+                entry_ids = await self._run(lambda: self._search_journal_fts(query, limit))
+                distances = None
+            else:
+                entry_ids, distances = await self._search_journal_vectors(query, limit)
             
-            if not results or not results['ids'][0]:
+            if not entry_ids:
                 return []
             
-            # Extraire les IDs des entrées trouvées
-            entry_ids = [int(id.replace("entry_", "")) for id in results['ids'][0]]
+            # Récupérer les détails complets des entrées en une seule requête
+            # (les entrées supprimées entre-temps sont simplement absentes)
+            entries = await self.get_journal_entries_bulk(entry_ids)
             
-            # Récupérer les détails complets des entrées
-            entries = []
-            for i, entry_id in enumerate(entry_ids):
-                try:
-                    entry = await self.get_journal_entry(entry_id)
-                    
-                    # Ajouter le score de similarité
-                    if 'distances' in results:
-                        entry['similarity'] = results['distances'][0][i]
-                    
-                    entries.append(entry)
-                except ValueError:
-                    # L'entrée a peut-être été supprimée
-                    continue
+            # Ajouter le score de similarité
+            if distances is not None:
+                for entry in entries:
+                    if entry['id'] in distances:
+                        entry['similarity'] = distances[entry['id']]
             
             return entries
             
@@ -368,7 +1293,7 @@ class MemoryManager:
             Dict contenant la section
         """
         def _get_section():
-            conn = self.get_connection()
+            conn = self._acquire(readonly=True)
             try:
                 cursor = conn.cursor()
                 
@@ -382,7 +1307,7 @@ class MemoryManager:
                 if not section:
                     raise ValueError(f"Section non trouvée: ID {section_id}")
                 
-                result = dict(section)
+                result = dict(zip(_SECTION_COLUMNS, section))
                 
                 # Récupérer les entrées de journal associées
                 cursor.execute('''
@@ -400,9 +1325,82 @@ class MemoryManager:
                 logger.error(f"Erreur lors de la récupération d'une section: {str(e)}")
                 raise
             finally:
-                conn.close()
+                self._release(conn, readonly=True)
                 
-        return await asyncio.to_thread(_get_section)
+        return await self._run(_get_section)
+
+    async def get_sections_bulk(self, section_ids: List[int], preview_len: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Récupère plusieurs sections du mémoire avec deux requêtes au total.
+        
+        Args:
+            section_ids: IDs des sections
+            preview_len: Si fourni, seul un aperçu de cette longueur est lu
+                (clé content_preview) à la place du contenu complet
+            
+        Returns:
+            Liste des sections trouvées, dans l'ordre des IDs demandés
+        """
+        if not section_ids:
+            return []
+        
+        def _get_sections():
+            conn = self._acquire(readonly=True)
+            try:
+                cursor = conn.cursor()
+                placeholders = ",".join("?" * len(section_ids))
+                
+                if preview_len is None:
+                    cursor.execute(f'''
+                    SELECT id, titre, content, ordre, parent_id, derniere_modification
+                    FROM memoire_sections
+                    WHERE id IN ({placeholders})
+                    ''', section_ids)
+                    rows = [dict(zip(_SECTION_COLUMNS, row)) for row in cursor.fetchall()]
+                else:
+                    # Tronquer dans SQLite pour ne pas transférer les contenus longs
+                    cursor.execute(f'''
+                    SELECT id, titre, SUBSTR(content, 1, ?), LENGTH(content), ordre, parent_id, derniere_modification
+                    FROM memoire_sections
+                    WHERE id IN ({placeholders})
+                    ''', [preview_len, *section_ids])
+                    rows = []
+                    for section_id, titre, preview, content_len, ordre, parent_id, modification in cursor.fetchall():
+                        preview = preview or ''
+                        rows.append({
+                            "id": section_id,
+                            "titre": titre,
+                            "ordre": ordre,
+                            "parent_id": parent_id,
+                            "derniere_modification": modification,
+                            "content_preview": preview + "..." if (content_len or 0) > preview_len else preview
+                        })
+                
+                sections_by_id = {}
+                for section in rows:
+                    section['journal_entry_ids'] = []
+                    sections_by_id[section['id']] = section
+                
+                # Récupérer les entrées de journal associées à toutes les sections
+                cursor.execute(f'''
+                SELECT se.section_id, j.id
+                FROM journal_entries j
+                JOIN section_entries se ON j.id = se.entry_id
+                WHERE se.section_id IN ({placeholders})
+                ''', section_ids)
+                
+                for section_id, entry_id in cursor.fetchall():
+                    sections_by_id[section_id]['journal_entry_ids'].append(entry_id)
+                
+                return [sections_by_id[section_id] for section_id in dict.fromkeys(section_ids) if section_id in sections_by_id]
+                
+            except Exception as e:
+                logger.error(f"Erreur lors de la récupération des sections: {str(e)}")
+                raise
+            finally:
+                self._release(conn, readonly=True)
+                
+        return await self._run(_get_sections)
 
     async def add_section(self, section) -> Dict[str, Any]:
         """
@@ -415,11 +1413,12 @@ class MemoryManager:
             Dict contenant la section ajoutée
         """
         def _add_section():
-            conn = self.get_connection()
+            conn = self._acquire()
             try:
                 cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
                 
-                now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                now = _now_str()
                 
                 # Insérer la section
                 cursor.execute('''
@@ -446,9 +1445,9 @@ class MemoryManager:
                 logger.error(f"Erreur lors de l'ajout d'une section: {str(e)}")
                 raise
             finally:
-                conn.close()
+                self._release(conn)
                 
-        section_data = await asyncio.to_thread(_add_section)
+        section_data = await self._run(_add_section)
         
         # Indexer le contenu pour la recherche
         try:
@@ -471,16 +1470,17 @@ class MemoryManager:
             Dict contenant la section mise à jour
         """
         def _update_section():
-            conn = self.get_connection()
+            conn = self._acquire()
             try:
                 cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
                 
                 # Vérifier que la section existe
                 cursor.execute("SELECT id FROM memoire_sections WHERE id = ?", (section_id,))
                 if not cursor.fetchone():
                     raise ValueError(f"Section non trouvée: ID {section_id}")
                 
-                now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                now = _now_str()
                 
                 # Mettre à jour la section
                 cursor.execute('''
@@ -507,9 +1507,9 @@ class MemoryManager:
                 logger.error(f"Erreur lors de la mise à jour d'une section: {str(e)}")
                 raise
             finally:
-                conn.close()
+                self._release(conn)
                 
-        section_data = await asyncio.to_thread(_update_section)
+        section_data = await self._run(_update_section)
         
         # Mettre à jour l'index de recherche
         try:
@@ -531,9 +1531,10 @@ class MemoryManager:
             True si l'opération a réussi
         """
         def _delete_section():
-            conn = self.get_connection()
+            conn = self._acquire()
             try:
                 cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
                 
                 # Vérifier que la section existe
                 cursor.execute("SELECT id FROM memoire_sections WHERE id = ?", (section_id,))
@@ -543,16 +1544,24 @@ class MemoryManager:
                 # Supprimer les associations avec les entrées de journal
                 cursor.execute("DELETE FROM section_entries WHERE section_id = ?", (section_id,))
                 
+                # Détacher les sous-sections (ON DELETE SET NULL n'est pas déclaré par
+                # tous les schémas, et les clés étrangères sont vérifiées)
+                cursor.execute("UPDATE memoire_sections SET parent_id = NULL WHERE parent_id = ?", (section_id,))
+                
                 # Supprimer la section
                 cursor.execute("DELETE FROM memoire_sections WHERE id = ?", (section_id,))
                 
                 conn.commit()
                 
-                # Supprimer de l'index de recherche
-                try:
-                    self.sections_collection.delete(where={"section_id": section_id})
-                except Exception as e:
-                    logger.error(f"Erreur lors de la suppression de l'index de section: {str(e)}")
+                # Supprimer de l'index de recherche (les chunks stockés dans SQLite
+                # sont supprimés en cascade)
+                if self.inline_embeddings:
+                    self._invalidate_vectors("sections")
+                else:
+                    try:
+                        self.sections_collection.delete(where={"section_id": section_id})
+                    except Exception as e:
+                        logger.error(f"Erreur lors de la suppression de l'index de section: {str(e)}")
                 
                 return True
                 
@@ -561,9 +1570,9 @@ class MemoryManager:
                 logger.error(f"Erreur lors de la suppression d'une section: {str(e)}")
                 raise
             finally:
-                conn.close()
+                self._release(conn)
                 
-        return await asyncio.to_thread(_delete_section)
+        return await self._run(_delete_section)
 
     async def get_outline(self) -> List[Dict[str, Any]]:
         """
@@ -573,7 +1582,7 @@ class MemoryManager:
             Liste des sections de premier niveau avec leurs sous-sections
         """
         def _get_outline():
-            conn = self.get_connection()
+            conn = self._acquire(readonly=True)
             try:
                 cursor = conn.cursor()
                 
@@ -584,28 +1593,25 @@ class MemoryManager:
                 ORDER BY ordre
                 ''')
                 
-                all_sections = [dict(row) for row in cursor.fetchall()]
-                
-                # Construire l'arborescence
-                sections_by_id = {s["id"]: {"id": s["id"], "title": s["titre"], "ordre": s["ordre"]} for s in all_sections}
+                # Construire l'arborescence en un seul passage : les sections arrivent
+                # triées par ordre, les listes d'enfants n'ont donc pas à être retriées
+                sections_by_id = {}
                 root_sections = []
                 
-                for section in all_sections:
-                    parent_id = section["parent_id"]
-                    section_dict = sections_by_id[section["id"]]
+                for section_id, titre, parent_id, ordre in cursor.fetchall():
+                    section_dict = {"id": section_id, "title": titre, "ordre": ordre}
+                    
+                    # Reprendre les enfants déjà rencontrés si le parent arrive après eux
+                    placeholder = sections_by_id.get(section_id)
+                    if placeholder is not None:
+                        section_dict["children"] = placeholder["children"]
+                    sections_by_id[section_id] = section_dict
                     
                     if parent_id is None:
                         root_sections.append(section_dict)
                     else:
-                        if "children" not in sections_by_id[parent_id]:
-                            sections_by_id[parent_id]["children"] = []
-                        sections_by_id[parent_id]["children"].append(section_dict)
-                
-                # Trier par ordre
-                root_sections.sort(key=lambda x: x["ordre"])
-                for section_id, section in sections_by_id.items():
-                    if "children" in section:
-                        section["children"].sort(key=lambda x: x["ordre"])
+                        parent = sections_by_id.setdefault(parent_id, {})
+                        parent.setdefault("children", []).append(section_dict)
                 
                 return root_sections
                 
@@ -613,9 +1619,9 @@ class MemoryManager:
                 logger.error(f"Erreur lors de la récupération du plan: {str(e)}")
                 raise
             finally:
-                conn.close()
+                self._release(conn, readonly=True)
                 
-        return await asyncio.to_thread(_get_outline)
+        return await self._run(_get_outline)
 
     async def save_section(self, section: Dict[str, Any]) -> bool:
         """
@@ -628,11 +1634,12 @@ class MemoryManager:
             True si l'opération a réussi
         """
         def _save_section():
-            conn = self.get_connection()
+            conn = self._acquire()
             try:
                 cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
                 
-                now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                now = _now_str()
                 cursor.execute(
                     "UPDATE memoire_sections SET content = ?, derniere_modification = ? WHERE id = ?", 
                     (section["content"], now, section["id"])
@@ -646,9 +1653,9 @@ class MemoryManager:
                 logger.error(f"Erreur lors de la sauvegarde de la section: {str(e)}")
                 raise
             finally:
-                conn.close()
+                self._release(conn)
                 
-        result = await asyncio.to_thread(_save_section)
+        result = await self._run(_save_section)
         
         # Mettre à jour l'index de recherche
         if result:
@@ -672,51 +1679,101 @@ class MemoryManager:
             Liste des sections pertinentes
         """
         try:
-            # Générer l'embedding pour la requête
-            embedding = await self.llm_orchestrator.get_embeddings(query)
-            
-            # Rechercher dans la collection
-            results = self.sections_collection.query(
-                query_embeddings=[embedding],
-                n_results=limit * 3  # Récupérer plus pour filtrer les doublons
-            )
-            
-            if not results or not results['ids'][0]:
-                return []
-            
-            # Extraire les IDs des sections en supprimant les suffixes de chunks
-            section_ids_with_chunks = results['ids'][0]
-            section_ids = set()
+            if self.inline_embeddings:
+                matches = await self._search_inline_vectors("sections", query, limit * 3)
+                chunk_section_ids = [section_id for section_id, _ in matches]
+            else:
+                # Générer l'embedding pour la requête
+                embedding = await self._get_query_embedding(query)
+                
+                # Rechercher dans la collection
+                results = self.sections_collection.query(
+                    query_embeddings=[embedding],
+                    n_results=limit * 3  # Récupérer plus pour filtrer les doublons
+                )
+                
+                if not results or not results['ids'][0]:
+                    return []
+                
+                # Extraire les IDs des sections en supprimant les suffixes de chunks
+                chunk_section_ids = [int(id_with_chunk.split('_')[0]) for id_with_chunk in results['ids'][0]]
             
-            for id_with_chunk in section_ids_with_chunks:
-                section_id = id_with_chunk.split('_')[0]
-                section_ids.add(section_id)
+            # Sans doublon et dans l'ordre de pertinence
+            section_ids = dict.fromkeys(chunk_section_ids)
             
             # Limiter au nombre demandé
             section_ids = list(section_ids)[:limit]
             
-            # Récupérer les détails complets des sections
-            sections = []
-            for section_id in section_ids:
-                try:
-                    section = await self.get_section(int(section_id))
-                    
-                    # Ajouter un aperçu du contenu
-                    full_content = section.get('content', '')
-                    section['content_preview'] = full_content[:300] + "..." if len(full_content) > 300 else full_content
-                    
-                    sections.append(section)
-                except ValueError:
-                    # La section a peut-être été supprimée
-                    continue
-            
-            return sections
+            # Récupérer les sections avec un aperçu du contenu en une seule requête
+            # (les sections supprimées entre-temps sont simplement absentes)
+            return await self.get_sections_bulk(section_ids, preview_len=300)
             
         except Exception as e:
             logger.error(f"Erreur lors de la recherche de sections: {str(e)}")
             # En cas d'erreur, retourner une liste vide
             return []
 
+    def _get_chunk_count(self, section_id: int) -> Optional[int]:
+        """
+        Lit le nombre de chunks indexés pour une section.
+        
+        Args:
+            section_id: ID de la section
+            
+        Returns:
+            Nombre de chunks, ou None s'il n'est pas connu
+        """
+        conn = self._acquire(readonly=True)
+        try:
+            row = conn.execute(
+                "SELECT chunk_count FROM memoire_sections WHERE id = ?", (section_id,)
+            ).fetchone()
+            return row[0] if row else None
+        except sqlite3.Error as e:
+            logger.warning("Nombre de chunks indisponible pour la section %s: %s", section_id, e)
+            return None
+        finally:
+            self._release(conn, readonly=True)
+
+    def _set_chunk_count(self, section_id: int, chunk_count: int):
+        """
+        Enregistre le nombre de chunks indexés pour une section.
+        
+        Args:
+            section_id: ID de la section
+            chunk_count: Nombre de chunks dans l'index
+        """
+        conn = self._acquire()
+        try:
+            conn.execute(
+                "UPDATE memoire_sections SET chunk_count = ? WHERE id = ?", (chunk_count, section_id)
+            )
+        except sqlite3.Error as e:
+            logger.warning("Impossible d'enregistrer le nombre de chunks de la section %s: %s", section_id, e)
+        finally:
+            self._release(conn)
+
+    async def _delete_section_chunks(self, section_id: int, new_chunk_count: int = 0):
+        """
+        Supprime les chunks d'une section de l'index de recherche.
+        
+        La suppression se fait par IDs quand le nombre de chunks est connu, ce qui
+        évite le filtre sur les métadonnées, plus coûteux.
+        
+        Args:
+            section_id: ID de la section
+            new_chunk_count: Nombre de chunks qui vont être réindexés, dont les IDs
+                sont aussi libérés
+        """
+        chunk_count = await self._run(lambda: self._get_chunk_count(section_id))
+        if chunk_count is None:
+            self.sections_collection.delete(where={"section_id": section_id})
+            return
+        
+        chunk_count = max(chunk_count, new_chunk_count)
+        if chunk_count:
+            self.sections_collection.delete(ids=[f"{section_id}_{i}" for i in range(chunk_count)])
+
     async def _index_section_content(self, section: Dict[str, Any]) -> bool:
         """
         Indexe le contenu d'une section dans ChromaDB pour la recherche.
@@ -731,44 +1788,47 @@ class MemoryManager:
         content = section.get('content', '')
         title = section.get('titre', '')
         
+        if self.inline_embeddings:
+            return await self._index_section_inline(section_id, content)
+        
         # Si pas de contenu, supprimer les index existants
         if not content:
             try:
-                self.sections_collection.delete(where={"section_id": section_id})
+                await self._delete_section_chunks(section_id)
+                await self._run(lambda: self._set_chunk_count(section_id, 0))
                 return True
             except Exception as e:
                 logger.error(f"Erreur lors de la suppression des chunks pour la section {section_id}: {str(e)}")
                 return False
         
-        # Découper le contenu en chunks
-        chunks = self.text_splitter.split_text(content)
+        # Découper le contenu en chunks, hors de la boucle d'événements
+        chunks = await self._run_cpu(_split_content, content, size=len(content))
         
         if not chunks:
             return True  # Rien à indexer
         
         try:
             # Supprimer les chunks existants
-            self.sections_collection.delete(where={"section_id": section_id})
+            await self._delete_section_chunks(section_id, len(chunks))
             
             # Créer de nouveaux chunks
             ids = [f"{section_id}_{i}" for i in range(len(chunks))]
             metadata = []
+            timestamp = datetime.now().isoformat()
             
-            for i, chunk in enumerate(chunks):
-                # Déterminer le type de contenu pour chaque chunk
-                chunk_type = self.text_splitter._determine_content_type(chunk)
-                
-                # Extraire des mots-clés pour améliorer la recherche
-                keywords = self._extract_keywords(chunk)
+            # Type de contenu et mots-clés, réutilisés si le chunk n'a pas changé
+            chunks_metadata = await self._get_chunks_metadata(chunks)
+            
+            for i, (chunk, (chunk_type, keywords)) in enumerate(zip(chunks, chunks_metadata)):
                 
                 metadata.append({
                     "section_id": section_id,
                     "title": title,
                     "chunk_index": i,
                     "chunk_type": chunk_type,
-                    "keywords": ",".join(keywords[:10]),  # Limiter à 10 mots-clés
+                    "keywords": keywords,
                     "chunk_size": len(chunk),
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": timestamp
                 })
             
             # Ajouter les chunks à la collection
@@ -778,42 +1838,126 @@ class MemoryManager:
                 metadatas=metadata
             )
             
+            await self._run(lambda: self._set_chunk_count(section_id, len(chunks)))
             return True
             
         except Exception as e:
             logger.error(f"Erreur lors de l'indexation de la section {section_id}: {str(e)}")
             return False
 
-    def _extract_keywords(self, text: str) -> List[str]:
+    def _replace_section_chunks(self, section_id: int, rows: List[Tuple[int, int, str, bytes, float]]):
         """
-        Extrait les mots-clés significatifs d'un texte.
+        Remplace dans SQLite les chunks indexés d'une section.
         
         Args:
-            text: Texte à analyser
+            section_id: ID de la section
+            rows: Tuples (section_id, chunk_index, texte, embedding, facteur d'échelle)
+        """
+        conn = self._acquire()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute("DELETE FROM section_chunks WHERE section_id = ?", (section_id,))
+            cursor.executemany(
+                "INSERT INTO section_chunks (section_id, chunk_index, text, embedding, embedding_scale) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            cursor.execute(
+                "UPDATE memoire_sections SET chunk_count = ? WHERE id = ?", (len(rows), section_id)
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._release(conn)
+
+    async def _index_section_inline(self, section_id: int, content: str) -> bool:
+        """
+        Indexe le contenu d'une section dans SQLite (mode inline_embeddings).
+        
+        Args:
+            section_id: ID de la section
+            content: Contenu de la section
             
         Returns:
-            Liste des mots-clés
+            True si l'opération a réussi
         """
-        # Nettoyer le texte
-        text = re.sub(r'[^\w\s]', ' ', text.lower())
-        words = text.split()
+        try:
+            chunks = await self._run_cpu(_split_content, content, size=len(content)) if content else []
+            embeddings = await asyncio.gather(
+                *(self.llm_orchestrator.get_embeddings(chunk) for chunk in chunks)
+            )
+            rows = [
+                (section_id, i, chunk, *_quantize_embedding(embedding))
+                for i, (chunk, embedding) in enumerate(zip(chunks, embeddings))
+            ]
+            await self._run(lambda: self._replace_section_chunks(section_id, rows))
+            return True
+            
+        except Exception as e:
+            logger.error(f"Erreur lors de l'indexation de la section {section_id}: {str(e)}")
+            return False
+        finally:
+            self._invalidate_vectors("sections")
+
+    async def _get_chunks_metadata(self, chunks: List[str]) -> List[Tuple[str, str]]:
+        """
+        Détermine le type de contenu et les mots-clés de chunks, avec un cache LRU.
         
-        # Filtrer les mots vides
-        stopwords = {"le", "la", "les", "un", "une", "des", "et", "ou", "a", "à", "de", "du", "en", 
-                     "est", "ce", "que", "qui", "dans", "par", "pour", "sur", "avec", "sans", 
-                     "il", "elle", "ils", "elles", "nous", "vous", "je", "tu"}
+        Une section réindexée après une modification garde la plupart de ses
+        chunks inchangés : seuls les nouveaux chunks sont analysés, dans le pool
+        de processus.
         
-        keywords = [word for word in words if word not in stopwords and len(word) > 3]
+        Args:
+            chunks: Textes des chunks
+            
+        Returns:
+            Tuples (type de contenu, 10 premiers mots-clés séparés par des virgules)
+        """
+        keys = [hashlib.blake2b(chunk.encode("utf-8"), digest_size=8).digest() for chunk in chunks]
         
-        # Compter les occurrences
-        keyword_counts = {}
-        for word in keywords:
-            keyword_counts[word] = keyword_counts.get(word, 0) + 1
+        found = {}
+        missing = {}
+        for key, chunk in zip(keys, chunks):
+            cached = self._chunk_metadata_cache.get(key)
+            if cached is not None:
+                self._chunk_metadata_cache.move_to_end(key)
+                found[key] = cached
+            else:
+                missing[key] = chunk
         
-        # Trier par fréquence
-        sorted_keywords = sorted(keyword_counts.items(), key=lambda x: x[1], reverse=True)
+        if missing:
+            analyzed = await self._run_cpu(
+                _analyze_chunks, list(missing.values()), size=sum(map(len, missing.values()))
+            )
+            for key, result in zip(missing, analyzed):
+                found[key] = self._chunk_metadata_cache[key] = result
+            while len(self._chunk_metadata_cache) > CHUNK_METADATA_CACHE_SIZE:
+                self._chunk_metadata_cache.popitem(last=False)
         
-        return [word for word, count in sorted_keywords]
+        return [found[key] for key in keys]
+
+    @staticmethod
+    def _extract_keywords(text: str) -> List[str]:
+        """
+        Extrait les mots-clés significatifs d'un texte.
+        
+        Args:
+            text: Texte à analyser
+            
+        Returns:
+            Liste des mots-clés
+        """
+        # Découper le texte en mots en un seul passage (la ponctuation sépare les mots)
+        words = _WORD_RE.findall(text.lower())
+        
+        # Compter les occurrences hors mots vides
+        keyword_counts = Counter(word for word in words if len(word) > 3 and word not in STOPWORDS_FR)
+        
+        # Trier par fréquence (à égalité, ordre de première apparition)
+        return [word for word, count in keyword_counts.most_common()]
 
     # --- MÉTHODES POUR L'ÉVALUATION DES COMPÉTENCES ---
 
@@ -825,7 +1969,7 @@ class MemoryManager:
             Dictionnaire avec les résultats de l'analyse
         """
         def _analyze_competences():
-            conn = self.get_connection()
+            conn = self._acquire(readonly=True)
             try:
                 cursor = conn.cursor()
                 
@@ -836,53 +1980,29 @@ class MemoryManager:
                 ORDER BY date DESC
                 ''')
                 
-                entries = [dict(row) for row in cursor.fetchall()]
-                
-                # Définir les mots-clés associés à chaque compétence RNCP
-                competence_keywords = {
-                    "analyse_besoins": [
-                        "analyse", "besoin", "exigence", "requirement", "interview", "utilisateur",
-                        "client", "stakeholder", "partie prenante", "évaluation", "diagnostic"
-                    ],
-                    "conception_systemes": [
-                        "conception", "architecture", "design", "modélisation", "UML", "diagramme",
-                        "système", "database", "base de données", "API", "microservice", "solution"
-                    ],
-                    "gestion_projets": [
-                        "projet", "planning", "délai", "deadline", "budget", "ressource", "équipe",
-                        "coordination", "gestion", "management", "agile", "scrum", "sprint", "kanban"
-                    ],
-                    "maintenance_evolution": [
-                        "maintenance", "évolution", "mise à jour", "update", "correction", "bug",
-                        "optimisation", "performance", "refactoring", "legacy", "dette technique"
-                    ],
-                    "assistance_formation": [
-                        "formation", "assistance", "support", "aide", "utilisateur", "documentation",
-                        "tutoriel", "guide", "présentation", "démonstration", "atelier", "workshop"
-                    ]
-                }
+                entries = [
+                    {"id": entry_id, "date": date, "content": content, "type_entree": type_entree}
+                    for entry_id, date, content, type_entree in cursor.fetchall()
+                ]
                 
                 # Initialiser les compteurs
-                competence_counts = {key: 0 for key in competence_keywords.keys()}
-                competence_entries = {key: [] for key in competence_keywords.keys()}
+                competence_counts = dict.fromkeys(COMPETENCE_KEYS, 0)
+                competence_entries = {key: [] for key in COMPETENCE_KEYS}
                 
                 # Analyser chaque entrée
                 for entry in entries:
                     content = entry.get("content", "").lower()
                     entry_competences = set()
                     
-                    # Vérifier les mots-clés pour chaque compétence
-                    for competence, keywords in competence_keywords.items():
-                        matched_keywords = [keyword for keyword in keywords if keyword in content]
-                        
-                        if matched_keywords:
-                            competence_counts[competence] += 1
-                            entry_competences.add(competence)
-                            competence_entries[competence].append({
-                                "entry_id": entry["id"],
-                                "date": entry["date"],
-                                "matched_keywords": matched_keywords
-                            })
+                    # Vérifier les mots-clés de toutes les compétences en un passage
+                    for competence, matched_keywords in _match_competences(content).items():
+                        competence_counts[competence] += 1
+                        entry_competences.add(competence)
+                        competence_entries[competence].append({
+                            "entry_id": entry["id"],
+                            "date": entry["date"],
+                            "matched_keywords": matched_keywords
+                        })
                     
                     # Mettre à jour la table de liaison (à implémenter si nécessaire)
                 
@@ -893,7 +2013,7 @@ class MemoryManager:
                         portfolio = json.load(f)
                 else:
                     portfolio = {
-                        "competences": {key: [] for key in competence_keywords.keys()},
+                        "competences": {key: [] for key in COMPETENCE_KEYS},
                         "date_evaluation": datetime.now().strftime("%Y-%m-%d"),
                         "commentaire_general": ""
                     }
@@ -902,7 +2022,7 @@ class MemoryManager:
                 portfolio["statistiques"] = {
                     "mentions_par_competence": competence_counts,
                     "nombre_entrees_total": len(entries),
-                    "derniere_analyse": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    "derniere_analyse": _now_str()
                 }
                 
                 # Sauvegarder le portfolio
@@ -919,9 +2039,9 @@ class MemoryManager:
                 logger.error(f"Erreur lors de l'analyse des compétences: {str(e)}")
                 raise
             finally:
-                conn.close()
+                self._release(conn, readonly=True)
                 
-        return await asyncio.to_thread(_analyze_competences)
+        return await self._run(_analyze_competences)
 
     async def initialize_rncp_structure(self) -> bool:
         """
@@ -931,9 +2051,10 @@ class MemoryManager:
             True si l'initialisation a réussi
         """
         def _init_structure():
-            conn = self.get_connection()
+            conn = self._acquire()
             try:
                 cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
                 
                 # Vérifier si des sections existent déjà
                 cursor.execute("SELECT COUNT(*) FROM memoire_sections")
@@ -941,7 +2062,7 @@ class MemoryManager:
                     # Structure déjà initialisée
                     return True
                 
-                now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                now = _now_str()
                 
                 # Définir la structure selon les exigences RNCP
                 sections = [
@@ -1001,6 +2122,6 @@ class MemoryManager:
                 logger.error(f"Erreur lors de l'initialisation de la structure RNCP: {str(e)}")
                 return False
             finally:
-                conn.close()
+                self._release(conn)
                 
-        return await asyncio.to_thread(_init_structure)
\ No newline at end of file
+        return await self._run(_init_structure)
\ No newline at end of file
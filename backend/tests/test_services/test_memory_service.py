@@ -0,0 +1,146 @@
+# tests/test_services/test_memory_service.py
+import sqlite3
+import pytest
+from services import memory_service
+from services.memory_service import MemoryManager, _match_competences, _merge_vector_writes
+
+class FakeCollection:
+    """Collection ChromaDB factice qui refuse les identifiants répétés"""
+    def __init__(self):
+        self.calls = []
+
+    def _record(self, operation, ids=(), **payload):
+        assert len(ids) == len(set(ids)), "identifiants répétés"
+        self.calls.append((operation, list(ids), payload))
+
+    def add(self, **payload):
+        self._record("add", **payload)
+
+    def update(self, **payload):
+        self._record("update", **payload)
+
+    def delete(self, **payload):
+        self._record("delete", **payload)
+
+@pytest.fixture
+def manager_dependencies(monkeypatch):
+    """Remplace le LLM et les collections ChromaDB utilisés par MemoryManager"""
+    monkeypatch.setattr(memory_service, "get_llm_orchestrator", lambda: None)
+    monkeypatch.setattr(memory_service, "get_journal_collection", FakeCollection)
+    monkeypatch.setattr(memory_service, "get_sections_collection", FakeCollection)
+
+def test_merge_vector_writes_groups_consecutive_operations():
+    journal, sections = object(), object()
+    batch = [
+        (journal, "add", {"ids": ["entry_1"], "documents": ["a"]}),
+        (journal, "add", {"ids": ["entry_2"], "documents": ["b"]}),
+        (sections, "add", {"ids": ["s_1"], "documents": ["c"]}),
+        (journal, "delete", {"ids": ["entry_1"]}),
+    ]
+    groups = _merge_vector_writes(batch)
+
+    # L'ordre de la file est conservé entre les groupes
+    assert [(collection, operation) for collection, operation, _ in groups] == [
+        (journal, "add"), (sections, "add"), (journal, "delete")
+    ]
+    assert groups[0][2] == {"ids": ["entry_1", "entry_2"], "documents": ["a", "b"]}
+
+def test_merge_vector_writes_keeps_last_payload_per_id():
+    journal = object()
+    batch = [
+        (journal, "update", {"ids": ["entry_1"], "documents": ["v1"], "metadatas": [{"n": 1}]}),
+        (journal, "update", {"ids": ["entry_2"], "documents": ["autre"], "metadatas": [{"n": 2}]}),
+        (journal, "update", {"ids": ["entry_1"], "documents": ["v2"], "metadatas": [{"n": 3}]}),
+    ]
+    [(_, _, payload)] = _merge_vector_writes(batch)
+
+    assert payload == {
+        "ids": ["entry_1", "entry_2"],
+        "documents": ["v2", "autre"],
+        "metadatas": [{"n": 3}, {"n": 2}],
+    }
+
+@pytest.mark.asyncio
+async def test_close_flushes_queued_vector_writes(tmp_path, manager_dependencies):
+    manager = MemoryManager(db_path=str(tmp_path / "memoire.db"))
+    collection = FakeCollection()
+
+    # Deux mises à jour rapprochées de la même entrée, puis une suppression
+    manager._enqueue_vector_write(collection, "update", ids=["entry_1"], documents=["v1"])
+    manager._enqueue_vector_write(collection, "update", ids=["entry_1"], documents=["v2"])
+    manager._enqueue_vector_write(collection, "delete", ids=["entry_2"])
+    await manager.close()
+
+    assert collection.calls == [
+        ("update", ["entry_1"], {"documents": ["v2"]}),
+        ("delete", ["entry_2"], {}),
+    ]
+    assert manager._vector_task is None
+
+    # L'exécuteur de la base est arrêté et les connexions conservées sont fermées
+    assert manager._write_pool.empty() and manager._read_pool.empty()
+    with pytest.raises(RuntimeError):
+        manager._executor.submit(lambda: None)
+
+@pytest.mark.asyncio
+async def test_delete_section_detaches_children(tmp_path, manager_dependencies):
+    db_path = str(tmp_path / "memoire.db")
+
+    # Schéma de main.py : parent_id sans action ON DELETE
+    conn = sqlite3.connect(db_path)
+    conn.executescript('''
+    CREATE TABLE memoire_sections (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        titre TEXT NOT NULL,
+        contenu TEXT,
+        ordre INTEGER NOT NULL,
+        parent_id INTEGER,
+        derniere_modification TEXT NOT NULL,
+        FOREIGN KEY (parent_id) REFERENCES memoire_sections(id)
+    );
+    CREATE TABLE section_entries (
+        section_id INTEGER,
+        entry_id INTEGER,
+        PRIMARY KEY (section_id, entry_id),
+        FOREIGN KEY (section_id) REFERENCES memoire_sections(id) ON DELETE CASCADE
+    );
+    INSERT INTO memoire_sections (id, titre, ordre, parent_id, derniere_modification)
+    VALUES (1, 'Partie', 1, NULL, '2024-01-01'), (2, 'Sous-partie', 1, 1, '2024-01-01');
+    ''')
+    conn.commit()
+    conn.close()
+
+    manager = MemoryManager(db_path=db_path)
+    assert await manager.delete_section(1) is True
+    await manager.close()
+
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute("SELECT id, parent_id FROM memoire_sections").fetchall()
+    conn.close()
+    assert rows == [(2, None)]
+
+def test_match_competences_keeps_keyword_order_and_ignores_acronyms():
+    matches = _match_competences("une réponse rapide au cumul, puis l'analyse du besoin de l'utilisateur")
+
+    # Les sigles en majuscules ne sont jamais trouvés dans le contenu en minuscules
+    assert "conception_systemes" not in matches
+    assert matches["analyse_besoins"] == ["analyse", "besoin", "utilisateur"]
+    assert matches["assistance_formation"] == ["utilisateur"]
+
+@pytest.mark.asyncio
+async def test_run_cpu_keeps_short_texts_in_process(tmp_path, manager_dependencies):
+    manager = MemoryManager(db_path=str(tmp_path / "memoire.db"))
+    content = "Une phrase du mémoire. " * 10
+
+    # Un texte court ne démarre pas le pool de processus
+    chunks = await manager._run_cpu(memory_service._split_content, content, size=len(content))
+    assert manager._cpu_pool is None
+
+    # Au-delà du seuil, le pool donne le même découpage ; close() l'arrête
+    pooled = await manager._run_cpu(
+        memory_service._split_content, content, size=memory_service.CPU_POOL_MIN_CHARS
+    )
+    assert pooled == chunks
+    assert manager._cpu_pool is not None
+    await manager.close()
+    assert manager._cpu_pool is None
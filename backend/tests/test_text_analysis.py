@@ -48,4 +48,38 @@ def test_api_extract_tags():
     assert len(tags) <= 5, "La fonction ne doit pas retourner plus de 5 tags"
     
     # Vérifier que 'chat' est dans les tags car c'est répété deux fois
-    assert "chat" in tags, "Le mot 'chat' devrait être présent dans les tags"
\ No newline at end of file
+    assert "chat" in tags, "Le mot 'chat' devrait être présent dans les tags"
+
+@pytest.mark.skipif(not utils_import_works, reason="utils.text_analysis n'est pas importable")
+def test_tag_extractor_tokens_without_punctuation():
+    """Test que la tokenisation ne garde que les mots, sans ponctuation ni stopwords"""
+    from utils.text_analysis import TagExtractor
+    extractor = TagExtractor()
+
+    tokens = extractor._tokenize_text("le chat. l'équipe, 42 bug: document")
+    assert tokens == ["chat", "équipe", "bug"]
+
+
+@pytest.mark.skipif(not utils_import_works, reason="utils.text_analysis n'est pas importable")
+def test_tag_extractor_ignores_urls_and_punctuation():
+    """Test que les URLs et la ponctuation n'apparaissent pas dans les tags"""
+    from utils.text_analysis import TagExtractor
+    extractor = TagExtractor(min_frequency=1)
+
+    tags = extractor.extract_tags("Voir https://exemple.org/chat pour le chat, le chat! Le chien... le chien?")
+    assert tags == ["chat", "chien"]
+
+
+@pytest.mark.skipif(not utils_import_works, reason="utils.text_analysis n'est pas importable")
+def test_technical_subjects_order_without_automaton(monkeypatch):
+    """Test que les sujets techniques sont trouvés dans l'ordre de priorité, avec ou sans pyahocorasick"""
+    from utils import text_analysis
+    extractor = text_analysis.TagExtractor()
+    text = "rapport de projet : machine learning en python, puis docker et python"
+
+    # Recherche par sous-chaîne : "app" est trouvé dans "rapport"
+    found = extractor._find_technical_subjects(text)
+    assert found == ["docker", "python", "machine learning", "app", "rapport", "projet"]
+
+    monkeypatch.setattr(text_analysis, "AHOCORASICK_AVAILABLE", False)
+    assert extractor._find_technical_subjects(text) == found
@@ -0,0 +1,109 @@
+# tests/test_utils/test_pdf_extractor.py
+import pytest
+from io import BytesIO
+from utils import pdf_extractor
+from utils.pdf_extractor import analyze_entry_content, extract_automatic_tags, extract_dates_from_text
+
+def test_extract_dates_from_text():
+    text = "Jeudi 19 septembre 2024. Réunion le 2024-09-20 et 21/09/2024. Hier, nous avons codé."
+    date_positions, dates = extract_dates_from_text(text)
+
+    # Chaque format est reconnu en un seul passage, sans doublon pour la date avec jour de semaine
+    found = {d["original"]: d["date"] for d in dates}
+    assert found["Jeudi 19 septembre 2024"] == "2024-09-19"
+    assert found["2024-09-20"] == "2024-09-20"
+    assert found["21/09/2024"] == "2024-09-21"
+    assert "hier" in found
+    assert len(dates) == 4
+
+    # Les positions sont triées dans l'ordre du texte
+    positions = [pos for pos, _ in date_positions]
+    assert positions == sorted(positions)
+
+    # La date en début de document est la date principale
+    assert dates[0]["is_primary"]
+
+def test_extract_dates_from_text_invalid_date():
+    _, dates = extract_dates_from_text("Le 31/02/2024 n'existe pas.")
+    assert dates == []
+
+def test_analyze_entry_content_type_priority():
+    # Un seul passage sur le texte, mais la formation reste prioritaire même citée en dernier
+    result = analyze_entry_content("Analyse du projet de développement, puis un cours en fin de journée.")
+    assert result["type_entree"] == "formation"
+
+    assert analyze_entry_content("Bilan et analyse de la semaine.")["type_entree"] == "réflexion"
+    assert analyze_entry_content("Rien de particulier aujourd'hui.")["type_entree"] == "quotidien"
+
+def test_extract_dates_from_text_no_overlapping_hits():
+    # Le parcours unique ne produit qu'un résultat par date, même quand plusieurs formats se recouvrent
+    _, dates = extract_dates_from_text("Lundi 12 février 2024, puis le 2024-02-13, le 14-02-2024 et avant-hier.")
+    assert [d["original"] for d in sorted(dates, key=lambda d: d["position"])] == [
+        "Lundi 12 février 2024", "2024-02-13", "14-02-2024", "avant-hier"
+    ]
+
+def test_extract_automatic_tags_folds_accented_capitals():
+    # Les majuscules accentuées sont ramenées à la même forme que les minuscules
+    assert extract_automatic_tags("Équipe ÉQUIPE équipe, puis la même équipe.")[0] == "équipe"
+
+def _build_pdf(page_count):
+    canvas = pytest.importorskip("reportlab.pdfgen.canvas")
+    buffer = BytesIO()
+    pdf = canvas.Canvas(buffer)
+    for page in range(page_count):
+        pdf.drawString(72, 720, f"Page {page + 1} du journal de bord")
+        pdf.showPage()
+    pdf.save()
+    return buffer.getvalue()
+
+def test_extract_text_from_pdf_parallel_pages_matches_sequential(monkeypatch):
+    if not pdf_extractor.PYPDF2_AVAILABLE:
+        pytest.skip("PyPDF2 n'est pas installé")
+    pdf_data = _build_pdf(pdf_extractor.PDF_PARALLEL_MIN_PAGES + 8)
+    monkeypatch.setattr(pdf_extractor.os, "cpu_count", lambda: 4)
+
+    sequential = pdf_extractor._extract_text_from_pdf(pdf_data)
+    parallel = pdf_extractor._extract_text_from_pdf(pdf_data, parallel_pages=True)
+
+    assert parallel == sequential
+    assert "Page 1 du journal" in sequential and "Page 40 du journal" in sequential
+
+def test_extract_text_from_pdf_is_sequential_by_default(monkeypatch):
+    if not pdf_extractor.PYPDF2_AVAILABLE:
+        pytest.skip("PyPDF2 n'est pas installé")
+    pdf_data = _build_pdf(pdf_extractor.PDF_PARALLEL_MIN_PAGES)
+
+    # Le pool de processus n'est utilisé que sur demande (traitements par lot)
+    def _no_pool():
+        raise AssertionError("pool de processus utilisé")
+    monkeypatch.setattr(pdf_extractor, "_get_page_pool", _no_pool)
+
+    assert "Page 32 du journal" in pdf_extractor._extract_text_from_pdf(pdf_data)
+
+def test_process_documents_reports_per_file_status(monkeypatch):
+    def _process_document(file_content, filename):
+        if filename == "illisible.pdf":
+            raise ValueError("document illisible")
+        return []
+    monkeypatch.setattr(pdf_extractor, "process_document", _process_document)
+
+    # Un fichier en échec se distingue d'un fichier sans entrée
+    assert pdf_extractor.process_documents([(b"", "illisible.pdf")]) == [(False, "document illisible")]
+    assert pdf_extractor.process_documents([(b"", "vide.pdf")]) == [(True, [])]
+
+def _str_binary_fallback(text):
+    # Ancienne extraction de secours, appliquée au texte décodé
+    clean_text = pdf_extractor._WS_RE.sub(' ', pdf_extractor._BINARY_CLEAN_RE.sub(' ', text))
+    blocks = [
+        block for block in pdf_extractor._TEXT_BLOCK_RE.findall(clean_text)
+        if (len(block) - len(block.translate(pdf_extractor._NON_ALNUM_TABLE))) / len(block) > 0.4
+    ]
+    return "\n\n".join(blocks)
+
+def test_binary_fallback_collapses_non_breaking_spaces():
+    text = ("Réunion de projet\u00a0: nous avons présenté la nouvelle architecture "
+            "SharePoint\u00a0; le client a validé les maquettes avant la recette\u00a0!")
+
+    result = pdf_extractor._pipeline_binary_fallback(text.encode("utf-8"))
+    assert result == _str_binary_fallback(text)
+    assert result.startswith("Réunion de projet : nous avons") and result.endswith("recette !")
@@ -49,4 +49,11 @@ def test_extract_automatic_tags():
     
     # Tester l'extraction avec un seuil personnalisé
     high_threshold_tags = extract_automatic_tags(technical_text, threshold=0.5)
-    assert len(high_threshold_tags) <= len(tags)
\ No newline at end of file
+    assert len(high_threshold_tags) <= len(tags)
+
+def test_determine_content_type_sentence_length_bonus():
+    splitter = AdaptiveTextSplitter()
+
+    # Sans autre indice, la longueur moyenne des phrases départage les types
+    assert splitter._determine_content_type("Oui. Non. Peut-être.") == "list"
+    assert splitter._determine_content_type("x" * 400) == "long_form"
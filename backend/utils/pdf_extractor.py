@@ -5,11 +5,21 @@ avec fonctionnalités d'organisation et d'analyse de contenu.
 
 import os
 import re
-import tempfile
-from datetime import datetime, timedelta
+import atexit
+import hashlib
+import string
+import sys
+import threading
+from bisect import bisect_left, bisect_right
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from io import BytesIO
+from operator import itemgetter
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union
 
 # Configuration du logging
 logger = logging.getLogger(__name__)
@@ -39,18 +49,160 @@ except ImportError:
     logger.warning("python-docx n'est pas installé. L'extraction DOCX ne sera pas disponible.")
     DOCX_AVAILABLE = False
 
-def extract_text_from_pdf(pdf_data: bytes) -> Optional[str]:
+# Tentative d'importation de pyahocorasick (recherche multi-mots-clés en un seul passage)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    logger.info("pyahocorasick n'est pas installé. La recherche des sujets techniques utilisera des recherches successives.")
+    AHOCORASICK_AVAILABLE = False
+
+# Journalisation détaillée de l'extraction DOCX (désactivée par défaut)
+DOCX_DEBUG = os.getenv("DOCX_DEBUG", "false").lower() == "true"
+
+# Noms de mois et de jours reconnus dans les dates françaises
+_MONTH_NAMES = r'janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre'
+_WEEKDAY_NAMES = r'lundi|mardi|mercredi|jeudi|vendredi|samedi|dimanche'
+
+# Expressions régulières précompilées
+# Dates françaises dans les noms de fichiers, avec ou sans jour de la semaine
+_FILENAME_DATE_RE = re.compile(
+    r'(?:(?P<dow>' + _WEEKDAY_NAMES + r')\s+)?(?P<day>\d{1,2})\s+(?P<month>' + _MONTH_NAMES + r')\s+(?P<year>\d{4})',
+    re.IGNORECASE
+)
+
+# Mots candidats pour les tags
+_WORD_RE = re.compile(r'\b[a-zA-ZÀ-ÿ]{4,}\b')
+
+# Détection du type d'entrée (le nom du groupe correspond au type), appliquée au texte
+# déjà en minuscules : pas de repli de casse caractère par caractère
+_ENTRY_TYPE_RE = re.compile(
+    r'\b(?:(?P<formation>formation|cours|apprendre|étudier|apprentissage)'
+    r'|(?P<projet>projet|développement|application|implémentation|feature)'
+    r'|(?P<reflexion>réflexion|analyse|pensée|considération|bilan))\b'
+)
+
+# Extraction de secours à partir du contenu binaire
+_BINARY_CLEAN_RE = re.compile(r'[^\x20-\x7E\n\r\t\u00A0-\u00FF\u0100-\u017F]')
+_REPEATED_CHARS_RE = re.compile(r'([^\w\s])\1{3,}')
+_PARAGRAPH_SPLIT_RE = re.compile(r'\n\s*\n')
+_WS_RE = re.compile(r'\s+')
+_BLOCK_LETTERS = 'àáâäæçèéêëìíîïòóôöùúûüÿœÀÁÂÄÆÇÈÉÊËÌÍÎÏÒÓÔÖÙÚÛÜŸŒ'
+_TEXT_BLOCK_RE = re.compile(r'[A-Za-z0-9' + _BLOCK_LETTERS + r'\s.,;:!?«»()\[\]\'\"]{30,}')
+# Table supprimant les caractères alphanumériques des blocs (comptage en C via str.translate)
+_NON_ALNUM_TABLE = str.maketrans('', '', string.ascii_letters + string.digits + _BLOCK_LETTERS)
+
+# Variantes en mode bytes, appliquées directement au contenu binaire sans le décoder en entier.
+# Sont conservés l'ASCII imprimable, les espaces et les séquences UTF-8 de U+00A0 à U+017F ;
+# tout autre octet (contrôle, séquence invalide ou hors plage) est remplacé par un espace.
+_BINARY_JUNK_B_RE = re.compile(
+    rb'(?:[^\x09\x0a\x0d\x20-\x7e\x80-\xbf\xc2-\xc5]'
+    rb'|\xc2(?![\xa0-\xbf])|[\xc3-\xc5](?![\x80-\xbf])'
+    rb'|(?<!\xc2)(?<![\xc3-\xc5])[\x80-\xbf]|(?<=\xc2)[\x80-\x9f])+'
+)
+# En mode bytes, \s ne couvre que les espaces ASCII : l'espace insécable (U+00A0,
+# placée avant « : ; ! ? » en français) est réduite comme en mode str
+_WS_B_RE = re.compile(rb'(?:\s|\xc2\xa0)+')
+_TEXT_BLOCK_B_RE = re.compile(
+    rb'(?:[A-Za-z0-9\s.,;:!?()\[\]\'\"]|'
+    + b'|'.join(re.escape(c.encode('utf-8')) for c in _BLOCK_LETTERS + '«»')
+    + rb'){30,}'
+)
+
+# Caches des textes extraits, indexés par empreinte du contenu binaire
+_EXTRACTION_CACHE_SIZE = 128
+_PDF_CACHE: "OrderedDict[bytes, Optional[str]]" = OrderedDict()
+_DOCX_CACHE: "OrderedDict[bytes, Optional[str]]" = OrderedDict()
+
+# Taille maximale analysée par les extractions de secours sur le contenu binaire :
+# au-delà, la recherche de texte lisible dans les octets bruts n'apporte plus rien
+MAX_FALLBACK_BYTES = 2 * 1024 * 1024
+
+def _decode_binary_fallback(data: bytes) -> str:
+    """Décode (au plus MAX_FALLBACK_BYTES octets) un contenu binaire pour en extraire du texte."""
+    return data[:MAX_FALLBACK_BYTES].decode('utf-8', errors='ignore')
+
+def _content_key(data: bytes) -> bytes:
+    """Calcule l'empreinte (non cryptographique) d'un contenu binaire."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+def _cache_store(cache: OrderedDict, key: bytes, value: Optional[str]) -> Optional[str]:
+    """Enregistre une valeur dans un cache LRU borné et la retourne."""
+    cache[key] = value
+    if len(cache) > _EXTRACTION_CACHE_SIZE:
+        cache.popitem(last=False)
+    return value
+
+def extract_text_from_pdf(pdf_data: bytes, parallel_pages: bool = False) -> Optional[str]:
     """
     Extrait le texte d'un fichier PDF.
+    Le résultat est mis en cache selon l'empreinte du contenu.
     
     Args:
         pdf_data: Les données PDF sous forme de bytes
+        parallel_pages: Répartit les pages des documents volumineux entre plusieurs
+            processus (réservé aux traitements par lot ou en ligne de commande)
         
     Returns:
         str: Le texte extrait du document PDF
         None: En cas d'erreur
     """
-    # Normaliser l'entrée en BytesIO
+    key = _content_key(pdf_data)
+    if key in _PDF_CACHE:
+        _PDF_CACHE.move_to_end(key)
+        return _PDF_CACHE[key]
+    
+    return _cache_store(_PDF_CACHE, key, _extract_text_from_pdf(pdf_data, parallel_pages))
+
+# Nombre de pages à partir duquel l'extraction PyPDF2 peut être répartie entre plusieurs processus
+PDF_PARALLEL_MIN_PAGES = 32
+
+# Pool de processus de l'extraction par pages, créé à la première utilisation et
+# réutilisé. Les processus sont démarrés par "spawn" : un fork d'un processus
+# multi-thread (serveur, autres pools) peut hériter de verrous déjà pris.
+_page_pool: Optional[ProcessPoolExecutor] = None
+_page_pool_lock = threading.Lock()
+
+def _get_page_pool() -> ProcessPoolExecutor:
+    """Renvoie le pool de processus de l'extraction par pages."""
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is None:
+            _page_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1, mp_context=get_context("spawn"))
+            atexit.register(_page_pool.shutdown)
+        return _page_pool
+
+def _extract_pdf_page_range(pdf_data: bytes, start: int, stop: int) -> List[str]:
+    """Extrait le texte des pages [start, stop) d'un PDF (exécuté dans un processus de travail)."""
+    reader = PdfReader(BytesIO(pdf_data))
+    return [reader.pages[i].extract_text() or "" for i in range(start, stop)]
+
+def _extract_pages_in_parallel(pdf_data: bytes, page_count: int) -> List[str]:
+    """
+    Extrait le texte de toutes les pages d'un PDF en répartissant des plages de pages
+    entre plusieurs processus.
+    
+    L'extraction PyPDF2 est du Python pur limité par le CPU (et le lecteur partage un
+    flux unique) : des threads n'apporteraient rien, chaque processus relit donc le PDF.
+    
+    Args:
+        pdf_data: Les données PDF sous forme de bytes
+        page_count: Nombre de pages du document
+        
+    Returns:
+        List[str]: Le texte de chaque page, dans l'ordre du document
+    """
+    workers = min(os.cpu_count() or 1, page_count)
+    step = -(-page_count // workers)  # Division entière arrondie au supérieur
+    ranges = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+    
+    executor = _get_page_pool()
+    futures = [executor.submit(_extract_pdf_page_range, pdf_data, start, stop) for start, stop in ranges]
+    return [page_text for future in futures for page_text in future.result()]
+
+def _extract_text_from_pdf(pdf_data: bytes, parallel_pages: bool = False) -> Optional[str]:
+    """Extraction effective du texte d'un PDF (sans cache)."""
+    # Normaliser l'entrée en BytesIO (qui partage le tampon de bytes sans le copier)
     pdf_data_io = BytesIO(pdf_data)
     
     extracted_text = ""
@@ -60,12 +212,16 @@ def extract_text_from_pdf(pdf_data: bytes) -> Optional[str]:
     if PYPDF2_AVAILABLE:
         try:
             reader = PdfReader(pdf_data_io)
-            texts = []
-            
-            for page in reader.pages:
-                texts.append(page.extract_text())
-            
-            extracted_text = "\n\n".join([t for t in texts if t])
+
+            page_count = len(reader.pages)
+            if parallel_pages and page_count >= PDF_PARALLEL_MIN_PAGES and (os.cpu_count() or 1) > 1:
+                # Document volumineux : répartir les pages entre plusieurs processus
+                page_texts = _extract_pages_in_parallel(pdf_data, page_count)
+            else:
+                page_texts = (page.extract_text() for page in reader.pages)
+
+            # Un seul assemblage, les pages vides étant écartées au passage
+            extracted_text = "\n\n".join(filter(None, page_texts))
             
             # Si l'extraction a réussi, retourner le texte
             if extracted_text.strip():
@@ -75,33 +231,24 @@ def extract_text_from_pdf(pdf_data: bytes) -> Optional[str]:
             logger.info("PyPDF2 n'a pas pu extraire de texte, essai avec pdfminer...")
         except Exception as e:
             last_error = str(e)
-            logger.error(f"Erreur lors de l'extraction avec PyPDF2: {e}")
+            logger.error("Erreur lors de l'extraction avec PyPDF2: %s", e)
     
     # Essayer avec pdfminer.six s'il est disponible
     if PDFMINER_AVAILABLE:
         try:
-            # pdfminer nécessite un fichier, donc nous devons sauvegarder les données temporairement
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-                # Revenir au début du BytesIO
-                pdf_data_io.seek(0)
-                tmp_file.write(pdf_data_io.read())
-                tmp_path = tmp_file.name
-            
-            try:
-                extracted_text = pdfminer_extract_text(tmp_path)
-            finally:
-                # Nettoyer le fichier temporaire
-                if os.path.exists(tmp_path):
-                    os.unlink(tmp_path)
+            # pdfminer accepte un objet fichier : relire le même BytesIO depuis le début,
+            # sans copie sur disque ni en mémoire
+            pdf_data_io.seek(0)
+            extracted_text = pdfminer_extract_text(pdf_data_io)
             
             return extracted_text
         
         except PDFSyntaxError as e:
             last_error = f"Erreur de syntaxe PDF: {str(e)}"
-            logger.error(f"Erreur de syntaxe PDF: {e}")
+            logger.error("Erreur de syntaxe PDF: %s", e)
         except Exception as e:
             last_error = str(e)
-            logger.error(f"Erreur lors de l'extraction avec pdfminer: {e}")
+            logger.error("Erreur lors de l'extraction avec pdfminer: %s", e)
     
     # Si aucune méthode n'a fonctionné, retourner None
     if not extracted_text:
@@ -112,9 +259,35 @@ def extract_text_from_pdf(pdf_data: bytes) -> Optional[str]:
     
     return extracted_text
 
+def extract_many(pdfs: List[bytes], max_workers: Optional[int] = None) -> List[Optional[str]]:
+    """
+    Extrait le texte de plusieurs fichiers PDF en parallèle.
+    
+    L'analyse des PDF est limitée par le CPU : un pool de processus permet
+    d'utiliser tous les cœurs disponibles malgré le GIL.
+    
+    Args:
+        pdfs: Liste des données PDF sous forme de bytes
+        max_workers: Nombre maximal de processus (par défaut: nombre de CPU)
+        
+    Returns:
+        List[Optional[str]]: Le texte extrait de chaque PDF, dans l'ordre d'entrée
+    """
+    if not pdfs:
+        return []
+    
+    # Un seul document : répartir plutôt ses pages entre les processus
+    if len(pdfs) == 1:
+        return [extract_text_from_pdf(pdfs[0], parallel_pages=True)]
+    
+    # "spawn" comme les autres pools du module : pas de fork d'un processus multi-thread
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=get_context("spawn")) as executor:
+        return list(executor.map(extract_text_from_pdf, pdfs, chunksize=4))
+
 def extract_text_from_docx(docx_data: bytes) -> Optional[str]:
     """
     Extrait le texte d'un fichier DOCX.
+    Le résultat est mis en cache selon l'empreinte du contenu.
     
     Args:
         docx_data: Les données DOCX sous forme de bytes
@@ -123,6 +296,15 @@ def extract_text_from_docx(docx_data: bytes) -> Optional[str]:
         str: Le texte extrait du document DOCX
         None: En cas d'erreur
     """
+    key = _content_key(docx_data)
+    if key in _DOCX_CACHE:
+        _DOCX_CACHE.move_to_end(key)
+        return _DOCX_CACHE[key]
+    
+    return _cache_store(_DOCX_CACHE, key, _extract_text_from_docx(docx_data))
+
+def _extract_text_from_docx(docx_data: bytes) -> Optional[str]:
+    """Extraction effective du texte d'un DOCX (sans cache)."""
     if not DOCX_AVAILABLE:
         logger.error("[DOCX_DEBUG] python-docx n'est pas installé, impossible d'extraire le texte du DOCX")
         
@@ -130,17 +312,16 @@ def extract_text_from_docx(docx_data: bytes) -> Optional[str]:
         # Pour éviter les erreurs "No /Root object! - Is this really a PDF?" quand on importe un DOCX
         try:
             # Rechercher du texte dans le contenu binaire (méthode de secours)
-            text_content = docx_data.decode('utf-8', errors='ignore')
+            text_content = _decode_binary_fallback(docx_data)
             
             # Nettoyer le texte (enlever les caractères non imprimables)
-            import re
-            text_content = re.sub(r'[^\x20-\x7E\n\r\t\u00A0-\u00FF\u0100-\u017F]', ' ', text_content)
+            text_content = _BINARY_CLEAN_RE.sub(' ', text_content)
             
             # Supprimer les longues séquences de caractères répétés souvent présentes dans les fichiers binaires
-            text_content = re.sub(r'([^\w\s])\1{3,}', r'\1\1', text_content)
+            text_content = _REPEATED_CHARS_RE.sub(r'\1\1', text_content)
             
             # Essayer d'identifier et d'extraire des paragraphes significatifs
-            paragraphs = [p.strip() for p in re.split(r'\n\s*\n', text_content) if len(p.strip()) > 20]
+            paragraphs = [p.strip() for p in _PARAGRAPH_SPLIT_RE.split(text_content) if len(p.strip()) > 20]
             
             if paragraphs:
                 logger.info("[DOCX_DEBUG] Extraction de secours utilisée: texte extrait du contenu binaire")
@@ -149,118 +330,96 @@ def extract_text_from_docx(docx_data: bytes) -> Optional[str]:
                 logger.warning("[DOCX_DEBUG] Extraction de secours: aucun paragraphe significatif trouvé")
                 return "Ce document semble être au format DOCX mais n'a pas pu être analysé correctement.\n\nVeuillez installer python-docx pour une meilleure prise en charge des documents DOCX."
         except Exception as fallback_error:
-            logger.error(f"[DOCX_DEBUG] Erreur lors de l'extraction de secours: {str(fallback_error)}")
+            logger.error("[DOCX_DEBUG] Erreur lors de l'extraction de secours: %s", fallback_error)
             return "Impossible d'extraire le contenu de ce document DOCX. Veuillez installer python-docx pour la prise en charge des documents DOCX."
     
     try:
-        # Sauvegarder les données dans un fichier temporaire
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".docx") as tmp_file:
-            tmp_file.write(docx_data)
-            tmp_path = tmp_file.name
-            logger.info(f"[DOCX_DEBUG] Fichier temporaire créé: {tmp_path}")
+        # Ouvrir le document avec python-docx directement depuis la mémoire
+        doc = docx.Document(BytesIO(docx_data))
         
-        try:
-            # Ouvrir le document avec python-docx
-            logger.info(f"[DOCX_DEBUG] Tentative d'ouverture du fichier DOCX: {tmp_path}")
-            doc = docx.Document(tmp_path)
-            logger.info(f"[DOCX_DEBUG] Document DOCX ouvert avec succès: {len(doc.paragraphs)} paragraphes")
-            
-            # Méthode améliorée pour extraire le texte
-            full_text = []
-            
-            # Extraire le texte de chaque paragraphe
-            for i, para in enumerate(doc.paragraphs):
-                if para.text.strip():  # Ignorer les paragraphes vides
-                    full_text.append(para.text.strip())
-                    if i < 3:  # Afficher les 3 premiers paragraphes pour débogage
-                        logger.info(f"[DOCX_DEBUG] Paragraphe {i+1}: '{para.text[:50]}...' ({len(para.text)} caractères)")
-            
-            logger.info(f"[DOCX_DEBUG] {len(full_text)} paragraphes extraits du document")
-            
-            # Extraire le texte des tableaux
-            table_count = 0
-            for table in doc.tables:
-                table_count += 1
-                for row in table.rows:
-                    row_cells = [cell.text.strip() for cell in row.cells if cell.text.strip()]
-                    if row_cells:
-                        full_text.append(" | ".join(row_cells))
-            
-            logger.info(f"[DOCX_DEBUG] {table_count} tableaux extraits du document")
-            
-            # Joindre tous les paragraphes avec des sauts de ligne
-            extracted_text = "\n".join(full_text)
+        # doc.paragraphs reparcourt le XML à chaque accès : une seule lecture
+        paragraphs = doc.paragraphs
+        paragraph_texts = [para.text for para in paragraphs]
+        if DOCX_DEBUG:
+            logger.info("[DOCX_DEBUG] Document DOCX ouvert avec succès: %d paragraphes", len(paragraphs))
+        
+        # Extraire le texte de chaque paragraphe (en ignorant les paragraphes vides)
+        full_text = [stripped for stripped in (text.strip() for text in paragraph_texts) if stripped]
+        paragraph_count = len(full_text)
+        
+        # Extraire le texte des tableaux
+        table_count = 0
+        for table in doc.tables:
+            table_count += 1
+            for row in table.rows:
+                row_cells = [cell_text for cell_text in (cell.text.strip() for cell in row.cells) if cell_text]
+                if row_cells:
+                    full_text.append(" | ".join(row_cells))
+        
+        # Joindre tous les paragraphes avec des sauts de ligne
+        extracted_text = "\n".join(full_text)
+        
+        # Vérification de sécurité pour garantir un contenu minimal
+        if not extracted_text or len(extracted_text) < 10:
+            logger.warning("[DOCX_DEBUG] Le texte extrait est trop court (%d caractères)", len(extracted_text))
             
-            # Vérification de sécurité pour garantir un contenu minimal
-            if not extracted_text or len(extracted_text) < 10:
-                logger.warning(f"[DOCX_DEBUG] Le texte extrait est trop court ({len(extracted_text) if extracted_text else 0} caractères)")
-                
-                # Essayer une méthode alternative avec une extraction paragraphe par paragraphe
-                alt_text = []
-                for para in doc.paragraphs:
-                    para_text = para.text
-                    alt_text.append(para_text)
-                
-                # Essayer également l'extraction via les runs (portions de texte formatées)
-                run_text = []
-                for para in doc.paragraphs:
-                    para_runs = []
-                    for run in para.runs:
-                        if run.text.strip():
-                            para_runs.append(run.text)
-                    if para_runs:
-                        run_text.append(" ".join(para_runs))
-                
-                # Comparer les résultats des différentes méthodes
-                full_alt_text = "\n".join(alt_text)
-                full_run_text = "\n".join(run_text)
-                
-                logger.info(f"[DOCX_DEBUG] Comparaison des méthodes d'extraction:")
-                logger.info(f"[DOCX_DEBUG] - Méthode standard: {len(extracted_text)} caractères")
-                logger.info(f"[DOCX_DEBUG] - Méthode alternative (paragraphes): {len(full_alt_text)} caractères")
-                logger.info(f"[DOCX_DEBUG] - Méthode alternative (runs): {len(full_run_text)} caractères")
-                
-                # Choisir la méthode qui produit le texte le plus long
-                if len(full_alt_text) > len(extracted_text) and len(full_alt_text) > len(full_run_text):
-                    extracted_text = full_alt_text
-                    logger.info(f"[DOCX_DEBUG] Méthode alternative (paragraphes) utilisée: {len(extracted_text)} caractères")
-                elif len(full_run_text) > len(extracted_text):
-                    extracted_text = full_run_text
-                    logger.info(f"[DOCX_DEBUG] Méthode alternative (runs) utilisée: {len(extracted_text)} caractères")
+            # Méthode alternative : texte brut des paragraphes, déjà lu ci-dessus
+            full_alt_text = "\n".join(paragraph_texts)
             
-            # Ajouter le nom du fichier en tant que note
-            if extracted_text:
-                extracted_text += f"\n\nNote: Ce document a été importé depuis un fichier DOCX."
+            # Essayer également l'extraction via les runs (portions de texte formatées).
+            # Le texte d'un paragraphe étant la concaténation de ses runs, seuls les
+            # paragraphes non vides lus ci-dessus sont reparcourus
+            run_text = []
+            for para in (para for para, text in zip(paragraphs, paragraph_texts) if text):
+                para_runs = [run.text for run in para.runs if run.text.strip()]
+                if para_runs:
+                    run_text.append(" ".join(para_runs))
+            full_run_text = "\n".join(run_text)
             
-            # Log des informations sur le texte extrait
-            logger.info(f"[DOCX_DEBUG] Texte extrait du DOCX: {len(extracted_text)} caractères")
-            if extracted_text:
-                logger.info(f"[DOCX_DEBUG] Début du texte: {extracted_text[:100]}...")
+            if DOCX_DEBUG:
+                logger.info(
+                    "[DOCX_DEBUG] Comparaison des méthodes d'extraction: standard=%d, paragraphes=%d, runs=%d caractères",
+                    len(extracted_text), len(full_alt_text), len(full_run_text)
+                )
             
-            return extracted_text
-        finally:
-            # Nettoyer le fichier temporaire
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
-                logger.info(f"[DOCX_DEBUG] Fichier temporaire supprimé: {tmp_path}")
+            # Choisir la méthode qui produit le texte le plus long
+            if len(full_alt_text) > len(extracted_text) and len(full_alt_text) > len(full_run_text):
+                extracted_text = full_alt_text
+                logger.info("[DOCX_DEBUG] Méthode alternative (paragraphes) utilisée: %d caractères", len(extracted_text))
+            elif len(full_run_text) > len(extracted_text):
+                extracted_text = full_run_text
+                logger.info("[DOCX_DEBUG] Méthode alternative (runs) utilisée: %d caractères", len(extracted_text))
+        
+        # Ajouter le nom du fichier en tant que note
+        if extracted_text:
+            extracted_text += "\n\nNote: Ce document a été importé depuis un fichier DOCX."
+        
+        # Log des informations sur le texte extrait
+        logger.info(
+            "[DOCX_DEBUG] Texte extrait du DOCX: %d caractères (%d paragraphes, %d tableaux)",
+            len(extracted_text), paragraph_count, table_count
+        )
+        if DOCX_DEBUG and extracted_text:
+            logger.info("[DOCX_DEBUG] Début du texte: %.100s...", extracted_text)
+        
+        return extracted_text
     
     except Exception as e:
-        logger.error(f"[DOCX_DEBUG] Erreur lors de l'extraction du texte du DOCX: {e}")
+        logger.error("[DOCX_DEBUG] Erreur lors de l'extraction du texte du DOCX: %s", e)
         import traceback
-        logger.error(f"[DOCX_DEBUG] Traceback: {traceback.format_exc()}")
+        logger.error("[DOCX_DEBUG] Traceback: %s", traceback.format_exc())
         
         # Extraction de secours en cas d'erreur
         try:
             # Rechercher du texte dans le contenu binaire
-            text_content = docx_data.decode('utf-8', errors='ignore')
+            text_content = _decode_binary_fallback(docx_data)
             
             # Nettoyer le texte
-            import re
-            text_content = re.sub(r'[^\x20-\x7E\n\r\t\u00A0-\u00FF\u0100-\u017F]', ' ', text_content)
-            text_content = re.sub(r'([^\w\s])\1{3,}', r'\1\1', text_content)
+            text_content = _BINARY_CLEAN_RE.sub(' ', text_content)
+            text_content = _REPEATED_CHARS_RE.sub(r'\1\1', text_content)
             
             # Extraire des paragraphes significatifs
-            paragraphs = [p.strip() for p in re.split(r'\n\s*\n', text_content) if len(p.strip()) > 20]
+            paragraphs = [p.strip() for p in _PARAGRAPH_SPLIT_RE.split(text_content) if len(p.strip()) > 20]
             
             if paragraphs:
                 logger.info("[DOCX_DEBUG] Extraction de secours après erreur: texte extrait du contenu binaire")
@@ -270,6 +429,121 @@ def extract_text_from_docx(docx_data: bytes) -> Optional[str]:
             
         return "Impossible d'extraire le contenu de ce document DOCX suite à une erreur."
 
+# Dictionnaire de conversion mois français -> numéro
+_MONTHS = {
+    'janvier': 1, 'février': 2, 'mars': 3, 'avril': 4,
+    'mai': 5, 'juin': 6, 'juillet': 7, 'août': 8,
+    'septembre': 9, 'octobre': 10, 'novembre': 11, 'décembre': 12
+}
+
+_WEEKDAY_TO_NUMBER = {'lundi': 0, 'mardi': 1, 'mercredi': 2, 'jeudi': 3, 'vendredi': 4, 'samedi': 5, 'dimanche': 6}
+
+# Formes de dates relatives (aujourd'hui, la semaine dernière, lundi prochain, etc.)
+_RELATIVE_DATES_PATTERN = (
+    # Aujourd'hui, hier, demain, etc.
+    r"(?P<rel_day>\b(?:aujourd'hui|hier|avant[\s-]hier|demain|après[\s-]demain)\b)"
+    # La semaine dernière, le mois prochain, etc.
+    r'|(?P<rel_period>\b(?:la\s+semaine\s+dernière|la\s+semaine\s+prochaine|le\s+mois\s+dernier|le\s+mois\s+prochain)\b)'
+    # Jour de la semaine relatif (lundi dernier, etc.)
+    r'|(?P<rel_weekday>\b(?P<rel_weekday_day>' + _WEEKDAY_NAMES + r')\s+(?P<rel_weekday_dir>dernier|prochain)\b)'
+)
+
+# Toutes les formes de dates (absolues et relatives) en une seule alternative,
+# afin de parcourir le texte une seule fois. Le groupe nommé indique le format.
+_ALL_DATES_RE = re.compile(
+    # Premier caractère possible d'une date : écarte d'emblée la plupart des positions
+    r'(?=[\dadhjlmsv])(?:'
+    # Format français avec jour de la semaine
+    r'(?P<fr_wkday>(?:' + _WEEKDAY_NAMES + r')\s+(?P<fr_wkday_day>\d{1,2})\s+'
+    r'(?P<fr_wkday_month>' + _MONTH_NAMES + r')\s+(?P<fr_wkday_year>\d{4}))'
+    # Format français sans jour de la semaine
+    r'|(?P<fr>(?P<fr_day>\d{1,2})\s+(?P<fr_month>' + _MONTH_NAMES + r')\s+(?P<fr_year>\d{4}))'
+    # Format ISO
+    r'|(?P<iso>(?P<iso_year>\d{4})[/-](?P<iso_month>\d{1,2})[/-](?P<iso_day>\d{1,2}))'
+    # Format européen
+    r'|(?P<eu>(?P<eu_day>\d{1,2})[/-](?P<eu_month>\d{1,2})[/-](?P<eu_year>\d{4}))'
+    # Dates relatives
+    r'|' + _RELATIVE_DATES_PATTERN + r')',
+    re.IGNORECASE
+)
+
+# Toutes les dates absolues contiennent des chiffres : sans chiffre dans le texte,
+# seules les formes relatives sont recherchées
+_RELATIVE_DATES_RE = re.compile(r'(?=[adhjlmsv])(?:' + _RELATIVE_DATES_PATTERN + r')', re.IGNORECASE)
+_DIGIT_RE = re.compile(r'\d')
+
+# Les composants des dates absolues sont lus dans les groupes nommés <format>_day,
+# <format>_month et <format>_year, où <format> est le nom du groupe englobant
+
+def _parse_french_date(match: re.Match, today) -> str:
+    """Convertit une date française ("[Jeudi] 19 septembre 2024") au format ISO."""
+    name = match.lastgroup
+    month = _MONTHS.get(match.group(name + '_month').lower(), 1)
+    # La construction de la date valide jour et mois (lève ValueError sinon)
+    return date(int(match.group(name + '_year')), month, int(match.group(name + '_day'))).isoformat()
+
+def _parse_numeric_date(match: re.Match, today) -> str:
+    """Convertit une date ISO (YYYY-MM-DD) ou européenne (DD/MM/YYYY) au format ISO."""
+    name = match.lastgroup
+    # La construction de la date valide jour et mois (lève ValueError sinon)
+    return date(int(match.group(name + '_year')), int(match.group(name + '_month')),
+                int(match.group(name + '_day'))).isoformat()
+
+def _parse_relative_date(match: re.Match, today) -> str:
+    """Convertit une date relative (hier, lundi dernier, etc.) en date ISO."""
+    relative_date_str = match.group(0).lower()
+    relative_date = today  # Par défaut
+    
+    if 'aujourd\'hui' in relative_date_str:
+        relative_date = today
+    elif 'hier' in relative_date_str:
+        relative_date = today - timedelta(days=1)
+    elif 'avant-hier' in relative_date_str:
+        relative_date = today - timedelta(days=2)
+    elif 'demain' in relative_date_str:
+        relative_date = today + timedelta(days=1)
+    elif 'après-demain' in relative_date_str:
+        relative_date = today + timedelta(days=2)
+    elif 'semaine dernière' in relative_date_str:
+        relative_date = today - timedelta(days=7)
+    elif 'semaine prochaine' in relative_date_str:
+        relative_date = today + timedelta(days=7)
+    elif 'mois dernier' in relative_date_str:
+        # Simplification: 30 jours
+        relative_date = today - timedelta(days=30)
+    elif 'mois prochain' in relative_date_str:
+        # Simplification: 30 jours
+        relative_date = today + timedelta(days=30)
+
+    return relative_date.strftime("%Y-%m-%d")
+
+def _parse_relative_weekday(match: re.Match, today) -> str:
+    """Convertit un jour de la semaine relatif (lundi dernier, jeudi prochain) en date ISO."""
+    # Le jour et le sens sont lus directement dans les groupes capturés
+    target_weekday = _WEEKDAY_TO_NUMBER[match.group('rel_weekday_day').lower()]
+    
+    # Calculer les jours jusqu'au prochain jour de la semaine spécifié
+    days_ahead = target_weekday - today.weekday()
+    if days_ahead <= 0:  # Target day already happened this week
+        days_ahead += 7
+    
+    if match.group('rel_weekday_dir').lower() == 'dernier':
+        # La semaine dernière
+        days_ahead -= 14  # Aller deux semaines en arrière puis avancer
+    
+    return (today + timedelta(days=days_ahead)).strftime("%Y-%m-%d")
+
+# Fonction de conversion et nature (relative ou non) pour chaque format de date
+_DATE_HANDLERS = {
+    "fr_wkday": (_parse_french_date, False),
+    "fr": (_parse_french_date, False),
+    "iso": (_parse_numeric_date, False),
+    "eu": (_parse_numeric_date, False),
+    "rel_day": (_parse_relative_date, True),
+    "rel_period": (_parse_relative_date, True),
+    "rel_weekday": (_parse_relative_weekday, True),
+}
+
 def extract_dates_from_text(text: str) -> List[Dict[str, Any]]:
     """
     Recherche et extrait les dates présentes dans le texte avec des informations contextuelles.
@@ -286,197 +560,62 @@ def extract_dates_from_text(text: str) -> List[Dict[str, Any]]:
             - is_primary: si cette date est susceptible d'être la date principale
             - context: contexte autour de la date
     """
-    # Pattern pour les dates au format français et international
-    date_patterns = [
-        # Format français avec jour de la semaine
-        r'(Lundi|Mardi|Mercredi|Jeudi|Vendredi|Samedi|Dimanche)\s+(\d{1,2})\s+(janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)\s+(\d{4})',
-        # Format français sans jour de la semaine
-        r'(\d{1,2})\s+(janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)\s+(\d{4})',
-        # Format ISO
-        r'(\d{4})[/-](\d{1,2})[/-](\d{1,2})',
-        # Format européen
-        r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})',
-    ]
-    
-    # Marqueurs temporels relatifs
-    relative_time_patterns = [
-        # Aujourd'hui, hier, demain, etc.
-        r'\b(aujourd\'hui|hier|avant[\s-]hier|demain|après[\s-]demain)\b',
-        # La semaine dernière, le mois prochain, etc.
-        r'\b(la\s+semaine\s+dernière|la\s+semaine\s+prochaine|le\s+mois\s+dernier|le\s+mois\s+prochain)\b',
-        # Jour de la semaine relatif (lundi dernier, etc.)
-        r'\b(lundi|mardi|mercredi|jeudi|vendredi|samedi|dimanche)(\s+dernier|\s+prochain)\b'
-    ]
-    
-    # Dictionnaire de conversion mois français -> numéro
-    month_to_number = {
-        'janvier': '01', 'février': '02', 'mars': '03', 'avril': '04',
-        'mai': '05', 'juin': '06', 'juillet': '07', 'août': '08',
-        'septembre': '09', 'octobre': '10', 'novembre': '11', 'décembre': '12'
-    }
-    
     # Rechercher toutes les occurrences potentielles de dates
     dates_found = []
+    today = datetime.now().date()
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
     
     # Logging pour le debug
-    logger.info(f"Texte à analyser pour les dates: {text[:200]}..." if len(text) > 200 else text)
+    logger.debug("Texte à analyser pour les dates: %.200s", text)
+    
+    # Un seul parcours du texte pour les dates absolues et relatives
+    # (motif réduit aux dates relatives si le texte ne contient aucun chiffre)
+    dates_re = _ALL_DATES_RE if _DIGIT_RE.search(text) else _RELATIVE_DATES_RE
+    for match in dates_re.finditer(text):
+        parse_date, is_relative = _DATE_HANDLERS[match.lastgroup]
+        date_str = match.group(0)
+        if is_relative:
+            date_str = date_str.lower()
+        position = match.start()
+        
+        if debug_enabled:
+            logger.debug("Date %s trouvée: %s à la position %d", 'relative' if is_relative else 'absolue', date_str, position)
+        
+        # Convertir la date au format ISO (YYYY-MM-DD)
+        try:
+            iso_date = parse_date(match, today)
+        except ValueError:
+            # Date invalide, ignorer
+            continue
+        except Exception as e:
+            logger.error("Erreur lors de la conversion de la date: %s", e)
+            continue
+        
+        # Extraire le contexte (30 caractères avant et après la date), pour les dates valides seulement
+        start_context = max(0, position - 30)
+        end_context = min(len(text), position + len(date_str) + 30)
+        context = text[start_context:end_context]
+        
+        # Analyser le contexte pour déterminer l'importance de cette date
+        score, is_primary = analyze_date_context(date_str, context, position, is_relative=is_relative,
+                                                 date_offset=position - start_context)
+        
+        dates_found.append({
+            "position": position,
+            "date": iso_date,
+            "original": date_str,
+            "score": score,
+            "is_primary": is_primary,
+            "context": context
+        })
+    
+    # Compatibilité avec l'ancienne structure : les dates sont relevées dans l'ordre du
+    # texte, la liste des positions est donc déjà triée
+    date_positions = [(date["position"], date["date"]) for date in dates_found]
     
-    # 1. Extraire les dates absolues
-    for pattern in date_patterns:
-        for match in re.finditer(pattern, text, re.IGNORECASE):
-            date_str = match.group(0)
-            position = match.start()
-            
-            logger.info(f"Date absolue trouvée: {date_str} à la position {position}")
-            
-            # Extraire le contexte (30 caractères avant et après la date)
-            start_context = max(0, position - 30)
-            end_context = min(len(text), position + len(date_str) + 30)
-            context = text[start_context:end_context]
-            
-            # Convertir la date au format ISO (YYYY-MM-DD)
-            try:
-                # Vérifier si c'est une date en français avec un mois en lettres
-                has_month_name = False
-                for month_name in month_to_number.keys():
-                    if month_name in date_str.lower():
-                        has_month_name = True
-                        break
-                
-                if has_month_name:
-                    # Format français avec ou sans jour de la semaine
-                    parts = date_str.split()
-                    
-                    # Extraire les composants en fonction du format
-                    if parts[0].lower() in ['lundi', 'mardi', 'mercredi', 'jeudi', 'vendredi', 'samedi', 'dimanche']:
-                        # Avec jour de la semaine
-                        day = parts[1]
-                        month = parts[2].lower()
-                        year = parts[3]
-                    else:
-                        # Sans jour de la semaine
-                        day = parts[0]
-                        month = parts[1].lower()
-                        year = parts[2]
-                    
-                    month_num = month_to_number.get(month, '01')
-                    iso_date = f"{year}-{month_num}-{day.zfill(2)}"
-                elif '-' in date_str or '/' in date_str:
-                    # Format ISO ou européen
-                    separator = '-' if '-' in date_str else '/'
-                    parts = date_str.split(separator)
-                    
-                    if len(parts[0]) == 4:
-                        # Format ISO (YYYY-MM-DD)
-                        year = parts[0]
-                        month = parts[1].zfill(2)
-                        day = parts[2].zfill(2)
-                    else:
-                        # Format européen (DD-MM-YYYY)
-                        day = parts[0].zfill(2)
-                        month = parts[1].zfill(2)
-                        year = parts[2]
-                    
-                    iso_date = f"{year}-{month}-{day}"
-                else:
-                    # Format non reconnu
-                    continue
-                
-                # Vérifier si la date est valide
-                datetime.strptime(iso_date, "%Y-%m-%d")
-                
-                # Analyser le contexte pour déterminer l'importance de cette date
-                score, is_primary = analyze_date_context(date_str, context, position)
-                
-                dates_found.append({
-                    "position": position,
-                    "date": iso_date,
-                    "original": date_str,
-                    "score": score,
-                    "is_primary": is_primary,
-                    "context": context
-                })
-                
-            except ValueError:
-                # Date invalide, ignorer
-                continue
-    
-    # 2. Extraire les dates relatives (aujourd'hui, hier, etc.)
-    today = datetime.now().date()
-    for pattern in relative_time_patterns:
-        for match in re.finditer(pattern, text, re.IGNORECASE):
-            relative_date_str = match.group(0).lower()
-            position = match.start()
-            
-            logger.info(f"Date relative trouvée: {relative_date_str} à la position {position}")
-            
-            # Extraire le contexte
-            start_context = max(0, position - 30)
-            end_context = min(len(text), position + len(relative_date_str) + 30)
-            context = text[start_context:end_context]
-            
-            # Convertir la date relative en date absolue
-            relative_date = today  # Par défaut
-            
-            try:
-                if 'aujourd\'hui' in relative_date_str:
-                    relative_date = today
-                elif 'hier' in relative_date_str:
-                    relative_date = today - timedelta(days=1)
-                elif 'avant-hier' in relative_date_str:
-                    relative_date = today - timedelta(days=2)
-                elif 'demain' in relative_date_str:
-                    relative_date = today + timedelta(days=1)
-                elif 'après-demain' in relative_date_str:
-                    relative_date = today + timedelta(days=2)
-                elif 'semaine dernière' in relative_date_str:
-                    relative_date = today - timedelta(days=7)
-                elif 'semaine prochaine' in relative_date_str:
-                    relative_date = today + timedelta(days=7)
-                elif 'mois dernier' in relative_date_str:
-                    # Simplification: 30 jours
-                    relative_date = today - timedelta(days=30)
-                elif 'mois prochain' in relative_date_str:
-                    # Simplification: 30 jours
-                    relative_date = today + timedelta(days=30)
-                elif any(day in relative_date_str for day in ['lundi', 'mardi', 'mercredi', 'jeudi', 'vendredi', 'samedi', 'dimanche']):
-                    # Traitement des jours de la semaine relatifs
-                    day_names = {'lundi': 0, 'mardi': 1, 'mercredi': 2, 'jeudi': 3, 'vendredi': 4, 'samedi': 5, 'dimanche': 6}
-                    
-                    # Trouver quel jour est mentionné
-                    day_name = next(day for day in day_names.keys() if day in relative_date_str)
-                    target_weekday = day_names[day_name]
-                    
-                    # Calculer les jours jusqu'au prochain jour de la semaine spécifié
-                    days_ahead = target_weekday - today.weekday()
-                    if days_ahead <= 0:  # Target day already happened this week
-                        days_ahead += 7
-                    
-                    if 'dernier' in relative_date_str:
-                        # La semaine dernière
-                        days_ahead -= 14  # Aller deux semaines en arrière puis avancer
-                    
-                    relative_date = today + timedelta(days=days_ahead)
-                
-                # Ajouter cette date avec un score élevé (date relative = haute importance)
-                iso_date = relative_date.strftime("%Y-%m-%d")
-                score, is_primary = analyze_date_context(relative_date_str, context, position, is_relative=True)
-                
-                dates_found.append({
-                    "position": position,
-                    "date": iso_date,
-                    "original": relative_date_str,
-                    "score": score,
-                    "is_primary": is_primary,
-                    "context": context
-                })
-                
-            except Exception as e:
-                logger.error(f"Erreur lors de la conversion de la date relative: {str(e)}")
-                continue
-    
-    # Trier les dates par score puis par position
-    dates_found.sort(key=lambda x: (-x["score"], x["position"]))
+    # Trier les dates par score décroissant ; le tri étant stable, les ex aequo restent
+    # dans l'ordre du texte (toutes les dates sont conservées pour les entrées secondaires)
+    dates_found.sort(key=itemgetter("score"), reverse=True)
     
     # Simplification: si plusieurs dates ont un score élevé (> 70), marquer seulement la première comme primaire
     if dates_found and dates_found[0]["score"] > 70:
@@ -484,91 +623,51 @@ def extract_dates_from_text(text: str) -> List[Dict[str, Any]]:
         for i in range(1, len(dates_found)):
             dates_found[i]["is_primary"] = False
     
-    # Compatibilité avec l'ancienne structure
-    date_positions = [(date["position"], date["date"]) for date in dates_found]
-    date_positions.sort(key=lambda x: x[0])  # Trier par position
-    
-    logger.info(f"Dates analysées: {dates_found}")
+    logger.debug("Dates analysées: %s", dates_found)
     return date_positions, dates_found
 
-def extract_date_from_filename(filename: str) -> Optional[str]:
+# Indicateurs de contexte, évalués en un seul appel sur le texte qui précède la date :
+# chaque indicateur est une assertion (?=...) optionnelle, dont le groupe nommé n'est
+# capturé que si le préfixe se termine comme l'indicateur l'exige
+_DATE_CONTEXT_RE = re.compile(
+    # Facteurs qui augmentent l'importance
+    r'(?=(?P<sentence>[^.]*\Z))?'  # Date au début d'une phrase
+    r'(?=(?P<start>\Z))?'  # Date au début du texte
+    r'(?=(?P<le>(?s:.*)le \Z))?'  # "Le" avant la date
+    r'(?=(?P<date_label>(?s:.*)date.*:.*\Z))?'  # Format "Date: ..."
+    r'(?=(?P<day_label>(?s:.*)jour.*:.*\Z))?'  # Format "Jour: ..."
+    r'(?=(?P<after_period>(?s:.*)\. \Z))?'  # Date juste après un point (début de phrase)
+    # Facteurs qui diminuent l'importance (références au passé/futur)
+    r'(?=(?P<depuis>(?s:.*)depuis (?:le|la|les) \Z))?'  # "depuis le..."
+    r'(?=(?P<avant>(?s:.*)avant (?:le|la|les) \Z))?'  # "avant le..."
+    r'(?=(?P<apres>(?s:.*)après (?:le|la|les) \Z))?'  # "après le..."
+    r"(?=(?P<jusqu>(?s:.*)jusqu'(?:au|à la) \Z))?"  # "jusqu'au..."
+    r'(?=(?P<a_partir>(?s:.*)à partir (?:du|de la) \Z))?'  # "à partir du..."
+    r'(?=(?P<commence>(?s:.*)commencé (?:le|la|en) \Z))?'  # "commencé le..."
+    r'(?=(?P<termine>(?s:.*)terminé (?:le|la|en) \Z))?',  # "terminé le..."
+    re.IGNORECASE
+)
+
+# Points associés à chaque indicateur de contexte
+_DATE_CONTEXT_POINTS = {
+    "sentence": 25, "start": 40, "le": 10, "date_label": 30, "day_label": 30, "after_period": 20,
+    "depuis": -20, "avant": -20, "apres": -20, "jusqu": -15, "a_partir": -15,
+    "commence": -10, "termine": -10,
+}
+
+@lru_cache(maxsize=1024)
+def _date_context_points(prefix: str) -> int:
     """
-    Extrait une date à partir du nom de fichier.
-    Supporte les formats comme "Jeudi 19 septembre 2024".
+    Somme des points des indicateurs de contexte vérifiés par le texte qui précède une date.
     
-    Args:
-        filename: Le nom du fichier
-        
-    Returns:
-        str: Date au format ISO (YYYY-MM-DD), ou None si aucune date n'est trouvée
+    Le résultat ne dépend que de ce préfixe (au plus 30 caractères) : il est mis en cache,
+    les mêmes tournures ("le ", "Date : ") revenant d'une date à l'autre.
     """
-    if not filename:
-        logger.warning("[DATE_DEBUG] Extraction de date impossible: aucun nom de fichier fourni")
-        return None
-    
-    # Nettoyer les chemins et les extensions
-    base_filename = os.path.basename(filename)
-    base_filename = os.path.splitext(base_filename)[0]
-    
-    logger.info(f"[DATE_DEBUG] Tentative d'extraction de date à partir du nom de fichier: {base_filename}")
-    
-    # Patterns pour les formats de date dans les noms de fichiers
-    patterns = [
-        # Format français avec jour de la semaine
-        r'(Lundi|Mardi|Mercredi|Jeudi|Vendredi|Samedi|Dimanche)\s+(\d{1,2})\s+(janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)\s+(\d{4})',
-        # Format français sans jour de la semaine
-        r'(\d{1,2})\s+(janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)\s+(\d{4})',
-    ]
-    
-    # Dictionnaire de conversion mois français -> numéro
-    month_to_number = {
-        'janvier': '01', 'février': '02', 'mars': '03', 'avril': '04',
-        'mai': '05', 'juin': '06', 'juillet': '07', 'août': '08',
-        'septembre': '09', 'octobre': '10', 'novembre': '11', 'décembre': '12'
-    }
-    
-    for pattern in patterns:
-        # Essayer avec le nom de fichier complet
-        match = re.search(pattern, filename, re.IGNORECASE)
-        if not match:
-            # Essayer avec le nom de fichier de base (sans chemin ni extension)
-            match = re.search(pattern, base_filename, re.IGNORECASE)
-        
-        if match:
-            date_str = match.group(0)
-            logger.info(f"[DATE_DEBUG] Date trouvée dans le nom de fichier: '{date_str}'")
-            parts = date_str.split()
-            logger.info(f"[DATE_DEBUG] Parties extraites: {parts}")
-            
-            # Extraire jour, mois, année selon le format
-            if parts[0].lower() in ['lundi', 'mardi', 'mercredi', 'jeudi', 'vendredi', 'samedi', 'dimanche']:
-                day = parts[1]
-                month = parts[2].lower()
-                year = parts[3]
-                logger.info(f"[DATE_DEBUG] Format avec jour de semaine détecté: jour={day}, mois={month}, année={year}")
-            else:
-                day = parts[0]
-                month = parts[1].lower()
-                year = parts[2]
-                logger.info(f"[DATE_DEBUG] Format sans jour de semaine détecté: jour={day}, mois={month}, année={year}")
-            
-            # Convertir au format ISO
-            month_num = month_to_number.get(month, '01')
-            iso_date = f"{year}-{month_num}-{day.zfill(2)}"
-            
-            try:
-                # Vérifier si la date est valide
-                datetime.strptime(iso_date, "%Y-%m-%d")
-                logger.info(f"[DATE_DEBUG] Date extraite du nom de fichier et validée: {iso_date}")
-                return iso_date
-            except ValueError as e:
-                logger.warning(f"[DATE_DEBUG] Date invalide extraite du nom de fichier: {iso_date}. Erreur: {str(e)}")
-                continue
-    
-    logger.warning("[DATE_DEBUG] Aucune date trouvée dans le nom de fichier")
-    return None
+    indicators = _DATE_CONTEXT_RE.match(prefix)
+    return sum(_DATE_CONTEXT_POINTS[name] for name, value in indicators.groupdict().items() if value is not None)
 
-def analyze_date_context(date_str: str, context: str, position: int, is_relative: bool = False) -> Tuple[int, bool]:
+def analyze_date_context(date_str: str, context: str, position: int, is_relative: bool = False,
+                         date_offset: Optional[int] = None) -> Tuple[int, bool]:
     """
     Analyse le contexte autour d'une date pour déterminer son importance.
     
@@ -577,41 +676,18 @@ def analyze_date_context(date_str: str, context: str, position: int, is_relative
         context: Contexte autour de la date
         position: Position de la date dans le texte
         is_relative: Si la date est relative (aujourd'hui, hier, etc.)
+        date_offset: Position de la date dans le contexte (recherchée dans le contexte si absente)
         
     Returns:
         Tuple[int, bool]: (score de pertinence (0-100), si c'est probablement la date principale)
     """
     score = 50  # Score par défaut
     
-    # Facteurs qui augmentent l'importance
-    importance_indicators = [
-        (r'^[^\.]*' + re.escape(date_str), 25),  # Date au début d'une phrase
-        (r'^' + re.escape(date_str), 40),  # Date au début du texte
-        (r'le ' + re.escape(date_str), 10),  # "Le" avant la date
-        (r'date.*?:.*?' + re.escape(date_str), 30),  # Format "Date: ..."
-        (r'jour.*?:.*?' + re.escape(date_str), 30),  # Format "Jour: ..."
-        (r'\. ' + re.escape(date_str), 20),  # Date juste après un point (début de phrase)
-    ]
-    
-    # Facteurs qui diminuent l'importance (références au passé/futur)
-    diminish_indicators = [
-        (r'depuis (le|la|les) ' + re.escape(date_str), -20),  # "depuis le..."
-        (r'avant (le|la|les) ' + re.escape(date_str), -20),  # "avant le..."
-        (r'après (le|la|les) ' + re.escape(date_str), -20),  # "après le..."
-        (r'jusqu\'(au|à la) ' + re.escape(date_str), -15),  # "jusqu'au..."
-        (r'à partir (du|de la) ' + re.escape(date_str), -15),  # "à partir du..."
-        (r'commencé (le|la|en) ' + re.escape(date_str), -10),  # "commencé le..."
-        (r'terminé (le|la|en) ' + re.escape(date_str), -10),  # "terminé le..."
-    ]
-    
-    # Analyser les indicateurs
-    for pattern, points in importance_indicators:
-        if re.search(pattern, context, re.IGNORECASE):
-            score += points
-    
-    for pattern, points in diminish_indicators:
-        if re.search(pattern, context, re.IGNORECASE):
-            score += points
+    # Analyser les indicateurs sur le texte qui précède la date, en un seul appel
+    if date_offset is None:
+        date_offset = context.lower().find(date_str.lower())
+    if date_offset >= 0:
+        score += _date_context_points(context[:date_offset])
     
     # Les dates relatives ont généralement plus d'importance
     if is_relative:
@@ -629,225 +705,344 @@ def analyze_date_context(date_str: str, context: str, position: int, is_relative
     
     return score, is_primary
 
-def extract_automatic_tags(text: str, threshold: float = 0.01) -> List[str]:
+# Sujets techniques pertinents à rechercher prioritairement (ordre de priorité conservé).
+# Internés pour que les tags retournés partagent une seule instance par sujet.
+_TECHNICAL_SUBJECTS = tuple(map(sys.intern, (
+    "microsoft", "sharepoint", "azure", "aws", "google", "cloud", "devops",
+    "kubernetes", "docker", "python", "javascript", "typescript", "react", "angular",
+    "vue", "nodejs", "database", "sql", "nosql", "mongodb", "postgresql", "mysql",
+    "api", "rest", "graphql", "microservices", "backend", "frontend", "fullstack",
+    "agile", "scrum", "kanban", "jira", "git", "github", "gitlab", "cicd", "jenkins",
+    "terraform", "ansible", "cybersecurity", "machine learning", "intelligence artificielle",
+    "ia", "data science", "big data", "hadoop", "spark", "etl", "kafka", "elasticsearch",
+    "web", "mobile", "app", "application", "testing", "automation", "integration",
+    "php", "java", "spring", "dotnet", "csharp", "c#", "interface", "architecture",
+    "powerbi", "power automate", "power apps", "flow", "automate", "workflow", "dashboard",
+    "rapport", "projet", "étude", "développement", "programmation", "formation",
+    "équipe", "réunion", "daily", "meeting", "présentation", "documentation",
+    "client", "ticketing", "résolution", "bug", "problème", "solution", "déploiement",
+    "technique", "technologie", "innovation", "digital", "numérique", "optimisation"
+)))
+
+# Mots à ne jamais inclure comme tags car ils sont liés à l'import et pas au contenu
+_BLACKLISTED_TAGS = frozenset({
+    "import", "erreur", "importerreur", "error", "date_from_filename",
+    "fichier", "document", "extraction", "texte", "contenu", "analyse"
+})
+
+# Liste étendue de mots vides français (mots blacklistés inclus)
+_STOPWORDS = frozenset({
+    'dans', 'avec', 'pour', 'cette', 'mais', 'avoir', 'faire', 'plus', 'tout', 'bien',
+    'être', 'comme', 'nous', 'leur', 'sans', 'vous', 'dont', 'alors', 'aussi', 'donc',
+    'cela', 'ceux', 'celle', 'celui', 'entre', 'pendant', 'depuis', 'notre', 'votre',
+    'avons', 'sommes', 'sont', 'était', 'étaient', 'sera', 'seront', 'avez', 'ainsi',
+    'ceci', 'chaque', 'comment', 'contre', 'devant', 'elle', 'elles', 'encore', 'vers',
+    'voici', 'voilà', 'vouloir', 'aucun', 'auquel', 'autre', 'autres', 'assez',
+    'après', 'avant', 'beaucoup', 'chez', 'dedans', 'dehors',
+    'déjà', 'dessous', 'dessus', 'durant', 'enfin', 'ensuite',
+    'falloir', 'haut', 'jusqu', 'lequel', 'lorsque', 'maintenant', 'moins', 'même',
+    'plupart', 'plusieurs', 'pouvoir', 'presque', 'puis', 'puisque', 'quand', 'quelque',
+    'savoir', 'sinon', 'tandis', 'tellement', 'toujours', 'toutefois', 'trop', 'très',
+    'celles', 'notamment', 'également', 'afin', 'selon',
+    'malgré', 'suite', 'certes', 'bref', 'concernant', 'concerné'
+}) | _BLACKLISTED_TAGS
+
+# Automate construit une seule fois : valeur = rang de priorité du sujet
+if AHOCORASICK_AVAILABLE:
+    _SUBJECT_AUTOMATON = ahocorasick.Automaton()
+    for _rank, _subject in enumerate(_TECHNICAL_SUBJECTS):
+        _SUBJECT_AUTOMATON.add_word(_subject, _rank)
+    _SUBJECT_AUTOMATON.make_automaton()
+
+def _find_technical_subjects(text_lower: str) -> List[str]:
+    """
+    Retourne les sujets techniques présents dans le texte (en minuscules),
+    dans l'ordre de priorité de _TECHNICAL_SUBJECTS.
+    """
+    if AHOCORASICK_AVAILABLE:
+        # Un seul parcours du texte pour tous les sujets
+        ranks = {rank for _, rank in _SUBJECT_AUTOMATON.iter(text_lower)}
+        return [_TECHNICAL_SUBJECTS[rank] for rank in sorted(ranks)]
+    
+    return [subject for subject in _TECHNICAL_SUBJECTS if subject in text_lower]
+
+# Nombre maximal de tags retournés par extract_automatic_tags
+MAX_AUTOMATIC_TAGS = 5
+
+def extract_automatic_tags(text: str, threshold: float = 0.01, text_lower: Optional[str] = None) -> List[str]:
     """
     Extrait automatiquement des tags à partir du texte en privilégiant les termes techniques et sujets pertinents.
     
     Args:
         text: Le texte à analyser
         threshold: Seuil de fréquence pour considérer un mot comme tag
+        text_lower: Le texte déjà converti en minuscules, s'il est disponible
         
     Returns:
         List[str]: Liste de tags potentiels
     """
-    # Liste de sujets techniques pertinents à rechercher prioritairement
-    technical_subjects = [
-        "microsoft", "sharepoint", "azure", "aws", "google", "cloud", "devops", 
-        "kubernetes", "docker", "python", "javascript", "typescript", "react", "angular", 
-        "vue", "nodejs", "database", "sql", "nosql", "mongodb", "postgresql", "mysql",
-        "api", "rest", "graphql", "microservices", "backend", "frontend", "fullstack",
-        "agile", "scrum", "kanban", "jira", "git", "github", "gitlab", "cicd", "jenkins",
-        "terraform", "ansible", "cybersecurity", "machine learning", "intelligence artificielle",
-        "ia", "data science", "big data", "hadoop", "spark", "etl", "kafka", "elasticsearch",
-        "web", "mobile", "app", "application", "testing", "automation", "integration",
-        "php", "java", "spring", "dotnet", "csharp", "c#", "interface", "architecture",
-        "powerbi", "power automate", "power apps", "flow", "automate", "workflow", "dashboard",
-        "rapport", "projet", "étude", "développement", "programmation", "application", "formation",
-        "équipe", "réunion", "daily", "meeting", "présentation", "documentation", "rapport",
-        "client", "ticketing", "résolution", "bug", "problème", "solution", "déploiement",
-        "technique", "technologie", "innovation", "digital", "numérique", "optimisation"
-    ]
-    
-    # Liste de mots à ne jamais inclure comme tags car ils sont liés à l'import et pas au contenu
-    blacklisted_tags = [
-        "import", "erreur", "importerreur", "error", "date_from_filename",
-        "fichier", "document", "extraction", "texte", "contenu", "analyse"
-    ]
-    
-    # Extraction des mots (sans ponctuation, chiffres, etc.)
-    words = re.findall(r'\b[a-zA-ZÀ-ÿ]{4,}\b', text.lower())
-    
-    # Liste étendue de mots vides français pour un filtrage plus efficace
-    stopwords = set([
-        'dans', 'avec', 'pour', 'cette', 'mais', 'avoir', 'faire', 'plus', 'tout', 'bien', 
-        'être', 'comme', 'nous', 'leur', 'sans', 'vous', 'dont', 'alors', 'aussi', 'donc', 
-        'cela', 'ceux', 'celle', 'celui', 'entre', 'pendant', 'depuis', 'notre', 'votre', 
-        'avons', 'sommes', 'sont', 'était', 'étaient', 'sera', 'seront', 'avez', 'ainsi',
-        'ceci', 'cela', 'celle', 'celui', 'ceux', 'chaque', 'comment', 'contre', 'dans', 
-        'depuis', 'devant', 'donc', 'elle', 'elles', 'encore', 'entre', 'vers', 'voici', 
-        'voilà', 'votre', 'vouloir', 'vous', 'aucun', 'auquel', 'autre', 'autres', 'assez',
-        'après', 'avant', 'avoir', 'beaucoup', 'chaque', 'chez', 'comment', 'dedans', 'dehors',
-        'déjà', 'dessous', 'dessus', 'donc', 'durant', 'enfin', 'encore', 'ensuite', 'être',
-        'falloir', 'faire', 'haut', 'jusqu', 'lequel', 'lorsque', 'maintenant', 'moins', 'même',
-        'plupart', 'plusieurs', 'pouvoir', 'presque', 'puis', 'puisque', 'quand', 'quelque',
-        'savoir', 'sinon', 'tandis', 'tellement', 'toujours', 'toutefois', 'trop', 'très',
-        'cette', 'cela', 'celui', 'celle', 'ceux', 'celles', 'autre', 'autres', 'même',
-        'notamment', 'également', 'ainsi', 'donc', 'afin', 'après', 'avant', 'pendant', 'selon',
-        'malgré', 'suite', 'voici', 'voilà', 'certes', 'ensuite', 'bref', 'concernant', 'concerné'
-    ])
-    
-    # Ajouter les mots blacklistés aux stopwords
-    stopwords.update(blacklisted_tags)
-    
-    # Filtrer les mots vides
-    words = [w for w in words if w not in stopwords]
-    
-    # Compter les occurrences
-    word_counts = {}
-    for word in words:
-        word_counts[word] = word_counts.get(word, 0) + 1
-    
-    total_words = len(words)
+    # Une seule copie en minuscules, partagée par la tokenisation et la recherche des sujets.
+    # str.lower dispose d'un chemin rapide en C pour l'ASCII et le Latin-1 : une table
+    # str.translate, appliquée caractère par caractère, est nettement plus lente.
+    if text_lower is None:
+        text_lower = text.lower()
+    
+    # Extraction des mots (sans ponctuation, chiffres, etc.) et comptage en C par Counter,
+    # puis retrait des mots vides sur les seules clés distinctes plutôt que mot par mot
+    word_counts = Counter(_WORD_RE.findall(text_lower))
+    for stopword in _STOPWORDS.intersection(word_counts):
+        del word_counts[stopword]
+    
+    total_words = sum(word_counts.values())
     if total_words == 0:
         # S'il n'y a pas de mots significatifs, chercher spécifiquement les sujets techniques
         # Pour éviter de retourner des tags comme "import" ou "erreur"
-        for subject in technical_subjects:
-            if subject in text.lower():
-                return [subject]
+        technical_tags = _find_technical_subjects(text_lower)
+        if technical_tags:
+            return technical_tags[:1]
         # Si vraiment rien n'est trouvé, retourner un tag générique pertinent
         return ["projet"]
     
     # Rechercher des sujets techniques connus en priorité
-    technical_tags = []
-    for subject in technical_subjects:
-        if subject in text.lower() and subject not in technical_tags:
-            technical_tags.append(subject)
-            # Retirer les occurrences de ce sujet pour éviter les doublons
-            if subject in word_counts:
-                del word_counts[subject]
-    
-    # Vérifier si "import" ou "erreur" sont présents dans les mots comptés et les supprimer
-    for blacklisted in blacklisted_tags:
-        if blacklisted in word_counts:
-            del word_counts[blacklisted]
-    
-    # Sélectionner les autres mots significatifs qui dépassent le seuil
-    other_tags = [word for word, count in word_counts.items() 
-                  if count / total_words > threshold and count > 1]
+    technical_tags = _find_technical_subjects(text_lower)
+    for subject in technical_tags:
+        # Retirer les occurrences de ce sujet pour éviter les doublons
+        word_counts.pop(subject, None)
+    
+    # Sélectionner les autres mots significatifs qui dépassent le seuil, du plus fréquent
+    # au moins fréquent (les mots blacklistés ont déjà été écartés avec les mots vides).
+    # Le seuil est converti une seule fois en nombre minimal d'occurrences, et seuls les
+    # mots pouvant encore figurer parmi les 5 tags retournés sont examinés.
+    min_count = max(2, int(threshold * total_words) + 1)
+    remaining = MAX_AUTOMATIC_TAGS - len(technical_tags)
+    other_tags = []
+    if remaining > 0:
+        for word, count in word_counts.most_common(remaining):
+            if count < min_count:
+                break
+            # Tag interné : les mêmes mots reviennent d'un document à l'autre
+            other_tags.append(sys.intern(word))
     
     # Combiner les tags techniques et les autres tags significatifs
     combined_tags = technical_tags + other_tags
     
-    # Vérification finale pour s'assurer qu'aucun tag blacklisté n'est présent
-    combined_tags = [tag for tag in combined_tags if tag not in blacklisted_tags]
-    
     # Si aucun tag n'a été trouvé après tout le filtrage, utiliser un tag par défaut
     if not combined_tags:
         return ["projet"]
     
     # Limiter le nombre de tags (en privilégiant les tags techniques)
-    return combined_tags[:5]
+    return combined_tags[:MAX_AUTOMATIC_TAGS]
 
-def analyze_entry_content(text: str) -> Dict[str, Any]:
+def analyze_entry_content(text: str, text_lower: Optional[str] = None) -> Dict[str, Any]:
     """
     Analyse le contenu d'une entrée pour en extraire des informations.
     
     Args:
         text: Le texte à analyser
+        text_lower: Le texte déjà converti en minuscules, s'il est disponible
         
     Returns:
         Dict: Informations extraites (type, entreprise, tags)
     """
+    # Une seule mise en minuscules, partagée par l'extraction des tags et la détection du type
+    if text_lower is None:
+        text_lower = text.lower()
+    
     result = {
         "type_entree": "quotidien",  # valeur par défaut
         "entreprise_id": None,
-        "tags": extract_automatic_tags(text)
+        "tags": extract_automatic_tags(text, text_lower=text_lower)
     }
     
-    # Détection de type d'entrée
-    if re.search(r'\b(formation|cours|apprendre|étudier|apprentissage)\b', text.lower()):
+    # Détection de type d'entrée en un seul passage (priorité: formation > projet > réflexion)
+    found_types = set()
+    for match in _ENTRY_TYPE_RE.finditer(text_lower):
+        found_types.add(match.lastgroup)
+        if match.lastgroup == "formation":
+            break
+    
+    if "formation" in found_types:
         result["type_entree"] = "formation"
-    elif re.search(r'\b(projet|développement|application|implémentation|feature)\b', text.lower()):
+    elif "projet" in found_types:
         result["type_entree"] = "projet"
-    elif re.search(r'\b(réflexion|analyse|pensée|considération|bilan)\b', text.lower()):
+    elif "reflexion" in found_types:
         result["type_entree"] = "réflexion"
     
     return result
 
+@lru_cache(maxsize=1024)
 def extract_date_from_filename(filename: str) -> Optional[str]:
     """
     Extrait une date à partir du nom de fichier.
     Supporte les formats comme "Jeudi 19 septembre 2024".
     
+    Fonction pure mise en cache : le même nom de fichier est analysé par la route
+    d'import puis par process_document, et les mêmes noms reviennent lors des imports
+    en lot. La journalisation du résultat est laissée aux appelants.
+    
     Args:
         filename: Le nom du fichier
         
     Returns:
-        str: Date au format ISO (YYYY-MM-DD), ou None si aucune date n'est trouvée
+        str: Date au format ISO (YYYY-MM-DD), ou None si aucune date valide n'est trouvée
     """
     if not filename:
-        logger.warning("[DATE_DEBUG] Extraction de date impossible: aucun nom de fichier fourni")
         return None
     
     # Nettoyer les chemins et les extensions
-    base_filename = os.path.basename(filename)
-    base_filename = os.path.splitext(base_filename)[0]
+    base_filename = os.path.splitext(os.path.basename(filename))[0]
     
-    logger.info(f"[DATE_DEBUG] Tentative d'extraction de date à partir du nom de fichier: {base_filename}")
+    # Une seule recherche sur le nom de base (sans chemin ni extension)
+    match = _FILENAME_DATE_RE.search(base_filename)
+    if not match:
+        return None
     
-    # Patterns pour les formats de date dans les noms de fichiers
-    patterns = [
-        # Format français avec jour de la semaine
-        r'(Lundi|Mardi|Mercredi|Jeudi|Vendredi|Samedi|Dimanche)\s+(\d{1,2})\s+(janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)\s+(\d{4})',
-        # Format français sans jour de la semaine
-        r'(\d{1,2})\s+(janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)\s+(\d{4})',
-    ]
+    month_num = _MONTHS[match.group('month').lower()]
+    try:
+        # Convertir au format ISO (la construction de la date valide jour et mois)
+        return date(int(match.group('year')), month_num, int(match.group('day'))).isoformat()
+    except ValueError:
+        return None
+
+# Marqueurs de fin de phrase ou de paragraphe
+_SENTENCE_END_RE = re.compile(r'[.!?\n]')
+
+def _sentence_boundaries(text: str) -> List[int]:
+    """Positions (triées) de tous les marqueurs de fin de phrase, relevées en un seul parcours."""
+    return [match.start() for match in _SENTENCE_END_RE.finditer(text)]
+
+def _sentence_start(boundaries: List[int], position: int) -> int:
+    """Recule jusqu'au début de la phrase contenant `position` (recherche dichotomique)."""
+    index = bisect_right(boundaries, position)
+    boundary = boundaries[index - 1] if index else -1
+    # Avancer après le marqueur de fin (un marqueur en position 0 est ignoré)
+    return boundary + 1 if boundary > 0 else 0
+
+def _sentence_end(boundaries: List[int], position: int, text_length: int) -> int:
+    """Avance jusqu'à la fin de la phrase contenant `position`, marqueur inclus (recherche dichotomique)."""
+    last = text_length - 1
+    index = bisect_left(boundaries, position)
+    if index < len(boundaries) and boundaries[index] < last:
+        return boundaries[index] + 1  # Inclure le marqueur de fin
+    return max(position, last)
+
+def _detect_document_type(filename: Optional[str]) -> Optional[str]:
+    """
+    Détermine le type d'un document à partir de son nom.
     
-    # Dictionnaire de conversion mois français -> numéro
-    month_to_number = {
-        'janvier': '01', 'février': '02', 'mars': '03', 'avril': '04',
-        'mai': '05', 'juin': '06', 'juillet': '07', 'août': '08',
-        'septembre': '09', 'octobre': '10', 'novembre': '11', 'décembre': '12'
-    }
+    Args:
+        filename: Le nom du fichier
+        
+    Returns:
+        Optional[str]: '.docx', '.pdf' ou None si le type n'a pas pu être déterminé
+    """
+    if not filename:
+        return None
+    filename_lower = filename.lower()
+    if 'docx' in filename_lower:
+        logger.debug("[FILE_DEBUG] Fichier détecté comme DOCX par le nom: %s", filename)
+        return '.docx'
+    if 'pdf' in filename_lower:
+        logger.debug("[FILE_DEBUG] Fichier détecté comme PDF par le nom: %s", filename)
+        return '.pdf'
+    return None
+
+def _pipeline_docx(file_content: bytes) -> Optional[str]:
+    """Extrait le texte d'un fichier DOCX, ou None si le contenu obtenu n'est pas significatif."""
+    try:
+        text = extract_text_from_docx(file_content)
+    except Exception as e:
+        logger.error("[FILE_DEBUG] Erreur lors de l'extraction du fichier DOCX: %s", e)
+        return None
+    if text and len(text) > 50:  # Vérifier qu'on a extrait du contenu significatif
+        logger.debug("[FILE_DEBUG] Texte extrait avec succès du fichier DOCX: %d caractères", len(text))
+        return text
+    logger.warning("[FILE_DEBUG] Extraction DOCX a retourné peu de contenu (%d caractères)", len(text or ""))
+    return None
+
+def _pipeline_pdf(file_content: bytes) -> Optional[str]:
+    """Extrait le texte d'un fichier PDF, ou None si le contenu obtenu n'est pas significatif."""
+    try:
+        text = extract_text_from_pdf(file_content)
+    except Exception as e:
+        logger.error("[FILE_DEBUG] Erreur lors de l'extraction du fichier PDF: %s", e)
+        return None
+    if text and len(text) > 50:
+        logger.debug("[FILE_DEBUG] Texte extrait avec succès du fichier PDF: %d caractères", len(text))
+        return text
+    logger.warning("[FILE_DEBUG] Extraction PDF a retourné peu de contenu (%d caractères)", len(text or ""))
+    return None
+
+def _pipeline_binary_fallback(file_content: bytes) -> Optional[str]:
+    """
+    Extraction de secours: recherche directe de blocs de texte lisibles dans les données binaires.
     
-    for pattern in patterns:
-        # Essayer avec le nom de fichier complet
-        match = re.search(pattern, filename, re.IGNORECASE)
-        if not match:
-            # Essayer avec le nom de fichier de base (sans chemin ni extension)
-            match = re.search(pattern, base_filename, re.IGNORECASE)
+    Args:
+        file_content: Le contenu du fichier
         
-        if match:
-            date_str = match.group(0)
-            logger.info(f"[DATE_DEBUG] Date trouvée dans le nom de fichier: '{date_str}'")
-            parts = date_str.split()
-            logger.info(f"[DATE_DEBUG] Parties extraites: {parts}")
-            
-            # Extraire jour, mois, année selon le format
-            if parts[0].lower() in ['lundi', 'mardi', 'mercredi', 'jeudi', 'vendredi', 'samedi', 'dimanche']:
-                day = parts[1]
-                month = parts[2].lower()
-                year = parts[3]
-                logger.info(f"[DATE_DEBUG] Format avec jour de semaine détecté: jour={day}, mois={month}, année={year}")
-            else:
-                day = parts[0]
-                month = parts[1].lower()
-                year = parts[2]
-                logger.info(f"[DATE_DEBUG] Format sans jour de semaine détecté: jour={day}, mois={month}, année={year}")
-            
-            # Convertir au format ISO
-            month_num = month_to_number.get(month, '01')
-            iso_date = f"{year}-{month_num}-{day.zfill(2)}"
-            
-            try:
-                # Vérifier si la date est valide
-                datetime.strptime(iso_date, "%Y-%m-%d")
-                logger.info(f"[DATE_DEBUG] Date extraite du nom de fichier et validée: {iso_date}")
-                return iso_date
-            except ValueError as e:
-                logger.warning(f"[DATE_DEBUG] Date invalide extraite du nom de fichier: {iso_date}. Erreur: {str(e)}")
-                continue
-    
-    logger.warning("[DATE_DEBUG] Aucune date trouvée dans le nom de fichier")
+    Returns:
+        Optional[str]: Le texte extrait, ou None si moins de 100 caractères exploitables ont été trouvés
+    """
+    try:
+        logger.debug("[FILE_DEBUG] Tentative d'extraction de texte par recherche directe dans les données binaires")
+        # Travailler directement sur les octets : seuls les blocs retenus sont décodés.
+        # La vue mémoire limite l'analyse aux premiers octets sans copier le contenu
+        # (le module re accepte tout objet exposant un tampon).
+        raw_data = memoryview(file_content)[:MAX_FALLBACK_BYTES]
+        
+        # Nettoyer et trouver des blocs de texte exploitables
+        # Supprimer les octets binaires/non-imprimables
+        clean_data = _BINARY_JUNK_B_RE.sub(b' ', raw_data)
+        # Réduire les espaces multiples
+        clean_data = _WS_B_RE.sub(b' ', clean_data)
+        
+        # Rechercher des phrases ou paragraphes significatifs
+        # (recherche de séquences de mots et ponctuation d'au moins 30 caractères)
+        text_blocks = [block.decode('utf-8') for block in _TEXT_BLOCK_B_RE.findall(clean_data)]
+        
+        # Filtrer pour garder uniquement les blocs avec un ratio raisonnable de lettres/chiffres
+        filtered_blocks = []
+        for block in text_blocks:
+            # Compter les caractères alphanumériques
+            alnum_count = len(block) - len(block.translate(_NON_ALNUM_TABLE))
+            # Si au moins 40% du bloc est composé de caractères alphanumériques
+            if alnum_count / len(block) > 0.4:
+                filtered_blocks.append(block)
+        
+        extracted_text = "\n\n".join(filtered_blocks)
+        if len(extracted_text) > 100:  # Si on a au moins 100 caractères
+            logger.debug("[FILE_DEBUG] Texte extrait par analyse directe: %d caractères", len(extracted_text))
+            return extracted_text
+    except Exception as fallback_error:
+        logger.error("[FILE_DEBUG] Erreur lors de l'extraction de secours: %s", fallback_error)
     return None
 
-def process_document(file_content: bytes, filename: Optional[str] = None) -> List[Dict[str, Any]]:
+# Méthodes d'extraction à essayer, dans l'ordre, selon le type détecté par le nom du fichier
+# (sans type reconnu, le contenu est d'abord traité comme un PDF)
+_PIPELINES = {
+    '.docx': (_pipeline_docx, _pipeline_binary_fallback),
+    '.pdf': (_pipeline_pdf, _pipeline_binary_fallback),
+    None: (_pipeline_pdf, _pipeline_binary_fallback),
+}
+
+# Textes des entrées artificielles créées lorsque le contenu n'a pas pu être exploité
+_IMPORT_TIMESTAMP_FORMAT = "%d/%m/%Y à %H:%M"
+_IMPORT_NOTICE_TEMPLATE = "Document {filename} importé le {imported_at}. \n\n{message}"
+_EXTRACTION_FAILED_MESSAGE = (
+    "Ce document a été importé mais son contenu n'a pas pu être analysé correctement. "
+    "Veuillez vérifier que vous avez installé les bibliothèques nécessaires (python-docx pour les fichiers DOCX, PyPDF2 pour les PDF)."
+)
+_CONTENT_TOO_SHORT_MESSAGE = "Le contenu n'a pas pu être extrait correctement."
+
+def process_document(file_content: bytes, filename: Optional[str] = None,
+                     include_secondary_entries: bool = False) -> List[Dict[str, Any]]:
     """
     Traite un document (PDF ou DOCX) et extrait son contenu sous forme d'entrées de journal.
     
     Args:
         file_content: Le contenu du fichier
         filename: Le nom du fichier
+        include_secondary_entries: Créer aussi des entrées pour les autres dates pertinentes du contenu
         
     Returns:
         List[Dict]: Liste des entrées extraites
@@ -863,193 +1058,92 @@ def process_document(file_content: bytes, filename: Optional[str] = None) -> Lis
     # Extraire la date du nom du fichier en priorité
     filename_date = None
     if filename:
-        logger.info(f"[DATE_DEBUG] Tentative d'extraction de date à partir du nom du fichier: {filename}")
+        logger.debug("[DATE_DEBUG] Tentative d'extraction de date à partir du nom du fichier: %s", filename)
         filename_date = extract_date_from_filename(filename)
         if filename_date:
-            logger.info(f"[DATE_DEBUG] Date extraite avec succès du nom du fichier: {filename_date}")
-            logger.warning(f"[DATE_PRIORITY] Date du nom de fichier sera utilisée: {filename_date}")
+            logger.debug("[DATE_DEBUG] Date extraite avec succès du nom du fichier: %s", filename_date)
+            logger.warning("[DATE_PRIORITY] Date du nom de fichier sera utilisée: %s", filename_date)
         else:
-            logger.warning(f"[DATE_PRIORITY] Aucune date trouvée dans le nom du fichier: {filename}")
-    
-    # Créer une entrée artificielle en cas d'échec complet
-    # Essayons d'extraire du texte même sans contenu significatif
-    sample_text = "Ce document a été importé mais son contenu n'a pas pu être analysé correctement. " + \
-                 "Veuillez vérifier que vous avez installé les bibliothèques nécessaires (python-docx pour les fichiers DOCX, PyPDF2 pour les PDF)."
-    
-    default_entry = [{
-        "date": filename_date if filename_date else datetime.now().strftime("%Y-%m-%d"),
-        "texte": f"Document {filename} importé le {datetime.now().strftime('%d/%m/%Y à %H:%M')}. \n\n{sample_text}",
-        "type_entree": "quotidien",
-        "tags": ["projet", "document"],  # Utiliser des tags génériques et utiles
-        "source_document": filename,
-        "date_source": "filename" if filename_date else "current"
-    }]
-    
-    text = None
-    file_text_extracted = False
+            logger.warning("[DATE_PRIORITY] Aucune date valide trouvée dans le nom du fichier: %s", filename)
     
-    # Détection du type de fichier par l'extension
-    is_docx = False
-    is_pdf = False
+    # Un seul instant de référence pour toutes les dates par défaut de ce document
+    now = datetime.now()
+    today_iso = now.strftime("%Y-%m-%d")
     
-    if filename:
-        filename_lower = filename.lower()
-        if filename_lower.endswith('.docx') or 'docx' in filename_lower:
-            is_docx = True
-            logger.info(f"[FILE_DEBUG] Fichier détecté comme DOCX par le nom: {filename}")
-        elif filename_lower.endswith('.pdf') or 'pdf' in filename_lower:
-            is_pdf = True
-            logger.info(f"[FILE_DEBUG] Fichier détecté comme PDF par le nom: {filename}")
-    
-    # Si c'est un fichier DOCX, utiliser une extraction spécifique DOCX en priorité
-    if is_docx:
-        logger.info(f"[FILE_DEBUG] Traitement prioritaire comme fichier DOCX: {filename}")
-        try:
-            # Extraction par python-docx
-            text = extract_text_from_docx(file_content)
-            if text and len(text) > 50:  # Vérifier qu'on a extrait du contenu significatif
-                logger.info(f"[FILE_DEBUG] Texte extrait avec succès du fichier DOCX: {len(text)} caractères")
-                file_text_extracted = True
-            else:
-                logger.warning(f"[FILE_DEBUG] Extraction DOCX a retourné peu de contenu ({len(text) if text else 0} caractères)")
-                
-                # Tentative d'extraction par méthode directe (même si python-docx n'est pas disponible)
-                try:
-                    # Méthode d'urgence: extraire directement du contenu binaire
-                    raw_text = file_content.decode('utf-8', errors='ignore')
-                    # Nettoyer et extraire du texte lisible
-                    import re
-                    # Supprimer les caractères binaires et garder l'alphanumérique et la ponctuation
-                    clean_text = re.sub(r'[^\x20-\x7E\n\r\t\u00A0-\u00FF\u0100-\u017F]', ' ', raw_text)
-                    # Extraire des blocs de texte significatifs
-                    blocks = re.findall(r'[A-Za-z0-9\s.,;:!?«»()\[\]\'\"]{20,}', clean_text)
-                    if blocks:
-                        # Concaténer les blocs trouvés
-                        fallback_text = "\n\n".join(blocks)
-                        if len(fallback_text) > 100:
-                            text = fallback_text
-                            logger.info(f"[FILE_DEBUG] Texte extrait par méthode de secours: {len(text)} caractères")
-                            file_text_extracted = True
-                except Exception as raw_err:
-                    logger.error(f"[FILE_DEBUG] Erreur lors de l'extraction brute: {str(raw_err)}")
-        except Exception as e:
-            logger.error(f"[FILE_DEBUG] Erreur lors de l'extraction du fichier DOCX: {str(e)}")
-            text = None
-    
-    # Si c'est un fichier PDF ou si le traitement DOCX a échoué
-    if (is_pdf or not file_text_extracted) and not is_docx:
-        try:
-            text = extract_text_from_pdf(file_content)
-            if text and len(text) > 50:
-                logger.info(f"[FILE_DEBUG] Texte extrait avec succès du fichier PDF: {len(text)} caractères")
-                file_text_extracted = True
-            else:
-                logger.warning(f"[FILE_DEBUG] Extraction PDF a retourné peu de contenu ({len(text) if text else 0} caractères)")
-        except Exception as e:
-            logger.error(f"[FILE_DEBUG] Erreur lors de l'extraction du fichier PDF: {str(e)}")
-            text = None
-    
-    # Tentative de secours: extraction directe de texte à partir des données binaires
-    if not file_text_extracted:
-        try:
-            logger.info("[FILE_DEBUG] Tentative d'extraction de texte par recherche directe dans les données binaires")
-            # Convertir les données binaires en texte
-            raw_text = file_content.decode('utf-8', errors='ignore')
-            
-            # Nettoyer et trouver des blocs de texte exploitables
-            import re
-            # Supprimer les caractères binaires/non-imprimables
-            clean_text = re.sub(r'[^\x20-\x7E\n\r\t\u00A0-\u00FF\u0100-\u017F]', ' ', raw_text)
-            # Réduire les espaces multiples
-            clean_text = re.sub(r'\s+', ' ', clean_text)
-            
-            # Rechercher des phrases ou paragraphes significatifs
-            # (recherche de séquences de mots et ponctuation d'au moins 30 caractères)
-            text_blocks = re.findall(r'[A-Za-z0-9àáâäæçèéêëìíîïòóôöùúûüÿœÀÁÂÄÆÇÈÉÊËÌÍÎÏÒÓÔÖÙÚÛÜŸŒ\s.,;:!?«»()\[\]\'\"]{30,}', clean_text)
-            
-            if text_blocks:
-                # Filtrer pour garder uniquement les blocs avec un ratio raisonnable de lettres/chiffres
-                filtered_blocks = []
-                for block in text_blocks:
-                    # Compter les caractères alphanumériques
-                    alnum_count = sum(1 for c in block if c.isalnum())
-                    # Si au moins 40% du bloc est composé de caractères alphanumériques
-                    if alnum_count / len(block) > 0.4:
-                        filtered_blocks.append(block)
-                
-                if filtered_blocks:
-                    extracted_text = "\n\n".join(filtered_blocks)
-                    if len(extracted_text) > 100:  # Si on a au moins 100 caractères
-                        text = extracted_text
-                        logger.info(f"[FILE_DEBUG] Texte extrait par analyse directe: {len(text)} caractères")
-                        file_text_extracted = True
-        except Exception as fallback_error:
-            logger.error(f"[FILE_DEBUG] Erreur lors de l'extraction de secours: {str(fallback_error)}")
+    # Détection du type de fichier par le nom, puis application des méthodes
+    # d'extraction correspondantes jusqu'à la première qui réussit
+    document_type = _detect_document_type(filename)
+    text = None
+    for pipeline in _PIPELINES[document_type]:
+        text = pipeline(file_content)
+        if text:
+            break
     
     # Si aucune méthode n'a fonctionné, utiliser l'entrée par défaut
-    if not file_text_extracted or not text:
-        logger.error(f"[FILE_DEBUG] Toutes les méthodes d'extraction ont échoué pour: {filename}")
-        return default_entry
-    
     if not text:
-        logger.error(f"Impossible d'extraire du texte du document '{filename}'")
-        return []
+        logger.error("[FILE_DEBUG] Toutes les méthodes d'extraction ont échoué pour: %s", filename)
+        # Entrée artificielle, construite uniquement sur ce chemin d'échec
+        return [{
+            "date": filename_date if filename_date else today_iso,
+            "texte": _IMPORT_NOTICE_TEMPLATE.format(filename=filename, imported_at=now.strftime(_IMPORT_TIMESTAMP_FORMAT),
+                                                    message=_EXTRACTION_FAILED_MESSAGE),
+            "type_entree": "quotidien",
+            "tags": ["projet", "document"],  # Utiliser des tags génériques et utiles
+            "source_document": filename,
+            "date_source": "filename" if filename_date else "current"
+        }]
     
     # Vérifier que le texte extrait est valide et contient un minimum de contenu
     if len(text.strip()) < 10:
         # Si le texte est trop court, créer une entrée artificielle pour éviter l'échec
-        logger.warning(f"Texte extrait trop court ({len(text.strip())} caractères), création d'une entrée artificielle")
+        logger.warning("Texte extrait trop court (%d caractères), création d'une entrée artificielle", len(text.strip()))
         # Utiliser la date du nom de fichier si disponible, sinon la date actuelle
-        entry_date = filename_date if filename_date else datetime.now().strftime("%Y-%m-%d")
+        entry_date = filename_date if filename_date else today_iso
         date_source = "filename" if filename_date else "current"
-        logger.info(f"[DATE_DEBUG] Entrée artificielle créée avec date {entry_date} (source: {date_source})")
+        logger.debug("[DATE_DEBUG] Entrée artificielle créée avec date %s (source: %s)", entry_date, date_source)
         return [{
             "date": entry_date,
-            "texte": f"Document {filename} importé le {datetime.now().strftime('%d/%m/%Y à %H:%M')}. \n\nLe contenu n'a pas pu être extrait correctement.",
+            "texte": _IMPORT_NOTICE_TEMPLATE.format(filename=filename, imported_at=now.strftime(_IMPORT_TIMESTAMP_FORMAT),
+                                                    message=_CONTENT_TOO_SHORT_MESSAGE),
             "type_entree": "quotidien",
             "tags": ["import", "erreur"],
             "source_document": filename,
             "date_source": date_source
         }]
     
+    # La date du nom de fichier (déjà extraite plus haut) est prioritaire
+    if filename_date:
+        # IMPORTANT: Utiliser directement la date du nom de fichier et ignorer toute autre date
+        # Créer directement l'entrée avec cette date, sans analyser les dates du contenu
+        metadata = analyze_entry_content(text)
+        logger.debug("[DATE_DEBUG] Création d'une entrée avec la date du fichier: %s", filename_date)
+        logger.warning("[DATE_PRIORITY] Utilisation de la date extraite du nom de fichier pour l'importation: %s", filename_date)
+        
+        # Utiliser uniquement les tags significatifs extraits du contenu
+        tags = metadata["tags"]
+        
+        return [{
+            "date": filename_date,
+            "texte": text,
+            "type_entree": metadata["type_entree"],
+            "tags": tags,
+            "source_document": filename,
+            "date_source": "filename"  # Marqueur pour indiquer la source de la date
+        }]
+    
+    # Si aucune date n'est trouvée dans le nom du fichier, continuer avec la recherche dans le contenu
+    logger.debug("[DATE_DEBUG] Aucune date dans le nom de fichier, recherche dans le contenu")
+    
     # Rechercher les dates pour diviser le contenu
     date_positions, dates_analyzed = extract_dates_from_text(text)
     
     # Logging pour debug
-    logger.info(f"Dates trouvées dans le document: {len(dates_analyzed)} dates")
-    
-    # Extraire la date du nom de fichier en priorité
-    filename_date = None
-    if filename:
-        filename_date = extract_date_from_filename(filename)
-        if filename_date:
-            logger.info(f"[DATE_DEBUG] Date extraite du nom de fichier: {filename_date}")
-            
-            # IMPORTANT: Utiliser directement la date du nom de fichier et ignorer toute autre date
-            # Créer directement l'entrée avec cette date
-            metadata = analyze_entry_content(text)
-            logger.info(f"[DATE_DEBUG] Création d'une entrée avec la date du fichier: {filename_date}")
-            logger.warning(f"[DATE_PRIORITY] Utilisation de la date extraite du nom de fichier pour l'importation: {filename_date}")
-            
-            # Utiliser uniquement les tags significatifs extraits du contenu
-            tags = metadata["tags"]
-            
-            return [{
-                "date": filename_date,
-                "texte": text,
-                "type_entree": metadata["type_entree"],
-                "tags": tags,
-                "source_document": filename,
-                "date_source": "filename"  # Marqueur pour indiquer la source de la date
-            }]
-    
-    # Si aucune date n'est trouvée dans le nom du fichier, continuer avec la recherche dans le contenu
-    logger.info(f"[DATE_DEBUG] Aucune date dans le nom de fichier, recherche dans le contenu")
+    logger.debug("Dates trouvées dans le document: %d dates", len(dates_analyzed))
     
     # Si aucune date n'est trouvée dans le contenu non plus
     if not dates_analyzed:
-        current_date = datetime.now().strftime("%Y-%m-%d")
-        logger.info(f"[DATE_DEBUG] Aucune date trouvée, utilisation de la date actuelle: {current_date}")
+        current_date = today_iso
+        logger.debug("[DATE_DEBUG] Aucune date trouvée, utilisation de la date actuelle: %s", current_date)
         
         metadata = analyze_entry_content(text)
         return [{
@@ -1075,10 +1169,9 @@ def process_document(file_content: bytes, filename: Optional[str] = None) -> Lis
         primary_date = primary_dates[0]
     else:
         # Si aucune date n'est marquée comme principale, prendre celle avec le score le plus élevé
-        primary_date = dates_analyzed[0] if dates_analyzed else {"date": datetime.now().strftime("%Y-%m-%d"), "score": 0, "is_primary": False, "position": 0, "context": ""}
+        primary_date = dates_analyzed[0] if dates_analyzed else {"date": today_iso, "score": 0, "is_primary": False, "position": 0, "context": ""}
     
-    logger.info(f"[DATE_DEBUG] Date principale identifiée dans le contenu: {primary_date['date']} (score: {primary_date['score']})")
-    logger.info(f"[DATE_DEBUG] Note: Cette date sera ignorée car nous utilisons déjà la date du fichier en priorité.")
+    logger.debug("[DATE_DEBUG] Date principale identifiée dans le contenu: %s (score: %s)", primary_date['date'], primary_date['score'])
     
     # Créer une entrée principale avec la date principale et tout le texte
     metadata = analyze_entry_content(text)
@@ -1091,52 +1184,43 @@ def process_document(file_content: bytes, filename: Optional[str] = None) -> Lis
         "primary_date": True  # Marquer cette entrée comme utilisant la date principale
     }
     
+    # Option: ajouter des entrées secondaires (désactivé par défaut)
+    if not include_secondary_entries:
+        return [primary_entry]
+    
     # Décider si nous devons créer des entrées séparées pour d'autres dates
     # Stratégie: ne créer des entrées séparées que pour les dates avec un score élevé
     # et qui ne sont pas trop proches de la date principale
     
     secondary_entries = []
+    boundaries = _sentence_boundaries(text)  # Relevées une seule fois pour toutes les dates
     date_diff_threshold = 7  # Différence minimale en jours
     score_threshold = 65    # Score minimum pour les dates secondaires
     
-    for date_info in dates_analyzed:
-        # Ne pas traiter à nouveau la date principale
-        if date_info["date"] == primary_date["date"]:
-            continue
-        
-        # Vérifier si cette date a un score assez élevé
-        if date_info["score"] < score_threshold:
-            continue
-        
-        # Calculer la différence en jours entre cette date et la date principale
+    # Les dates trop proches de la date principale (elle comprise) forment une fenêtre
+    # [principale - 6 jours, principale + 6 jours] : les dates étant normalisées au format
+    # ISO, l'ordre des chaînes est celui des dates et le filtrage se fait en une passe
+    # sans convertir chaque date
+    primary_ordinal = date.fromisoformat(primary_date["date"]).toordinal()
+    window_start = date.fromordinal(max(primary_ordinal - (date_diff_threshold - 1), 1)).isoformat()
+    window_end = date.fromordinal(min(primary_ordinal + (date_diff_threshold - 1), date.max.toordinal())).isoformat()
+    candidate_dates = [
+        date_info for date_info in dates_analyzed
+        if date_info["score"] >= score_threshold
+        and not window_start <= date_info["date"] <= window_end
+    ]
+    
+    for date_info in candidate_dates:
         try:
-            this_date = datetime.strptime(date_info["date"], "%Y-%m-%d").date()
-            primary_d = datetime.strptime(primary_date["date"], "%Y-%m-%d").date()
-            days_diff = abs((this_date - primary_d).days)
-            
-            if days_diff < date_diff_threshold:
-                # Dates trop proches, ignorer
-                continue
-                
             # Extraire un contexte significatif autour de cette date
             pos = date_info["position"]
             max_context_length = 1000  # Caractères
             
             # Trouver où commencer la découpe (paragraphe ou phrase)
-            context_start = max(0, pos - 100)
-            # Reculer jusqu'au début d'une phrase ou d'un paragraphe
-            while context_start > 0 and text[context_start] not in ".!?\n":
-                context_start -= 1
-            if context_start > 0:
-                context_start += 1  # Avancer après le marqueur de fin
+            context_start = _sentence_start(boundaries, max(0, pos - 100))
             
             # Trouver où terminer la découpe
-            context_end = min(len(text), pos + 900)
-            # Avancer jusqu'à la fin d'une phrase ou d'un paragraphe
-            while context_end < len(text) - 1 and text[context_end] not in ".!?\n":
-                context_end += 1
-            if context_end < len(text) - 1:
-                context_end += 1  # Inclure le marqueur de fin
+            context_end = _sentence_end(boundaries, min(len(text), pos + 900), len(text))
             
             # Extraire le contexte
             context_text = text[context_start:context_end].strip()
@@ -1154,20 +1238,50 @@ def process_document(file_content: bytes, filename: Optional[str] = None) -> Lis
                     "primary_date": False  # Marquer cette entrée comme utilisant une date secondaire
                 }
                 secondary_entries.append(secondary_entry)
-                logger.info(f"Entrée secondaire créée avec date {date_info['date']} (score: {date_info['score']}, contexte: {len(context_text)} caractères)")
+                logger.debug("Entrée secondaire créée avec date %s (score: %s, contexte: %d caractères)", date_info['date'], date_info['score'], len(context_text))
         except Exception as e:
-            logger.error(f"Erreur lors de la création d'une entrée secondaire: {str(e)}")
-    
-    # Compiler les entrées (principale + secondaires) selon la stratégie choisie
-    entries = [primary_entry]
+            logger.error("Erreur lors de la création d'une entrée secondaire: %s", e)
     
-    # Option: ajouter des entrées secondaires (désactivé par défaut)
-    include_secondary_entries = False  # Paramètre configurable
-    
-    if include_secondary_entries and secondary_entries:
-        entries.extend(secondary_entries)
-    
-    return entries
+    # Compiler les entrées (principale + secondaires)
+    return [primary_entry] + secondary_entries
+
+def _process_one(item: Tuple[bytes, Optional[str]]) -> Tuple[bool, Union[List[Dict[str, Any]], str]]:
+    """Traite un document (contenu, nom de fichier) dans un processus de travail."""
+    file_content, filename = item
+    try:
+        return True, process_document(file_content, filename)
+    except Exception as e:
+        # Un fichier en échec ne doit pas interrompre le reste du lot
+        logger.error("Erreur lors du traitement du document %s: %s", filename, e)
+        return False, str(e)
+
+def process_documents(items: List[Tuple[bytes, Optional[str]]],
+                      max_workers: Optional[int] = None) -> List[Tuple[bool, Union[List[Dict[str, Any]], str]]]:
+    """
+    Traite plusieurs documents (PDF ou DOCX) en parallèle.
+
+    Les documents sont indépendants et leur traitement (PyPDF2, expressions
+    régulières) est du Python pur limité par le CPU : un pool de processus
+    contourne le GIL.
+
+    Args:
+        items: Liste de couples (contenu du fichier, nom du fichier)
+        max_workers: Nombre maximal de processus (par défaut: nombre de CPU)
+
+    Returns:
+        List[Tuple]: Pour chaque document, dans l'ordre d'entrée, (True, entrées extraites)
+        en cas de succès ou (False, message d'erreur) en cas d'échec
+    """
+    if not items:
+        return []
+
+    # Inutile de démarrer un pool pour un seul document
+    if len(items) == 1:
+        return [_process_one(items[0])]
+
+    # "spawn" : un fork hériterait des verrous (journalisation) tenus par d'autres threads
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=get_context("spawn")) as executor:
+        return list(executor.map(_process_one, items))
 
 # Garder la fonction existante pour la compatibilité
 def process_pdf_file(file_content: bytes, filename: Optional[str] = None) -> List[Dict[str, Any]]:
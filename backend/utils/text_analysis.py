@@ -4,17 +4,30 @@ et la génération de matrices de co-occurrence pour détecter les thématiques.
 """
 
 import re
+import sys
+import heapq
 import math
 import logging
 from typing import List, Dict, Tuple, Set, Union, Optional, Any
 from collections import Counter, defaultdict
 from datetime import datetime
+from functools import lru_cache
+from itertools import combinations
+from operator import itemgetter
 
 # Configuration du logging
 logger = logging.getLogger(__name__)
 
+# Tentative d'importation de pyahocorasick (recherche multi-mots-clés en un seul passage)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    logger.info("pyahocorasick n'est pas installé. La recherche des sujets techniques utilisera des recherches successives.")
+    AHOCORASICK_AVAILABLE = False
+
 # Stopwords français de base
-STOPWORDS_FR = set([
+STOPWORDS_FR = frozenset([
     'au', 'aux', 'avec', 'ce', 'ces', 'dans', 'de', 'des', 'du', 'elle', 'en',
     'et', 'eux', 'il', 'ils', 'je', 'la', 'le', 'les', 'leur', 'lui', 'ma',
     'mais', 'me', 'même', 'mes', 'moi', 'mon', 'nos', 'notre', 'nous', 'ou',
@@ -26,7 +39,7 @@ STOPWORDS_FR = set([
 ])
 
 # Mots vides supplémentaires spécifiques au contexte du mémoire
-ADDITIONAL_STOPWORDS = set([
+ADDITIONAL_STOPWORDS = frozenset([
     'jour', 'journée', 'aujourd', 'hui', 'semaine', 'mois', 'année',
     'lundi', 'mardi', 'mercredi', 'jeudi', 'vendredi', 'samedi', 'dimanche',
     'janvier', 'février', 'mars', 'avril', 'mai', 'juin', 'juillet', 'août',
@@ -35,7 +48,46 @@ ADDITIONAL_STOPWORDS = set([
 ])
 
 # Combinaison des stopwords
-ALL_STOPWORDS = STOPWORDS_FR.union(ADDITIONAL_STOPWORDS)
+ALL_STOPWORDS = STOPWORDS_FR | ADDITIONAL_STOPWORDS
+
+# Mots à ne jamais utiliser comme tags car ils sont liés à l'import et pas au contenu
+BLACKLISTED_TAGS = frozenset([
+    "import", "erreur", "importerreur", "error", "date_from_filename",
+    "fichier", "document", "extraction", "texte", "contenu", "analyse"
+])
+
+# Mots écartés lors de la tokenisation (construits une seule fois pour toutes les instances)
+_TAG_STOPWORDS = ALL_STOPWORDS | BLACKLISTED_TAGS
+
+# Expression régulière précompilée pour le retrait des URLs
+_URL_RE = re.compile(r'https?://\S+')
+
+# Sujets techniques pertinents, recherchés prioritairement dans l'ordre de la liste
+TECHNICAL_SUBJECTS = (
+    "microsoft", "sharepoint", "azure", "aws", "google", "cloud", "devops", 
+    "kubernetes", "docker", "python", "javascript", "typescript", "react", "angular", 
+    "vue", "nodejs", "database", "sql", "nosql", "mongodb", "postgresql", "mysql",
+    "api", "rest", "graphql", "microservices", "backend", "frontend", "fullstack",
+    "agile", "scrum", "kanban", "jira", "git", "github", "gitlab", "cicd", "jenkins",
+    "terraform", "ansible", "cybersecurity", "machine learning", "intelligence artificielle",
+    "ia", "data science", "big data", "hadoop", "spark", "etl", "kafka", "elasticsearch",
+    "web", "mobile", "app", "application", "testing", "automation", "integration",
+    "php", "java", "spring", "dotnet", "csharp", "c#", "interface", "architecture",
+    "powerbi", "power automate", "power apps", "flow", "automate", "workflow", "dashboard",
+    "rapport", "projet", "étude", "développement", "programmation", "application", "formation",
+    "équipe", "réunion", "daily", "meeting", "présentation", "documentation", "rapport",
+    "client", "ticketing", "résolution", "bug", "problème", "solution", "déploiement",
+    "technique", "technologie", "innovation", "digital", "numérique", "optimisation"
+)
+
+# Automate construit une seule fois pour la liste par défaut : valeur = rang de la
+# première occurrence du sujet dans TECHNICAL_SUBJECTS
+if AHOCORASICK_AVAILABLE:
+    _SUBJECT_AUTOMATON = ahocorasick.Automaton()
+    for _rank, _subject in enumerate(TECHNICAL_SUBJECTS):
+        if _subject not in _SUBJECT_AUTOMATON:
+            _SUBJECT_AUTOMATON.add_word(_subject, _rank)
+    _SUBJECT_AUTOMATON.make_automaton()
 
 class TagExtractor:
     """
@@ -60,37 +112,17 @@ class TagExtractor:
         self.max_tags = max_tags
         self.min_frequency = min_frequency
         
-        # Initialiser la liste des stopwords selon la langue
-        self.stopwords = ALL_STOPWORDS
-        
-        # Ajouter des mots spécifiques à ne jamais utiliser comme tags
-        self.blacklisted_tags = [
-            "import", "erreur", "importerreur", "error", "date_from_filename",
-            "fichier", "document", "extraction", "texte", "contenu", "analyse"
-        ]
+        # Mots spécifiques à ne jamais utiliser comme tags
+        self.blacklisted_tags = BLACKLISTED_TAGS
         
-        self.stopwords.update(self.blacklisted_tags)
+        # Stopwords de la langue complétés par les tags interdits (ensemble figé partagé)
+        self.stopwords = _TAG_STOPWORDS
         
         # Liste de sujets techniques pertinents à rechercher prioritairement
-        self.technical_subjects = [
-            "microsoft", "sharepoint", "azure", "aws", "google", "cloud", "devops", 
-            "kubernetes", "docker", "python", "javascript", "typescript", "react", "angular", 
-            "vue", "nodejs", "database", "sql", "nosql", "mongodb", "postgresql", "mysql",
-            "api", "rest", "graphql", "microservices", "backend", "frontend", "fullstack",
-            "agile", "scrum", "kanban", "jira", "git", "github", "gitlab", "cicd", "jenkins",
-            "terraform", "ansible", "cybersecurity", "machine learning", "intelligence artificielle",
-            "ia", "data science", "big data", "hadoop", "spark", "etl", "kafka", "elasticsearch",
-            "web", "mobile", "app", "application", "testing", "automation", "integration",
-            "php", "java", "spring", "dotnet", "csharp", "c#", "interface", "architecture",
-            "powerbi", "power automate", "power apps", "flow", "automate", "workflow", "dashboard",
-            "rapport", "projet", "étude", "développement", "programmation", "application", "formation",
-            "équipe", "réunion", "daily", "meeting", "présentation", "documentation", "rapport",
-            "client", "ticketing", "résolution", "bug", "problème", "solution", "déploiement",
-            "technique", "technologie", "innovation", "digital", "numérique", "optimisation"
-        ]
+        self.technical_subjects = TECHNICAL_SUBJECTS
         
         # Expressions régulières pour nettoyage et tokenization
-        self.word_pattern = re.compile(r'\\b[a-zA-ZÀ-ÿ]{' + str(min_word_length) + r',}\\b')
+        self.word_pattern = re.compile(r'\b[a-zA-ZÀ-ÿ]{' + str(min_word_length) + r',}\b')
         
     def extract_tags(self, text: str, context: Optional[Dict[str, Any]] = None) -> List[str]:
         """
@@ -106,14 +138,14 @@ class TagExtractor:
         if not text or len(text.strip()) < 10:
             return ["projet"]  # Tag par défaut
         
-        # Nettoyage du texte
-        text = self._preprocess_text(text)
+        # Une seule mise en minuscules, sans les URLs. La tokenisation ne retient que les
+        # suites de lettres : la ponctuation n'a pas besoin d'être remplacée au préalable.
+        text = _URL_RE.sub('', text.lower())
         
-        # Rechercher d'abord des termes techniques spécifiques
-        technical_tags = []
-        for subject in self.technical_subjects:
-            if subject in text.lower() and subject not in technical_tags:
-                technical_tags.append(subject)
+        # Rechercher d'abord des termes techniques spécifiques (espaces normalisés pour
+        # les sujets en plusieurs mots)
+        normalized_text = ' '.join(text.split())
+        technical_tags = self._find_technical_subjects(normalized_text)
                 
         # Tokenization et filtrage des mots
         tokens = self._tokenize_text(text)
@@ -124,13 +156,13 @@ class TagExtractor:
                 return technical_tags[:self.max_tags]
             return ["projet"]
         
-        # Calcul des scores TF-IDF pour les tokens
+        # Comptage des tokens
         word_counts = Counter(tokens)
-        total_words = len(tokens)
         
         # Filtrer les mots trop peu fréquents et les termes techniques déjà identifiés
-        filtered_words = {word: count for word, count in word_counts.items() 
-                         if count >= self.min_frequency and word not in technical_tags}
+        technical_set = set(technical_tags)
+        filtered_words = Counter({word: count for word, count in word_counts.items()
+                                  if count >= self.min_frequency and word not in technical_set})
         
         # Si pas assez de mots après filtrage de fréquence, combiner avec les tags techniques
         if len(filtered_words) < 3:
@@ -138,15 +170,10 @@ class TagExtractor:
             combined_tags = technical_tags + most_common
             return combined_tags[:self.max_tags]
         
-        # Calcul du score pour chaque mot (fréquence normalisée)
-        word_scores = {}
-        for word, count in filtered_words.items():
-            term_frequency = count / total_words
-            word_scores[word] = term_frequency
-        
-        # Tri des mots par score décroissant
-        sorted_words = sorted(word_scores.items(), key=lambda x: x[1], reverse=True)
-        common_tags = [word for word, score in sorted_words[:(self.max_tags - len(technical_tags))]]
+        # Le score d'un mot (fréquence normalisée count / nombre total de tokens) partage le
+        # même dénominateur pour tous les mots : le classement se fait directement sur les
+        # comptes, most_common sélectionnant les meilleurs avec un tas
+        common_tags = [word for word, _ in filtered_words.most_common(self.max_tags - len(technical_tags))]
         
         # Combinaison des tags techniques (prioritaires) et des tags courants
         combined_tags = technical_tags + common_tags
@@ -160,51 +187,41 @@ class TagExtractor:
             
         return final_tags[:self.max_tags]
         
-    def _preprocess_text(self, text: str) -> str:
+    def _find_technical_subjects(self, text: str) -> List[str]:
         """
-        Prétraite le texte avant l'extraction (nettoyage, normalisation)
+        Recherche les sujets techniques présents dans le texte
         
         Args:
-            text: Le texte brut
+            text: Le texte en minuscules
             
         Returns:
-            Texte prétraité
+            Liste des sujets trouvés, sans doublon, dans l'ordre de self.technical_subjects
         """
-        # Conversion en minuscules
-        text = text.lower()
-        
-        # Suppression des URLs
-        text = re.sub(r'https?://\S+', '', text)
-        
-        # Suppression des caractères spéciaux et ponctuation
-        text = re.sub(r'[^\w\s\'-àáâäæçèéêëìíîïòóôöùúûüÿœÀÁÂÄÆÇÈÉÊËÌÍÎÏÒÓÔÖÙÚÛÜŸŒ]', ' ', text)
+        if AHOCORASICK_AVAILABLE and self.technical_subjects is TECHNICAL_SUBJECTS:
+            # Un seul parcours du texte pour tous les sujets
+            ranks = {rank for _, rank in _SUBJECT_AUTOMATON.iter(text)}
+            return [TECHNICAL_SUBJECTS[rank] for rank in sorted(ranks)]
         
-        # Normalisation des espaces
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        return text
+        technical_tags = []
+        for subject in self.technical_subjects:
+            if subject in text and subject not in technical_tags:
+                technical_tags.append(subject)
+        return technical_tags
         
     def _tokenize_text(self, text: str) -> List[str]:
         """
         Découpe le texte en tokens et filtre les mots vides
         
         Args:
-            text: Le texte prétraité
+            text: Le texte en minuscules
             
         Returns:
             Liste de tokens significatifs
         """
-        # Découpage en mots
-        words = text.split()
-        
-        # Filtrage des mots trop courts et des stopwords
-        filtered_words = [
-            word for word in words 
-            if len(word) >= self.min_word_length 
-            and word not in self.stopwords
-        ]
-        
-        return filtered_words
+        # Découpage en mots d'au moins min_word_length lettres en un seul passage de
+        # l'expression régulière, puis filtrage des stopwords
+        stopwords = self.stopwords
+        return [word for word in self.word_pattern.findall(text) if word not in stopwords]
 
 class TagMatrix:
     """
@@ -216,8 +233,8 @@ class TagMatrix:
         """
         Initialise la matrice de tags
         """
-        # Matrice de co-occurrence (dictionnaire imbriqué)
-        self.co_occurrence = defaultdict(lambda: defaultdict(int))
+        # Matrice de co-occurrence : une seule clé par paire de tags, (tag1, tag2) avec tag1 < tag2
+        self.co_occurrence = Counter()
         # Comptage d'occurrences individuelles
         self.tag_counts = Counter()
         # Nombre total d'entrées traitées
@@ -239,10 +256,14 @@ class TagMatrix:
         """
         if not tags:
             return
+        
+        # Cas le plus courant (ni date ni poids) : chemin spécialisé
+        if not date and weight == 1:
+            self._add_tags(tags)
+            return
             
         # Normaliser les tags (minuscules, suppression des doublons)
-        tags = [tag.lower().strip() for tag in tags]
-        tags = list(set(tags))  # Supprimer les doublons
+        tags = self._normalize_tags(tags)
         
         # Mise à jour du compteur d'entrées
         self.entry_count += 1
@@ -259,15 +280,45 @@ class TagMatrix:
                 # Ignorer les dates invalides
                 pass
                 
-        # Mise à jour des compteurs individuels
-        for tag in tags:
-            self.tag_counts[tag] += weight
+        # Mise à jour des compteurs individuels et de la matrice de co-occurrence (paires
+        # générées sans copier de sous-listes, une seule écriture par paire).
+        # Avec le poids par défaut, Counter.update compte directement en C.
+        if weight == 1:
+            self.tag_counts.update(tags)
+            self.co_occurrence.update(combinations(tags, 2))
+        else:
+            for tag in tags:
+                self.tag_counts[tag] += weight
+            for pair in combinations(tags, 2):
+                self.co_occurrence[pair] += weight
+    
+    @staticmethod
+    def _normalize_tags(tags: List[str]) -> List[str]:
+        """
+        Normalise les tags d'une entrée en un seul passage
+        
+        Args:
+            tags: Liste de tags bruts
             
-        # Mise à jour de la matrice de co-occurrence
-        for i, tag1 in enumerate(tags):
-            for tag2 in tags[i+1:]:
-                self.co_occurrence[tag1][tag2] += weight
-                self.co_occurrence[tag2][tag1] += weight
+        Returns:
+            Tags en minuscules, sans espaces superflus, sans doublons ni tags vides,
+            triés (les paires générées sont ainsi déjà ordonnées)
+        """
+        # Tags internés : toutes les clés de tag_counts et de co_occurrence qui désignent
+        # le même tag partagent une seule chaîne, quelle que soit l'entrée d'origine
+        return sorted({sys.intern(normalized) for normalized in (tag.lower().strip() for tag in tags) if normalized})
+    
+    def _add_tags(self, tags: List[str]):
+        """
+        Ajoute les tags d'une entrée sans date et de poids 1 (chemin rapide de add_entry)
+        
+        Args:
+            tags: Liste non vide de tags de l'entrée
+        """
+        tags = self._normalize_tags(tags)
+        self.entry_count += 1
+        self.tag_counts.update(tags)
+        self.co_occurrence.update(combinations(tags, 2))
     
     def get_top_tags(self, limit: int = 20) -> List[Tuple[str, int]]:
         """
@@ -291,13 +342,9 @@ class TagMatrix:
         Returns:
             Liste de tuples ((tag1, tag2), fréquence) triés par fréquence décroissante
         """
-        co_occurrences = []
-        for tag1, related in self.co_occurrence.items():
-            for tag2, count in related.items():
-                if tag1 < tag2:  # Évite les doublons (a,b) et (b,a)
-                    co_occurrences.append(((tag1, tag2), count))
-        
-        return sorted(co_occurrences, key=lambda x: x[1], reverse=True)[:limit]
+        # Chaque paire n'est stockée qu'une fois : pas de doublons (a,b) et (b,a) à écarter.
+        # most_common(limit) sélectionne les paires avec un tas, sans trier toute la matrice.
+        return self.co_occurrence.most_common(limit)
     
     def get_related_tags(self, tag: str, limit: int = 10) -> List[Tuple[str, int]]:
         """
@@ -311,11 +358,17 @@ class TagMatrix:
             Liste de tuples (tag, fréquence de co-occurrence) 
         """
         tag = tag.lower().strip()
-        if tag not in self.co_occurrence:
+        if tag not in self.tag_counts:
             return []
-            
-        related = self.co_occurrence[tag]
-        return sorted(related.items(), key=lambda x: x[1], reverse=True)[:limit]
+        
+        # Rechercher la paire (dans l'ordre de stockage) avec chacun des autres tags
+        related = []
+        for other in self.tag_counts:
+            count = self.co_occurrence.get((tag, other) if tag < other else (other, tag))
+            if count is not None:
+                related.append((other, count))
+        # Sélection des plus fréquents avec un tas plutôt qu'un tri complet
+        return heapq.nlargest(limit, related, key=itemgetter(1))
     
     def extract_themes(self, min_tags: int = 3, max_themes: int = 5) -> List[Dict[str, Any]]:
         """
@@ -335,13 +388,16 @@ class TagMatrix:
         themes = []
         remaining_tags = set(self.tag_counts.keys())
         
+        # Tags triés une seule fois par fréquence décroissante : un tag écarté ne redevient
+        # jamais disponible, le parcours reprend donc là où il s'était arrêté
+        candidate_seeds = (tag for tag, _ in self.tag_counts.most_common())
+        
         while len(themes) < max_themes and remaining_tags:
             # Prendre le tag le plus fréquent comme point de départ
-            seed_tags = [tag for tag in self.tag_counts.most_common() if tag[0] in remaining_tags]
-            if not seed_tags:
+            seed_tag = next((tag for tag in candidate_seeds if tag in remaining_tags), None)
+            if seed_tag is None:
                 break
                 
-            seed_tag = seed_tags[0][0]
             theme_tags = {seed_tag}
             
             # Trouver les tags fortement associés
@@ -406,8 +462,14 @@ class TagMatrix:
         Returns:
             Dictionnaire représentant la matrice
         """
+        # Sérialisation sous forme de dictionnaire imbriqué symétrique (format inchangé)
+        co_occurrence = defaultdict(dict)
+        for (tag1, tag2), count in self.co_occurrence.items():
+            co_occurrence[tag1][tag2] = count
+            co_occurrence[tag2][tag1] = count
+        
         return {
-            "co_occurrence": dict(self.co_occurrence),
+            "co_occurrence": dict(co_occurrence),
             "tag_counts": dict(self.tag_counts),
             "entry_count": self.entry_count,
             "first_date": self.first_date.isoformat() if self.first_date else None,
@@ -441,10 +503,19 @@ class TagMatrix:
         co_occurrence = data.get("co_occurrence", {})
         for tag1, related in co_occurrence.items():
             for tag2, count in related.items():
-                matrix.co_occurrence[tag1][tag2] = count
+                matrix.co_occurrence[(tag1, tag2) if tag1 < tag2 else (tag2, tag1)] = count
         
         return matrix
 
+@lru_cache(maxsize=None)
+def _get_tag_extractor(max_tags: int) -> TagExtractor:
+    """
+    Retourne l'extracteur utilisé par extract_automatic_tags pour ce nombre de tags.
+    TagExtractor ne conserve aucun état entre deux extractions : une instance est
+    créée une seule fois par valeur de max_tags puis réutilisée.
+    """
+    return TagExtractor(max_tags=max_tags, min_frequency=1)
+
 def extract_automatic_tags(text: str, max_tags: int = 7, threshold: float = 0.01) -> List[str]:
     """
     Extrait automatiquement des tags à partir du texte en utilisant TagExtractor.
@@ -457,18 +528,11 @@ def extract_automatic_tags(text: str, max_tags: int = 7, threshold: float = 0.01
     Returns:
         Liste de tags potentiels
     """
-    # Liste de mots à ne jamais inclure comme tags car ils sont liés à l'import et pas au contenu
-    blacklisted_tags = [
-        "import", "erreur", "importerreur", "error", "date_from_filename",
-        "fichier", "document", "extraction", "texte", "contenu", "analyse"
-    ]
-    
-    # Utiliser l'extracteur de tags
-    extractor = TagExtractor(max_tags=max_tags, min_frequency=1)
-    tags = extractor.extract_tags(text)
+    # Utiliser l'extracteur de tags (partagé entre les appels)
+    tags = _get_tag_extractor(max_tags).extract_tags(text)
     
     # Filtrer les tags blacklistés
-    filtered_tags = [tag for tag in tags if tag.lower() not in blacklisted_tags]
+    filtered_tags = [tag for tag in tags if tag.lower() not in BLACKLISTED_TAGS]
     
     # Si aucun tag valide n'est trouvé, utiliser un tag par défaut
     if not filtered_tags:
@@ -493,6 +557,10 @@ def analyze_tag_relationships(entries: List[Dict[str, Any]]) -> TagMatrix:
         date = entry.get("date")
         
         if tags:
-            matrix.add_entry(tags, date=date)
+            if date:
+                matrix.add_entry(tags, date=date)
+            else:
+                # Entrée sans date : pas de mise à jour de la période couverte
+                matrix._add_tags(tags)
     
     return matrix
\ No newline at end of file
@@ -2,46 +2,55 @@ import re
 from typing import List
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 
+# Expressions régulières précompilées
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+_TECHNICAL_CHARS_RE = re.compile(r'[<>$%#@{}()\[\]+=]')
+_WORD_RE = re.compile(r'\b[a-zA-ZÀ-ÿ]{4,}\b')
+
+# Différentes stratégies de chunking selon le type de contenu (construites une seule fois
+# et partagées par toutes les instances : split_text ne modifie pas le splitter)
+_SPLITTERS = {
+    "default": RecursiveCharacterTextSplitter(
+        chunk_size=500,
+        chunk_overlap=50,
+        length_function=len,
+        separators=["\n\n", "\n", ". ", ", ", " ", ""]
+    ),
+    "long_form": RecursiveCharacterTextSplitter(
+        chunk_size=800,
+        chunk_overlap=150,
+        length_function=len,
+        separators=["\n\n", "\n", ". ", ", ", " ", ""]
+    ),
+    "list": RecursiveCharacterTextSplitter(
+        chunk_size=300,
+        chunk_overlap=50,
+        length_function=len,
+        separators=["\n\n", "\n", ". ", ", ", " ", ""]
+    ),
+    "technical": RecursiveCharacterTextSplitter(
+        chunk_size=400,
+        chunk_overlap=100,
+        length_function=len,
+        separators=["\n\n", "\n", "; ", ". ", ", ", " ", ""]
+    )
+}
+
+# Patterns pour détecter différents types de contenu (compilés une seule fois)
+_CONTENT_PATTERNS = {
+    "list": re.compile(r'(?:^|\n)(?:\d+\.\s|\*\s|-\s|\[\s?\]|\[\w\])'),
+    "technical": re.compile(r'(?:import|def|class|function|var|const|if|for|while|try|except|\{|\}|console\.log)'),
+    "long_form": re.compile(r'(?:(?:\w+\s){20,})')
+}
+
 class AdaptiveTextSplitter:
     """
     Splitter de texte adaptatif qui prend en compte la structure
     et le contenu sémantique du texte pour un découpage intelligent.
     """
     def __init__(self):
-        # Différentes stratégies de chunking selon le type de contenu
-        self.splitters = {
-            "default": RecursiveCharacterTextSplitter(
-                chunk_size=500,
-                chunk_overlap=50,
-                length_function=len,
-                separators=["\n\n", "\n", ". ", ", ", " ", ""]
-            ),
-            "long_form": RecursiveCharacterTextSplitter(
-                chunk_size=800,
-                chunk_overlap=150,
-                length_function=len,
-                separators=["\n\n", "\n", ". ", ", ", " ", ""]
-            ),
-            "list": RecursiveCharacterTextSplitter(
-                chunk_size=300,
-                chunk_overlap=50,
-                length_function=len,
-                separators=["\n\n", "\n", ". ", ", ", " ", ""]
-            ),
-            "technical": RecursiveCharacterTextSplitter(
-                chunk_size=400,
-                chunk_overlap=100,
-                length_function=len,
-                separators=["\n\n", "\n", "; ", ". ", ", ", " ", ""]
-            )
-        }
-        
-        # Patterns pour détecter différents types de contenu
-        self.content_patterns = {
-            "list": r'(?:^|\n)(?:\d+\.\s|\*\s|-\s|\[\s?\]|\[\w\])',
-            "technical": r'(?:import|def|class|function|var|const|if|for|while|try|except|\{|\}|console\.log)',
-            "long_form": r'(?:(?:\w+\s){20,})'
-        }
+        self.splitters = _SPLITTERS
+        self.content_patterns = _CONTENT_PATTERNS
     
     def split_text(self, text: str) -> List[str]:
         """Divise le texte en chunks en fonction du type de contenu détecté"""
@@ -67,23 +76,39 @@ class AdaptiveTextSplitter:
         }
         
         for content_type, pattern in self.content_patterns.items():
-            matches = re.findall(pattern, text)
+            matches = pattern.findall(text)
             scores[content_type] = len(matches)
         
         line_ratio = text.count('\n') / max(1, len(text))
         if line_ratio > 0.05:
             scores["list"] += 3
         
-        sentences = re.split(r'[.!?]+', text)
-        avg_sentence_length = sum(len(s) for s in sentences) / max(1, len(sentences))
+        if _TECHNICAL_CHARS_RE.search(text):
+            scores["technical"] += 3
+        
+        # La longueur moyenne des phrases n'apporte qu'un bonus (+5 long_form ou +2 list) :
+        # la découpe en phrases n'est faite que si ce bonus peut changer le type retenu
+        content_type = max(scores.items(), key=lambda x: x[1])[0]
+        for bonus_type, bonus in (("long_form", 5), ("list", 2)):
+            boosted_scores = dict(scores)
+            boosted_scores[bonus_type] += bonus
+            if max(boosted_scores.items(), key=lambda x: x[1])[0] != content_type:
+                break
+        else:
+            return content_type
+        
+        # Moyenne calculée à partir des seuls délimiteurs, sans créer la liste des phrases :
+        # n suites de délimiteurs découpent le texte en n + 1 phrases. Les caractères
+        # délimiteurs sont comptés par str.count ; l'expression régulière ne sert qu'à
+        # compter les suites (« ... » sépare une seule fois) et n'est lancée que s'il y en a.
+        delimiter_chars = text.count('.') + text.count('!') + text.count('?')
+        delimiter_runs = len(_SENTENCE_SPLIT_RE.findall(text)) if delimiter_chars else 0
+        avg_sentence_length = (len(text) - delimiter_chars) / (delimiter_runs + 1)
         if avg_sentence_length > 150:
             scores["long_form"] += 5
         elif avg_sentence_length < 60:
             scores["list"] += 2
         
-        if re.search(r'[<>$%#@{}()\[\]+=]', text):
-            scores["technical"] += 3
-        
         return max(scores.items(), key=lambda x: x[1])[0]
 
 def extract_automatic_tags(text: str, threshold: float = 0.01) -> List[str]:
@@ -97,11 +122,10 @@ def extract_automatic_tags(text: str, threshold: float = 0.01) -> List[str]:
     Returns:
         Liste de tags potentiels
     """
-    import re
     from collections import Counter
     
     # Extraction des mots (sans ponctuation, chiffres, etc.)
-    words = re.findall(r'\b[a-zA-ZÀ-ÿ]{4,}\b', text.lower())
+    words = _WORD_RE.findall(text.lower())
     
     # Filtrer les mots vides (stopwords)
     stopwords = set(['dans', 'avec', 'pour', 'cette', 'mais', 'avoir', 'faire', 